@@ -1,5 +1,4 @@
 from fastapi import APIRouter, BackgroundTasks, status, HTTPException
-from fastapi.concurrency import run_in_threadpool
 from app.schemas.generation import AiArticleBatchGenerationRequest, GenerationStatusResponse, TodayNewsnackRequest
 from app.services.workflow_service import workflow_service
 
@@ -9,18 +8,15 @@ router = APIRouter(tags=["Content Generation"])
 @router.post(
     "/ai-articles",
     summary="AI 기사 일괄 생성",
-    description="여러 이슈 ID에 해당하는 콘텐츠를 배치로 생성합니다.",
+    description="여러 이슈 ID에 해당하는 콘텐츠 생성 작업을 큐에 등록합니다. 실제 생성은 워커 프로세스가 수행합니다.",
     response_model=GenerationStatusResponse,
     status_code=status.HTTP_202_ACCEPTED,
     responses={
         409: {"description": "처리 가능한 이슈가 없는 경우"}
     }
 )
-async def create_batch_ai_articles(
-    request: AiArticleBatchGenerationRequest,
-    background_tasks: BackgroundTasks,
-):
-    occupied_ids = await run_in_threadpool(workflow_service.occupy_issues, request.issue_ids)
+async def create_batch_ai_articles(request: AiArticleBatchGenerationRequest):
+    occupied_ids = await workflow_service.occupy_issues(request.issue_ids)
 
     if not occupied_ids:
         raise HTTPException(
@@ -28,11 +24,12 @@ async def create_batch_ai_articles(
             detail="처리 가능한 이슈가 없습니다."
         )
 
-    background_tasks.add_task(workflow_service.run_batch_ai_articles_pipeline, occupied_ids)
+    job_id = await workflow_service.enqueue_ai_article_jobs(occupied_ids)
 
     return GenerationStatusResponse(
         status="accepted",
-        message=f"총 {len(request.issue_ids)}개 요청 중 {len(occupied_ids)}개의 콘텐츠 생성이 시작되었습니다.",
+        message=f"총 {len(request.issue_ids)}개 요청 중 {len(occupied_ids)}개의 콘텐츠 생성이 작업 큐에 등록되었습니다.",
+        job_id=job_id,
     )
 
 
@@ -45,9 +42,11 @@ async def create_today_newsnack(
     request: TodayNewsnackRequest,
     background_tasks: BackgroundTasks
 ):
-    background_tasks.add_task(workflow_service.run_today_newsnack_pipeline, request.issue_ids)
+    job_id = await workflow_service.create_today_newsnack_job()
+    background_tasks.add_task(workflow_service.run_today_newsnack_pipeline, request.issue_ids, job_id)
     
     return GenerationStatusResponse(
         status="accepted",
-        message="오늘의 뉴스낵 생성 작업이 백그라운드에서 시작되었습니다."
+        message="오늘의 뉴스낵 생성 작업이 백그라운드에서 시작되었습니다.",
+        job_id=job_id,
     )
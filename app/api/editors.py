@@ -0,0 +1,14 @@
+from fastapi import APIRouter, status
+from app.engine.editor_registry import publish_editor_invalidation
+
+router = APIRouter(tags=["Editors"])
+
+
+@router.post(
+    "/editors/invalidate",
+    summary="에디터 레지스트리 무효화",
+    description="에디터나 카테고리를 수정한 뒤 호출하면, 모든 서버/워커 프로세스가 다음 에디터 배정 시 DB에서 에디터 정보를 다시 읽습니다.",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def invalidate_editor_registry():
+    await publish_editor_invalidation()
@@ -1,5 +1,4 @@
 from fastapi import APIRouter, HTTPException, status
-from fastapi.concurrency import run_in_threadpool
 
 from app.core.database import check_db_connection
 from app.core.redis import check_redis_connection
@@ -16,7 +15,7 @@ async def liveness_check():
 async def readiness_check():
     """앱이 트래픽을 처리할 준비가 되었는지 외부 의존성(DB, Redis)을 확인합니다 (Readiness)."""
     try:
-        await run_in_threadpool(check_db_connection)
+        await check_db_connection()
         await check_redis_connection()
 
     except Exception as e:
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, HTTPException
+from app.core.job_tracker import job_tracker
+from app.schemas.job import JobStatusResponse
+
+router = APIRouter(tags=["Jobs"])
+
+
+@router.get(
+    "/jobs/{job_id}",
+    summary="생성 작업 상태 조회",
+    description="작업 ID에 해당하는 생성 작업의 상태와 항목(이슈)별 LangGraph 노드 진행 상황을 조회합니다.",
+    response_model=JobStatusResponse,
+    responses={
+        404: {"description": "작업이 없거나 보관 기간이 만료된 경우"}
+    }
+)
+async def get_job_status(job_id: str):
+    job = await job_tracker.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+    return job
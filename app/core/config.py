@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -23,10 +23,55 @@ class Settings(BaseSettings):
     GOOGLE_IMAGE_MODEL_FALLBACK_SIZE: str = "1K"
     OPENAI_IMAGE_SIZE: str = "1024x1024"
     OPENAI_IMAGE_QUALITY: str = "low"
+    IMAGE_UPLOAD_MAX_CONCURRENCY: int = 4
+
+    # Image Variants (원본 PNG 옆에 함께 업로드하는 웹 전송용 파생 이미지)
+    IMAGE_VARIANTS_ENABLED: bool = True
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_AVIF_ENABLED: bool = False
+    IMAGE_AVIF_QUALITY: int = 60
+    IMAGE_PALETTE_CONTENT_TYPES: List[str] = ["CARD_NEWS"]
+    IMAGE_PALETTE_COLORS: int = 256
+    IMAGE_THUMBNAIL_WIDTHS: List[int] = [320, 640]
+
+    # Media Executor (이미지 인코딩/디코딩 등 CPU 작업)
+    MEDIA_EXECUTOR_KIND: Literal["thread", "process"] = "thread"
+    MEDIA_EXECUTOR_MAX_WORKERS: int = 4
+
+    # Reference Image Cache (validate_image ↔ generate_images, 이슈 간 공유)
+    REFERENCE_IMAGE_CACHE_TTL_SECONDS: int = 60 * 60 * 6
+    REFERENCE_IMAGE_CACHE_MAX_URLS: int = 1024
+    REFERENCE_IMAGE_CACHE_MAX_MEMORY_BYTES: int = 64 * 1024 * 1024
+    REFERENCE_IMAGE_CACHE_MAX_DISK_BYTES: int = 512 * 1024 * 1024
 
     # TTS Options
     GOOGLE_TTS_VOICE: str = "Achird"
     OPENAI_TTS_VOICE: str = "marin"
+    FFMPEG_BINARY: str = "ffmpeg"
+    AUDIO_MP3_BITRATE: str = "128k"
+    BRIEFING_TTS_MAX_CONCURRENCY: int = 4
+    BRIEFING_SEGMENT_GAP_SECONDS: float = 0.6
+
+    # Briefing Precompute (AI 기사 저장 시점에 브리핑 세그먼트 대본/음성을 미리 생성)
+    BRIEFING_PRECOMPUTE_ENABLED: bool = False
+    BRIEFING_PROMPT_VERSION: str = "v1"
+    BRIEFING_PRECOMPUTE_QUEUE_NAME: str = "briefing_precompute"
+    BRIEFING_PRECOMPUTE_MAX_CONCURRENCY: int = 2
+    BRIEFING_SEGMENT_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 3
+    BRIEFING_SEGMENT_SWEEP_INTERVAL_SECONDS: int = 60 * 60 * 6
+
+    # LLM Response Cache (분석/본문/브리핑 대본 단계의 구조화 출력 캐시, 선택)
+    LLM_CACHE_ENABLED: bool = False
+    LLM_CACHE_PROMPT_VERSION: str = "v1"
+    LLM_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 3
+    LLM_CACHE_MAX_ENTRIES: int = 5000
+
+    # Article Context Builder (이슈 원본 기사 병합 시 중복 제거 및 토큰 예산)
+    CONTEXT_MAX_TOKENS: int = 12000
+    CONTEXT_MIN_ARTICLE_TOKENS: int = 300
+    CONTEXT_DEDUP_SIMILARITY_THRESHOLD: float = 0.6
+    CONTEXT_TOKEN_ENCODING: str = "o200k_base"
+    CONTEXT_CHARS_PER_TOKEN: int = 2
 
     # API Keys
     API_KEY: str
@@ -38,17 +83,71 @@ class Settings(BaseSettings):
     
     # Infra
     DB_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
     REDIS_URL: str = "redis://localhost:6379/0"
     AWS_REGION: str = "ap-northeast-2"
     AWS_S3_BUCKET: str
     AWS_ACCESS_KEY_ID: str
     AWS_SECRET_ACCESS_KEY: str
+    S3_MAX_POOL_CONNECTIONS: int = 32
+    S3_MULTIPART_THRESHOLD_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_CHUNK_SIZE_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_MAX_CONCURRENCY: int = 4
+
+    # Outbound HTTP (검색 도구, 참고 이미지 다운로드)
+    HTTP_MAX_CONNECTIONS_PER_SERVICE: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS_PER_SERVICE: int = 10
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_TOOL_TIMEOUT_SECONDS: float = 10.0
+    HTTP_DOWNLOAD_TIMEOUT_SECONDS: float = 15.0
+
+    # Image Research Tool Cache
+    TOOL_CACHE_ENABLED: bool = True
+    TOOL_CACHE_COMPANY_LOGO_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    TOOL_CACHE_PERSON_THUMBNAIL_TTL_SECONDS: int = 60 * 60 * 24
+    TOOL_CACHE_FALLBACK_IMAGE_TTL_SECONDS: int = 60 * 60 * 6
+    TOOL_CACHE_NEGATIVE_TTL_SECONDS: int = 60 * 60
+    TOOL_CACHE_LOCAL_MAX_ENTRIES: int = 512
+    IMAGE_VERDICT_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    IMAGE_VERDICT_REJECTED_TTL_SECONDS: int = 60 * 60 * 6
 
     # Other Settings
     AI_ARTICLE_MAX_CONCURRENT_GENERATIONS: int = 2
     AI_ARTICLE_GENERATION_DELAY_SECONDS: int = 5
     TODAY_NEWSNACK_ISSUE_TIME_WINDOW_HOURS: int = 14
 
+    # Worker / Job Queue
+    AI_ARTICLE_QUEUE_NAME: str = "ai_article"
+    WORKER_POLL_TIMEOUT_SECONDS: int = 2
+    WORKER_HEARTBEAT_TTL_SECONDS: int = 30
+    WORKER_SHUTDOWN_TIMEOUT_SECONDS: int = 600  # cd.yml의 docker stop --time은 이 값보다 길어야 함
+    JOB_STATUS_TTL_SECONDS: int = 60 * 60 * 24 * 3
+
+    # Admission Control (프로바이더/모델 단위 전역 제한, 0이면 제한 없음)
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_RPM: int = 0
+    LLM_TPM: int = 0
+    IMAGE_MAX_CONCURRENCY: int = 4
+    IMAGE_RPM: int = 0
+    TTS_MAX_CONCURRENCY: int = 2
+    TTS_RPM: int = 0
+    ADMISSION_QUOTA_HEADROOM_RATIO: float = 0.9
+    ADMISSION_LEASE_TTL_SECONDS: int = 600
+    ADMISSION_MAX_WAIT_SECONDS: int = 300
+
+    # Editor Registry
+    EDITOR_REGISTRY_TTL_SECONDS: int = 60 * 10
+    EDITOR_REGISTRY_CHANNEL: str = "editor_registry:invalidate"
+
+    # LangGraph Checkpointer (AI 기사 파이프라인 재개용)
+    CHECKPOINTER_BACKEND: Literal["postgres", "sqlite", "memory", "none"] = "postgres"
+    CHECKPOINTER_SQLITE_PATH: str = "checkpoints.sqlite"
+    CHECKPOINTER_POOL_SIZE: int = 5
+
     @model_validator(mode='after')
     def check_api_keys(self) -> 'Settings':
         if self.AI_PROVIDER == "google" and not self.GOOGLE_API_KEY:
@@ -1,25 +1,64 @@
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, declarative_base
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from sqlalchemy import text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-engine = create_engine(settings.DB_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _to_async_url(db_url: str) -> URL:
+    """
+    DB_URL(postgresql://, postgresql+psycopg2:// 등)을 asyncpg 드라이버 URL로 변환합니다.
+    asyncpg는 sslmode 대신 ssl 파라미터를 사용하므로 함께 변환합니다.
+    """
+    url = make_url(db_url).set(drivername="postgresql+asyncpg")
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+        url = url.set(query=query)
+    return url
+
+
+engine = create_async_engine(
+    _to_async_url(settings.DB_URL),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 Base = declarative_base()
 
-def check_db_connection():
+@asynccontextmanager
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """
+    DB 작업 구간에만 커넥션을 점유하는 짧은 세션 스코프를 제공합니다.
+    노드와 서비스는 세션을 상태에 들고 다니지 않고, 필요한 시점에 이 스코프로 세션을 얻습니다.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+async def check_db_connection():
     """DB 커넥션 풀의 연결 상태를 확인합니다."""
     try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         raise e
 
-def close_db_connection():
+async def close_db_connection():
     """서버 종료 시 DB 커넥션 풀을 반환합니다."""
-    engine.dispose()
+    await engine.dispose()
     logger.info("Database connection pool closed.")
@@ -0,0 +1,69 @@
+import logging
+from typing import Dict, Literal
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+HttpService = Literal["logo_dev", "wikipedia", "kakao", "image_download"]
+
+# 서비스별 읽기 타임아웃(초). 검색 도구는 에이전트 응답성을 위해 짧게, 이미지 다운로드는 여유 있게 설정
+_READ_TIMEOUTS: Dict[str, float] = {
+    "logo_dev": settings.HTTP_TOOL_TIMEOUT_SECONDS,
+    "wikipedia": settings.HTTP_TOOL_TIMEOUT_SECONDS,
+    "kakao": settings.HTTP_TOOL_TIMEOUT_SECONDS,
+    "image_download": settings.HTTP_DOWNLOAD_TIMEOUT_SECONDS,
+}
+
+
+class HttpClientRegistry:
+    """
+    외부 서비스별 httpx.AsyncClient를 앱 수명 동안 유지하는 레지스트리
+
+    검색 도구 호출과 참고 이미지 다운로드가 매번 DNS/TCP/TLS 연결을 새로 맺지 않도록
+    서비스(호스트)별로 커넥션 풀을 분리해 재사용합니다. HTTP/2는 ALPN 협상으로 서버가 지원하는
+    경우에만 사용되고, 지원하지 않으면 HTTP/1.1로 동작합니다.
+    lifespan/워커 시작 시 start(), 종료 시 close()를 호출하며, start() 없이도 첫 사용 시점에 생성됩니다.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _create_client(self, service: HttpService) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS_PER_SERVICE,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS_PER_SERVICE,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(_READ_TIMEOUTS[service], connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS),
+        )
+
+    def get(self, service: HttpService) -> httpx.AsyncClient:
+        """서비스 전용 클라이언트를 반환합니다."""
+        client = self._clients.get(service)
+        if client is None or client.is_closed:
+            client = self._create_client(service)
+            self._clients[service] = client
+        return client
+
+    async def start(self):
+        """모든 서비스 클라이언트를 미리 생성합니다."""
+        for service in _READ_TIMEOUTS:
+            self.get(service)
+        logger.info("HTTP client pools initialized.")
+
+    async def close(self):
+        """모든 클라이언트의 커넥션 풀을 반환합니다."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+        if clients:
+            logger.info("HTTP client pools closed.")
+
+
+# 전역 인스턴스 생성
+http_clients = HttpClientRegistry()
@@ -0,0 +1,97 @@
+import json
+import logging
+import socket
+import uuid
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobQueue:
+    """
+    Redis List 기반의 내구성 있는 작업 큐
+
+    작업을 꺼낼 때 LMOVE로 워커 전용 processing 리스트에 옮겨두고, 처리가 끝나면 ack로 제거합니다.
+    워커가 비정상 종료되어 heartbeat 키가 만료되면, 다른 워커가 해당 processing 리스트의 작업을
+    대기열로 되돌려 재처리합니다.
+
+    Args:
+        name: 큐 이름 (Redis 키 prefix로 사용)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pending_key = f"queue:{name}:pending"
+        self.processing_prefix = f"queue:{name}:processing:"
+        self.heartbeat_prefix = f"queue:{name}:heartbeat:"
+
+    def _processing_key(self, worker_id: str) -> str:
+        return f"{self.processing_prefix}{worker_id}"
+
+    def _heartbeat_key(self, worker_id: str) -> str:
+        return f"{self.heartbeat_prefix}{worker_id}"
+
+    async def enqueue(self, payloads: List[dict]) -> int:
+        """작업 페이로드들을 대기열 끝에 추가하고, 추가 후 대기열 길이를 반환합니다."""
+        if not payloads:
+            return 0
+        redis_client = await RedisClient.get_instance()
+        messages = [json.dumps(p, ensure_ascii=False) for p in payloads]
+        return await redis_client.rpush(self.pending_key, *messages)
+
+    async def dequeue(self, worker_id: str, timeout: float) -> Optional[str]:
+        """
+        대기열에서 작업 하나를 꺼내 워커의 processing 리스트로 원자적으로 옮깁니다.
+        반환값은 ack 시 그대로 사용해야 하는 원본 메시지 문자열입니다.
+        """
+        redis_client = await RedisClient.get_instance()
+        return await redis_client.blmove(
+            self.pending_key,
+            self._processing_key(worker_id),
+            timeout,
+            src="LEFT",
+            dest="RIGHT",
+        )
+
+    async def ack(self, worker_id: str, message: str):
+        """처리가 끝난 작업을 워커의 processing 리스트에서 제거합니다."""
+        redis_client = await RedisClient.get_instance()
+        await redis_client.lrem(self._processing_key(worker_id), 1, message)
+
+    async def heartbeat(self, worker_id: str, ttl_secs: int):
+        """워커 생존 신호를 갱신합니다. TTL 내 갱신이 없으면 해당 워커의 작업은 회수 대상이 됩니다."""
+        redis_client = await RedisClient.get_instance()
+        await redis_client.set(self._heartbeat_key(worker_id), "1", ex=ttl_secs)
+
+    async def clear_heartbeat(self, worker_id: str):
+        redis_client = await RedisClient.get_instance()
+        await redis_client.delete(self._heartbeat_key(worker_id))
+
+    async def recover_orphaned(self) -> int:
+        """heartbeat가 만료된 워커의 processing 리스트 작업을 대기열 앞쪽으로 되돌립니다."""
+        redis_client = await RedisClient.get_instance()
+        recovered = 0
+
+        async for processing_key in redis_client.scan_iter(match=f"{self.processing_prefix}*"):
+            worker_id = processing_key[len(self.processing_prefix):]
+            if await redis_client.exists(self._heartbeat_key(worker_id)):
+                continue
+
+            while await redis_client.lmove(processing_key, self.pending_key, src="RIGHT", dest="LEFT"):
+                recovered += 1
+
+        if recovered:
+            logger.warning(f"[JobQueue:{self.name}] Recovered {recovered} orphaned job(s) from dead workers.")
+        return recovered
+
+
+def generate_worker_id() -> str:
+    """호스트명과 랜덤 접미사로 워커 식별자를 생성합니다."""
+    return f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+
+
+ai_article_queue = RedisJobQueue(settings.AI_ARTICLE_QUEUE_NAME)
+briefing_precompute_queue = RedisJobQueue(settings.BRIEFING_PRECOMPUTE_QUEUE_NAME)
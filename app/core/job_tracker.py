@@ -0,0 +1,164 @@
+import json
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    PARTIALLY_FAILED = "PARTIALLY_FAILED"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobTracker:
+    """
+    생성 작업(job)과 작업 항목(이슈 등)별 노드 진행 상황을 Redis에 기록하는 트래커
+
+    - job:{job_id}: 작업 메타데이터 (타입, 항목 목록, 생성 시각)
+    - job:{job_id}:item:{item_id}: 항목 상태, 현재 노드, 노드별 시작/종료 시각
+
+    진행 상황 기록은 부가 기능이므로 Redis 오류가 발생해도 예외를 전파하지 않습니다.
+    """
+
+    def _job_key(self, job_id: str) -> str:
+        return f"job:{job_id}"
+
+    def _item_key(self, job_id: str, item_id: str) -> str:
+        return f"job:{job_id}:item:{item_id}"
+
+    async def create_job(self, job_type: str, item_ids: List) -> str:
+        """새 작업을 등록하고 job_id를 반환합니다. 모든 항목은 QUEUED 상태로 시작합니다."""
+        job_id = uuid.uuid4().hex
+        now = _now()
+        ttl = settings.JOB_STATUS_TTL_SECONDS
+        redis_client = await RedisClient.get_instance()
+
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job_id), mapping={
+                "job_type": job_type,
+                "item_ids": json.dumps([str(i) for i in item_ids]),
+                "created_at": now,
+            })
+            pipe.expire(self._job_key(job_id), ttl)
+            for item_id in item_ids:
+                item_key = self._item_key(job_id, str(item_id))
+                pipe.hset(item_key, mapping={"status": JobStatus.QUEUED, "updated_at": now})
+                pipe.expire(item_key, ttl)
+            await pipe.execute()
+
+        return job_id
+
+    async def _update_item(self, job_id: str, item_id: str, mapping: dict):
+        try:
+            redis_client = await RedisClient.get_instance()
+            item_key = self._item_key(job_id, str(item_id))
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(item_key, mapping={**mapping, "updated_at": _now()})
+                pipe.expire(item_key, settings.JOB_STATUS_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[JobTracker] Failed to update job {job_id} item {item_id}: {e}")
+
+    async def mark_item_running(self, job_id: str, item_id):
+        await self._update_item(job_id, item_id, {"status": JobStatus.RUNNING, "started_at": _now(), "error": ""})
+
+    async def mark_item_completed(self, job_id: str, item_id):
+        await self._update_item(job_id, item_id, {
+            "status": JobStatus.COMPLETED, "current_node": "", "finished_at": _now()
+        })
+
+    async def mark_item_failed(self, job_id: str, item_id, error: str):
+        await self._update_item(job_id, item_id, {
+            "status": JobStatus.FAILED, "finished_at": _now(), "error": error[:500]
+        })
+
+    async def _get_node(self, job_id: str, item_id: str, node_name: str) -> dict:
+        redis_client = await RedisClient.get_instance()
+        raw = await redis_client.hget(self._item_key(job_id, item_id), f"node:{node_name}")
+        return json.loads(raw) if raw else {}
+
+    async def mark_node_started(self, job_id: str, item_id, node_name: str):
+        await self._update_item(job_id, item_id, {
+            "current_node": node_name,
+            f"node:{node_name}": json.dumps({"status": JobStatus.RUNNING, "started_at": _now(), "finished_at": None}),
+        })
+
+    async def mark_node_finished(self, job_id: str, item_id, node_name: str, failed: bool = False):
+        try:
+            node = await self._get_node(job_id, str(item_id), node_name)
+        except Exception as e:
+            logger.warning(f"[JobTracker] Failed to read node {node_name} of job {job_id}: {e}")
+            node = {}
+        node.update({
+            "status": JobStatus.FAILED if failed else JobStatus.COMPLETED,
+            "finished_at": _now(),
+        })
+        await self._update_item(job_id, item_id, {f"node:{node_name}": json.dumps(node)})
+
+    async def get_job(self, job_id: str) -> Optional[dict]:
+        """작업 상태와 항목별 노드 진행 상황을 조회합니다. 작업이 없거나 만료되었으면 None을 반환합니다."""
+        redis_client = await RedisClient.get_instance()
+        job = await redis_client.hgetall(self._job_key(job_id))
+        if not job:
+            return None
+
+        item_ids = json.loads(job["item_ids"])
+        # 항목별 조회를 파이프라인 한 번으로 묶어, 항목 수와 무관하게 왕복 2회로 조회
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for item_id in item_ids:
+                pipe.hgetall(self._item_key(job_id, item_id))
+            raw_items = await pipe.execute()
+
+        items = []
+        for item_id, raw_item in zip(item_ids, raw_items):
+            nodes = [
+                {"name": key[len("node:"):], **json.loads(value)}
+                for key, value in raw_item.items()
+                if key.startswith("node:")
+            ]
+            nodes.sort(key=lambda n: n["started_at"] or "")
+            items.append({
+                "item_id": item_id,
+                "status": raw_item.get("status", JobStatus.QUEUED),
+                "current_node": raw_item.get("current_node") or None,
+                "started_at": raw_item.get("started_at"),
+                "finished_at": raw_item.get("finished_at"),
+                "error": raw_item.get("error") or None,
+                "nodes": nodes,
+            })
+
+        return {
+            "job_id": job_id,
+            "job_type": job["job_type"],
+            "status": self._aggregate_status([item["status"] for item in items]),
+            "created_at": job["created_at"],
+            "items": items,
+        }
+
+    @staticmethod
+    def _aggregate_status(statuses: List[str]) -> str:
+        if any(s in (JobStatus.QUEUED, JobStatus.RUNNING) for s in statuses):
+            if all(s == JobStatus.QUEUED for s in statuses):
+                return JobStatus.QUEUED
+            return JobStatus.RUNNING
+        if all(s == JobStatus.COMPLETED for s in statuses):
+            return JobStatus.COMPLETED
+        if any(s == JobStatus.COMPLETED for s in statuses):
+            return JobStatus.PARTIALLY_FAILED
+        return JobStatus.FAILED
+
+
+# 전역 인스턴스 생성
+job_tracker = JobTracker()
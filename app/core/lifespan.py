@@ -1,17 +1,31 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.concurrency import run_in_threadpool
 
 from app.core.database import check_db_connection, close_db_connection
+from app.core.http import http_clients
+from app.core.media_executor import media_executor
 from app.core.redis import check_redis_connection, close_redis_connection
+from app.engine.editor_registry import editor_registry
+from app.utils.image_cache import reference_image_cache
+from app.utils.s3 import s3_manager
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """서버 시작 시 DB와 Redis를 워밍업하고, 서버 종료 시 자원을 반환합니다."""
-    await run_in_threadpool(check_db_connection)
+    await check_db_connection()
     await check_redis_connection()
+    await s3_manager.start()
+    await http_clients.start()
+    media_executor.start()
+    await editor_registry.start()
+    # LangGraph 체크포인터(커넥션 풀)는 AI 기사 그래프를 실행하는 워커(app/worker.py)에서만 엶
 
     yield
 
+    await editor_registry.stop()
+    await s3_manager.close()
+    reference_image_cache.clear()
+    media_executor.shutdown()
+    await http_clients.close()
     await close_redis_connection()
-    await run_in_threadpool(close_db_connection)
+    await close_db_connection()
@@ -0,0 +1,57 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class MediaExecutor:
+    """
+    이미지 인코딩/디코딩 등 CPU 작업 전용 실행기
+
+    MEDIA_EXECUTOR_KIND에 따라 스레드 풀(기본) 또는 프로세스 풀을 사용하며,
+    크기는 MEDIA_EXECUTOR_MAX_WORKERS로 설정합니다. Pillow는 인코딩/디코딩 중 GIL을 해제하므로
+    대부분 스레드 풀로 충분하고, 순수 파이썬 처리 비중이 큰 경우 프로세스 풀을 선택합니다.
+    프로세스 풀에서는 인자와 반환값이 pickle되므로, 모듈 최상위 함수만 전달해야 합니다.
+    """
+
+    def __init__(self):
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            max_workers = settings.MEDIA_EXECUTOR_MAX_WORKERS
+            if settings.MEDIA_EXECUTOR_KIND == "process":
+                # 이벤트 루프/스레드 상태를 복제하지 않도록 spawn 방식으로 자식 프로세스 생성
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="media")
+            logger.info(f"Media executor started ({settings.MEDIA_EXECUTOR_KIND}, workers={max_workers}).")
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """func(*args)를 실행기에서 실행하고 결과를 기다립니다."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args))
+
+    def start(self):
+        self._get_executor()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("Media executor shut down.")
+
+
+# 전역 인스턴스 생성
+media_executor = MediaExecutor()
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import math
+import random
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Literal, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.messages import BaseMessage
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+CallKind = Literal["llm", "image", "tts"]
+
+# 한국어 위주 텍스트 기준의 보수적인 토큰 추정치 (실제보다 크게 잡아 쿼터 초과를 방지)
+_CHARS_PER_TOKEN = 1.5
+_IMAGE_INPUT_TOKENS = 300
+_ESTIMATED_OUTPUT_TOKENS = 1024
+
+# KEYS[1]: 동시 실행 lease ZSET (score = lease 만료 시각)
+# KEYS[2]: 최근 60초 요청 로그 ZSET (score = 요청 시각)
+# KEYS[3]: 최근 60초 토큰 로그 ZSET (member = "{lease_id}:{tokens}", score = 요청 시각)
+# ARGV: lease_id, lease_ttl_ms, max_concurrency, rpm, tpm, tokens
+# 반환값: 0이면 획득 성공, 양수면 재시도까지 권장 대기 시간(ms)
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local lease_id = ARGV[1]
+local lease_ttl = tonumber(ARGV[2])
+local max_concurrency = tonumber(ARGV[3])
+local rpm = tonumber(ARGV[4])
+local tpm = tonumber(ARGV[5])
+local tokens = tonumber(ARGV[6])
+local window = 60000
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - window)
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', now - window)
+
+if max_concurrency > 0 and redis.call('ZCARD', KEYS[1]) >= max_concurrency then
+    return 200
+end
+
+if rpm > 0 and redis.call('ZCARD', KEYS[2]) >= rpm then
+    local oldest = redis.call('ZRANGE', KEYS[2], 0, 0, 'WITHSCORES')
+    return math.max(1, tonumber(oldest[2]) + window - now)
+end
+
+if tpm > 0 and tokens > 0 then
+    local entries = redis.call('ZRANGE', KEYS[3], 0, -1, 'WITHSCORES')
+    local used = 0
+    for i = 1, #entries, 2 do
+        used = used + tonumber(string.match(entries[i], ':(%d+)$'))
+    end
+    if used + tokens > tpm then
+        return math.max(1, tonumber(entries[2] or now) + window - now)
+    end
+end
+
+redis.call('ZADD', KEYS[1], now + lease_ttl, lease_id)
+redis.call('ZADD', KEYS[2], now, lease_id)
+redis.call('PEXPIRE', KEYS[1], lease_ttl + window)
+redis.call('PEXPIRE', KEYS[2], window * 2)
+if tpm > 0 and tokens > 0 then
+    redis.call('ZADD', KEYS[3], now, lease_id .. ':' .. tokens)
+    redis.call('PEXPIRE', KEYS[3], window * 2)
+end
+return 0
+"""
+
+
+class AdmissionTimeoutError(Exception):
+    """최대 대기 시간 내에 호출 허가를 받지 못한 경우"""
+
+
+class AdmissionController:
+    """
+    Redis 기반 분산 호출 허가(Admission Control) 관리자
+
+    프로바이더/모델 단위로 전역 동시 실행 수, 분당 요청 수(RPM), 분당 토큰 수(TPM)를 제한합니다.
+    여러 uvicorn 워커, 컨테이너, 생성 워커가 같은 Redis를 공유하므로 전체 플릿 기준으로 쿼터를 지킵니다.
+    RPM/TPM 한도에는 ADMISSION_QUOTA_HEADROOM_RATIO를 곱해 실제 쿼터보다 약간 낮게 유지합니다.
+
+    Redis 장애 시에는 생성이 멈추지 않도록 제한 없이 통과시킵니다(fail-open).
+    """
+
+    def _limits(self, kind: CallKind) -> Dict[str, int]:
+        headroom = settings.ADMISSION_QUOTA_HEADROOM_RATIO
+        limits = {
+            "llm": (settings.LLM_MAX_CONCURRENCY, settings.LLM_RPM, settings.LLM_TPM),
+            "image": (settings.IMAGE_MAX_CONCURRENCY, settings.IMAGE_RPM, 0),
+            "tts": (settings.TTS_MAX_CONCURRENCY, settings.TTS_RPM, 0),
+        }[kind]
+        max_concurrency, rpm, tpm = limits
+        return {
+            "max_concurrency": max_concurrency,
+            "rpm": int(rpm * headroom),
+            "tpm": int(tpm * headroom),
+        }
+
+    async def _get_script(self):
+        redis_client = await RedisClient.get_instance()
+        return redis_client.register_script(_ACQUIRE_SCRIPT)
+
+    def _keys(self, kind: CallKind, provider: str, model: str) -> List[str]:
+        prefix = f"admission:{kind}:{provider}:{model}"
+        return [f"{prefix}:leases", f"{prefix}:requests", f"{prefix}:tokens"]
+
+    async def acquire(self, kind: CallKind, provider: str, model: str, tokens: int = 0) -> Optional[str]:
+        """
+        호출 허가를 받을 때까지 대기한 뒤 lease_id를 반환합니다.
+        제한이 설정되지 않았거나 Redis 장애로 검사를 건너뛴 경우 None을 반환합니다.
+        """
+        limits = self._limits(kind)
+        if not any(limits.values()):
+            return None
+
+        # 단일 호출이 TPM 한도를 넘으면 영원히 통과하지 못하므로 한도로 자름
+        if limits["tpm"] > 0:
+            tokens = min(tokens, limits["tpm"])
+
+        lease_id = uuid.uuid4().hex
+        keys = self._keys(kind, provider, model)
+        args = [
+            lease_id,
+            settings.ADMISSION_LEASE_TTL_SECONDS * 1000,
+            limits["max_concurrency"],
+            limits["rpm"],
+            limits["tpm"],
+            tokens,
+        ]
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.ADMISSION_MAX_WAIT_SECONDS
+        waited = False
+
+        while True:
+            try:
+                script = await self._get_script()
+                wait_ms = await script(keys=keys, args=args)
+            except Exception as e:
+                logger.warning(f"[Admission] Redis check failed for {kind}:{provider}:{model}, admitting without limit: {e}")
+                return None
+
+            if wait_ms == 0:
+                if waited:
+                    logger.info(f"[Admission] Admitted {kind}:{provider}:{model} after waiting for quota.")
+                return lease_id
+
+            if loop.time() >= deadline:
+                raise AdmissionTimeoutError(
+                    f"{kind}:{provider}:{model} 호출 허가 대기 시간({settings.ADMISSION_MAX_WAIT_SECONDS}s)을 초과했습니다."
+                )
+
+            if not waited:
+                logger.info(f"[Admission] Quota saturated for {kind}:{provider}:{model}. Waiting...")
+                waited = True
+
+            # 여러 프로세스가 동시에 재시도하지 않도록 지터 추가
+            sleep_secs = min(wait_ms / 1000.0, deadline - loop.time()) + random.uniform(0, 0.1)
+            await asyncio.sleep(max(0.05, sleep_secs))
+
+    async def release(self, kind: CallKind, provider: str, model: str, lease_id: Optional[str]):
+        """동시 실행 lease를 반환합니다. RPM/TPM 기록은 60초 윈도우가 지나면 자연 소멸합니다."""
+        if not lease_id:
+            return
+        try:
+            redis_client = await RedisClient.get_instance()
+            await redis_client.zrem(self._keys(kind, provider, model)[0], lease_id)
+        except Exception as e:
+            logger.warning(f"[Admission] Failed to release lease for {kind}:{provider}:{model}: {e}")
+
+    @asynccontextmanager
+    async def admit(self, kind: CallKind, provider: str, model: str, tokens: int = 0):
+        """호출 허가를 받은 동안에만 블록을 실행하는 컨텍스트 매니저"""
+        lease_id = await self.acquire(kind, provider, model, tokens)
+        try:
+            yield
+        finally:
+            await self.release(kind, provider, model, lease_id)
+
+
+def estimate_message_tokens(messages: List[BaseMessage]) -> int:
+    """메시지 목록의 입력 토큰 수와 예상 출력 토큰 수를 보수적으로 추정합니다."""
+    chars = 0
+    image_count = 0
+    for message in messages:
+        content = message.content
+        if isinstance(content, str):
+            chars += len(content)
+            continue
+        for part in content:
+            if isinstance(part, str):
+                chars += len(part)
+            elif part.get("type") == "text":
+                chars += len(part.get("text", ""))
+            else:
+                image_count += 1
+    return math.ceil(chars / _CHARS_PER_TOKEN) + image_count * _IMAGE_INPUT_TOKENS + _ESTIMATED_OUTPUT_TOKENS
+
+
+class ChatModelAdmissionCallback(AsyncCallbackHandler):
+    """
+    Chat Model 호출 직전/직후에 분산 호출 허가를 획득/반환하는 콜백
+
+    Chat Model 인스턴스에 등록되므로, with_structured_output 래퍼와 이미지 리서치 에이전트 내부의
+    반복 호출까지 모든 LLM 호출에 동일한 제한이 적용됩니다.
+    """
+
+    raise_error = True
+
+    def __init__(self, provider: str, model: str):
+        self.provider = provider
+        self.model = model
+        self._leases: Dict[UUID, Optional[str]] = {}
+
+    async def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List[List[BaseMessage]], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        tokens = sum(estimate_message_tokens(batch) for batch in messages)
+        self._leases[run_id] = await admission_controller.acquire("llm", self.provider, self.model, tokens)
+
+    async def _release(self, run_id: UUID):
+        lease_id = self._leases.pop(run_id, None)
+        await admission_controller.release("llm", self.provider, self.model, lease_id)
+
+    async def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        await self._release(run_id)
+
+    async def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        await self._release(run_id)
+
+
+# 전역 인스턴스 생성
+admission_controller = AdmissionController()
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select
+
+from .providers import ai_factory
+from .prompts import (
+    BRIEFING_CLOSING_SCRIPT,
+    BRIEFING_OPENING_SCRIPT,
+    BRIEFING_SEGMENT_SYSTEM_PROMPT,
+    TTS_INSTRUCTIONS,
+    create_briefing_segment_template,
+)
+from .schemas import BriefingSegment
+from .tasks.audio import stream_google_audio_task, stream_openai_audio_task
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.core.job_queue import briefing_precompute_queue
+from app.core.redis import RedisClient
+from app.database.models import AiArticle
+from app.utils.s3 import s3_manager
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_AUDIO_PREFIX = "briefing-segments/"
+OPENING_SEGMENT_ID = "opening"
+CLOSING_SEGMENT_ID = "closing"
+
+segment_llm = ai_factory.get_chat_model().with_structured_output(BriefingSegment)
+
+
+def briefing_cache_version() -> str:
+    """
+    BRIEFING_PROMPT_VERSION과 대본/음성에 영향을 주는 설정(프롬프트, 모델, 목소리)으로 만든 캐시 버전
+    (하나라도 바뀌면 이전에 만든 세그먼트는 사용하지 않음)
+    """
+    if settings.AI_PROVIDER == "openai":
+        models = (settings.OPENAI_CHAT_MODEL, settings.OPENAI_TTS_MODEL, settings.OPENAI_TTS_VOICE)
+    else:
+        models = (settings.GOOGLE_CHAT_MODEL, settings.GOOGLE_TTS_MODEL, settings.GOOGLE_TTS_VOICE)
+    fingerprint = "\n".join([
+        settings.AI_PROVIDER, *models, BRIEFING_SEGMENT_SYSTEM_PROMPT, TTS_INSTRUCTIONS,
+        BRIEFING_OPENING_SCRIPT, BRIEFING_CLOSING_SCRIPT,
+    ])
+    return f"{settings.BRIEFING_PROMPT_VERSION}-{hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:10]}"
+
+
+class BriefingSegmentCache:
+    """
+    미리 생성한 브리핑 세그먼트 캐시
+
+    세그먼트(기사 한 건 또는 고정 오프닝/클로징 멘트)의 대본과 메타데이터는 Redis
+    (briefing_segment:{버전}:{세그먼트 ID})에 BRIEFING_SEGMENT_CACHE_TTL_SECONDS 동안 저장하고,
+    음성(24kHz 16-bit mono PCM)은 S3(briefing-segments/{버전}/{세그먼트 ID}.pcm)에 저장합니다.
+    Redis 항목이 만료되었거나 버전이 바뀌어 더 이상 참조되지 않는 음성은 sweep_expired_segment_audio가 정리합니다.
+    Redis 장애 시에는 캐시가 없는 것처럼 동작합니다.
+    """
+
+    def _key(self, segment_id: str) -> str:
+        return f"briefing_segment:{briefing_cache_version()}:{segment_id}"
+
+    def audio_key(self, segment_id: str) -> str:
+        return f"{SEGMENT_AUDIO_PREFIX}{briefing_cache_version()}/{segment_id}.pcm"
+
+    async def get_many(self, segment_ids: List[str]) -> Dict[str, dict]:
+        if not segment_ids:
+            return {}
+        try:
+            redis_client = await RedisClient.get_instance()
+            values = await redis_client.mget([self._key(segment_id) for segment_id in segment_ids])
+        except Exception as e:
+            logger.warning(f"[BriefingSegmentCache] Redis mget failed: {e}")
+            return {}
+        return {segment_id: json.loads(value) for segment_id, value in zip(segment_ids, values) if value}
+
+    async def set(self, segment_id: str, entry: dict):
+        try:
+            redis_client = await RedisClient.get_instance()
+            await redis_client.set(
+                self._key(segment_id),
+                json.dumps(entry, ensure_ascii=False),
+                ex=settings.BRIEFING_SEGMENT_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(f"[BriefingSegmentCache] Redis set failed for {segment_id}: {e}")
+
+
+# 전역 인스턴스 생성
+briefing_segment_cache = BriefingSegmentCache()
+
+
+async def _write_segment_script(article: dict) -> str:
+    messages = create_briefing_segment_template().format_messages(
+        article={"title": article["title"], "body": article["body"]}
+    )
+    response = await segment_llm.ainvoke(messages)
+    return response.script
+
+
+async def precompute_segment(segment_id: str, script: str) -> dict:
+    """
+    대본을 음성으로 합성해 S3에 올리고 캐시에 기록한 뒤 캐시 항목을 반환
+    (합성된 PCM 청크는 모으지 않고 받는 즉시 S3 스트리밍 업로드로 흘려보냄)
+    """
+    stream_func = stream_openai_audio_task if settings.AI_PROVIDER == "openai" else stream_google_audio_task
+    audio_key = briefing_segment_cache.audio_key(segment_id)
+    upload = s3_manager.open_stream(audio_key, content_type="application/octet-stream")
+    pcm_bytes = 0
+    try:
+        async for chunk in stream_func(script):
+            await upload.write(chunk)
+            pcm_bytes += len(chunk)
+        await upload.complete()
+    except BaseException:
+        await upload.abort()
+        raise
+
+    entry = {"script": script, "audio_key": audio_key, "pcm_bytes": pcm_bytes}
+    await briefing_segment_cache.set(segment_id, entry)
+    return entry
+
+
+async def precompute_article_segment(article: dict) -> dict:
+    """기사 한 건의 세그먼트 대본을 작성하고 음성까지 미리 생성"""
+    script = await _write_segment_script(article)
+    return await precompute_segment(str(article["id"]), script)
+
+
+async def ensure_briefing_segments(articles: List[dict]) -> Tuple[dict, List[dict], dict]:
+    """
+    오프닝, 기사별 세그먼트, 클로징의 캐시 항목을 반환합니다.
+    아직 미리 생성되지 않은 세그먼트는 지금 생성하며(다음 브리핑에서도 재사용), 동시 생성 수는 BRIEFING_TTS_MAX_CONCURRENCY로 제한합니다.
+    """
+    article_ids = [str(a["id"]) for a in articles]
+    cached = await briefing_segment_cache.get_many([OPENING_SEGMENT_ID, *article_ids, CLOSING_SEGMENT_ID])
+
+    semaphore = asyncio.Semaphore(settings.BRIEFING_TTS_MAX_CONCURRENCY)
+
+    async def ensure(segment_id: str, compute) -> dict:
+        if segment_id in cached:
+            return cached[segment_id]
+        async with semaphore:
+            logger.info(f"[BriefingPrecompute] Segment {segment_id} not precomputed. Generating now.")
+            return await compute()
+
+    opening, closing, *entries = await asyncio.gather(
+        ensure(OPENING_SEGMENT_ID, lambda: precompute_segment(OPENING_SEGMENT_ID, BRIEFING_OPENING_SCRIPT)),
+        ensure(CLOSING_SEGMENT_ID, lambda: precompute_segment(CLOSING_SEGMENT_ID, BRIEFING_CLOSING_SCRIPT)),
+        *[
+            ensure(article_id, lambda article=article: precompute_article_segment(article))
+            for article_id, article in zip(article_ids, articles)
+        ],
+    )
+    logger.info(
+        f"[BriefingPrecompute] Reused {sum(1 for i in article_ids if i in cached)}/{len(article_ids)} precomputed article segments."
+    )
+    return opening, entries, closing
+
+
+async def run_briefing_precompute(article_id: int):
+    """작업 큐에서 꺼낸 기사 한 건의 브리핑 세그먼트를 미리 생성 (이미 있으면 건너뜀)"""
+    if str(article_id) in await briefing_segment_cache.get_many([str(article_id)]):
+        logger.info(f"[BriefingPrecompute] Segment for AiArticle {article_id} already precomputed.")
+        return
+
+    async with get_db_session() as db:
+        result = await db.execute(select(AiArticle.id, AiArticle.title, AiArticle.body).where(AiArticle.id == article_id))
+        row = result.first()
+
+    if row is None:
+        logger.warning(f"[BriefingPrecompute] AiArticle {article_id} not found.")
+        return
+
+    await precompute_article_segment({"id": row.id, "title": row.title, "body": row.body})
+    logger.info(f"[BriefingPrecompute] Precomputed briefing segment for AiArticle {article_id}.")
+
+
+async def enqueue_briefing_precompute(article_id: int):
+    """BRIEFING_PRECOMPUTE_ENABLED일 때 기사 한 건의 세그먼트 사전 생성 작업을 큐에 등록 (실패해도 기사 저장에는 영향 없음)"""
+    if not settings.BRIEFING_PRECOMPUTE_ENABLED:
+        return
+    try:
+        await briefing_precompute_queue.enqueue([{"article_id": article_id}])
+    except Exception as e:
+        logger.warning(f"[BriefingPrecompute] Failed to enqueue AiArticle {article_id}: {e}")
+
+
+# 음성 업로드 후 캐시 항목 기록까지의 지연과 시계 오차를 고려한 여유 시간
+_SWEEP_GRACE_SECONDS = 60 * 60
+
+
+async def sweep_expired_segment_audio() -> int:
+    """
+    Redis 캐시 항목보다 오래된(BRIEFING_SEGMENT_CACHE_TTL_SECONDS + 여유 시간) 세그먼트 음성을 S3에서 삭제합니다.
+    같은 세그먼트를 다시 생성하면 같은 키에 덮어쓰므로, 수정 시각이 TTL을 넘긴 객체는 이전 버전이거나 만료된 항목입니다.
+    여러 워커가 떠 있어도 BRIEFING_SEGMENT_SWEEP_INTERVAL_SECONDS마다 한 곳에서만 실행합니다.
+    """
+    redis_client = await RedisClient.get_instance()
+    acquired = await redis_client.set(
+        "briefing_segment:sweep_lock", "1", nx=True, ex=settings.BRIEFING_SEGMENT_SWEEP_INTERVAL_SECONDS
+    )
+    if not acquired:
+        return 0
+
+    deleted = await s3_manager.delete_expired_objects(
+        SEGMENT_AUDIO_PREFIX, settings.BRIEFING_SEGMENT_CACHE_TTL_SECONDS + _SWEEP_GRACE_SECONDS
+    )
+    if deleted:
+        logger.info(f"[BriefingPrecompute] Deleted {deleted} expired segment audio object(s).")
+    return deleted
+
+
+async def run_segment_audio_sweeper():
+    """sweep_expired_segment_audio를 주기적으로 실행하는 워커 백그라운드 루프 (취소될 때까지 실행)"""
+    while True:
+        try:
+            await sweep_expired_segment_audio()
+        except Exception as e:
+            logger.warning(f"[BriefingPrecompute] Segment audio sweep failed: {e}")
+        await asyncio.sleep(settings.BRIEFING_SEGMENT_SWEEP_INTERVAL_SECONDS)
@@ -0,0 +1,97 @@
+import logging
+from contextlib import AsyncExitStack
+from typing import Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def ai_article_thread_id(issue_id: int) -> str:
+    """이슈별 AI 기사 파이프라인의 체크포인트 thread_id"""
+    return f"ai_article:{issue_id}"
+
+
+def _to_psycopg_conninfo(db_url: str) -> str:
+    """DB_URL(postgresql+asyncpg:// 등)을 psycopg가 이해하는 postgresql:// 연결 문자열로 변환합니다."""
+    return make_url(db_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class CheckpointerManager:
+    """
+    LangGraph 체크포인터(노드 단위 상태 저장소)의 생명주기 관리자
+
+    CHECKPOINTER_BACKEND 설정에 따라 저장소를 선택합니다.
+    - postgres: 서비스 DB에 체크포인트 테이블을 두고 커넥션 풀로 접근 (운영 기본값)
+    - sqlite: 로컬 파일(CHECKPOINTER_SQLITE_PATH)에 저장 (로컬 개발/테스트용)
+    - memory: 프로세스 메모리에 저장 (재시작 시 소멸)
+    - none: 체크포인트를 사용하지 않음
+    """
+
+    def __init__(self):
+        self._stack: Optional[AsyncExitStack] = None
+        self.saver: Optional[BaseCheckpointSaver] = None
+
+    async def open(self) -> Optional[BaseCheckpointSaver]:
+        if self.saver is not None or settings.CHECKPOINTER_BACKEND == "none":
+            return self.saver
+
+        backend = settings.CHECKPOINTER_BACKEND
+        stack = AsyncExitStack()
+        try:
+            if backend == "postgres":
+                from psycopg.rows import dict_row
+                from psycopg_pool import AsyncConnectionPool
+                from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
+                pool = AsyncConnectionPool(
+                    conninfo=_to_psycopg_conninfo(settings.DB_URL),
+                    max_size=settings.CHECKPOINTER_POOL_SIZE,
+                    kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+                    open=False,
+                )
+                await pool.open()
+                stack.push_async_callback(pool.close)
+                saver = AsyncPostgresSaver(pool)
+                await saver.setup()
+            elif backend == "sqlite":
+                from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+                saver = await stack.enter_async_context(
+                    AsyncSqliteSaver.from_conn_string(settings.CHECKPOINTER_SQLITE_PATH)
+                )
+                await saver.setup()
+            else:
+                saver = InMemorySaver()
+        except Exception:
+            await stack.aclose()
+            raise
+
+        self._stack = stack
+        self.saver = saver
+        logger.info(f"[Checkpointer] Opened '{backend}' checkpointer.")
+        return saver
+
+    async def delete_thread(self, thread_id: str):
+        """완료된 파이프라인의 체크포인트를 삭제합니다. 실패해도 파이프라인 결과에는 영향이 없습니다."""
+        if self.saver is None:
+            return
+        try:
+            await self.saver.adelete_thread(thread_id)
+        except Exception as e:
+            logger.warning(f"[Checkpointer] Failed to delete thread {thread_id}: {e}")
+
+    async def close(self):
+        if self._stack is not None:
+            await self._stack.aclose()
+            logger.info("[Checkpointer] Checkpointer closed.")
+        self._stack = None
+        self.saver = None
+
+
+# 전역 인스턴스 생성
+checkpointer_manager = CheckpointerManager()
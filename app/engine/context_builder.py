@@ -0,0 +1,154 @@
+import heapq
+import logging
+import time
+import unicodedata
+from typing import FrozenSet, List, Optional, Sequence
+
+import tiktoken
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_SEPARATOR = "\n\n---\n\n"
+
+_SKETCH_SIZE = 64
+_SHINGLE_SIZE = 3
+_HASH_MASK = (1 << 61) - 1
+# tiktoken 인코딩을 불러오지 못했을 때 다시 시도하기까지의 간격(초)
+_CODEC_RETRY_INTERVAL_SECONDS = 300
+
+_codec: Optional[tuple] = None
+_codec_failed_at: Optional[float] = None
+
+
+def _tokens(text: str) -> List[str]:
+    return unicodedata.normalize("NFKC", text).casefold().split()
+
+
+def _sketch(text: str) -> FrozenSet[int]:
+    """
+    단어 3-gram 해시 중 가장 작은 _SKETCH_SIZE개로 만든 bottom-k MinHash 스케치
+    (기사 50건 기준 수십 ms 수준으로 가벼워 별도 실행기 없이 처리함.
+    내장 hash()는 프로세스마다 값이 달라지지만 스케치는 한 번의 호출 안에서만 비교함)
+    """
+    words = _tokens(text)
+    if len(words) < _SHINGLE_SIZE:
+        shingles = {hash(tuple(words))} if words else set()
+    else:
+        shingles = set(map(hash, zip(*[words[i:] for i in range(_SHINGLE_SIZE)])))
+    return frozenset(heapq.nsmallest(_SKETCH_SIZE, (h & _HASH_MASK for h in shingles)))
+
+
+def _similarity(sketch_a: FrozenSet[int], sketch_b: FrozenSet[int]) -> float:
+    """두 bottom-k 스케치로 추정한 Jaccard 유사도"""
+    if not sketch_a or not sketch_b:
+        return 0.0
+    union = sorted(sketch_a | sketch_b)[:_SKETCH_SIZE]
+    both = sketch_a & sketch_b
+    return sum(1 for h in union if h in both) / len(union)
+
+
+def _token_codec() -> Optional[tuple]:
+    """
+    (encode, decode) 함수. tiktoken 인코딩을 불러올 수 없으면(캐시 파일 없이 오프라인 등) None
+    (실패는 캐시하지 않고 _CODEC_RETRY_INTERVAL_SECONDS 뒤에 다시 시도함)
+    """
+    global _codec, _codec_failed_at
+    if _codec is not None:
+        return _codec
+    if _codec_failed_at is not None and time.monotonic() - _codec_failed_at < _CODEC_RETRY_INTERVAL_SECONDS:
+        return None
+    try:
+        encoding = tiktoken.get_encoding(settings.CONTEXT_TOKEN_ENCODING)
+    except Exception as e:
+        _codec_failed_at = time.monotonic()
+        logger.warning(f"[ContextBuilder] tiktoken unavailable, falling back to character estimate: {e}")
+        return None
+    _codec = (encoding.encode, encoding.decode)
+    return _codec
+
+
+def count_tokens(text: str) -> int:
+    codec = _token_codec()
+    if codec is None:
+        return -(-len(text) // settings.CONTEXT_CHARS_PER_TOKEN)
+    return len(codec[0](text))
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    codec = _token_codec()
+    if codec is None:
+        return text[:max_tokens * settings.CONTEXT_CHARS_PER_TOKEN]
+    encode, decode = codec
+    return decode(encode(text)[:max_tokens])
+
+
+def _format_article(article) -> str:
+    return f"기사 제목: {article.title}\n본문: {article.content or ''}"
+
+
+def build_article_context(
+    articles: Sequence,
+    issue_title: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """
+    이슈에 묶인 원본 기사(title, content 속성)들을 프롬프트 입력용 본문 하나로 합칩니다.
+
+    1. 본문 단어 3-gram의 MinHash(bottom-k) 스케치로 유사도가 CONTEXT_DEDUP_SIMILARITY_THRESHOLD 이상인 기사를
+       같은 묶음(통신사 전재본 등)으로 보고, 묶음마다 가장 긴 기사 하나만 남깁니다.
+    2. 남은 기사를 묶음 크기(여러 매체가 다룬 핵심 내용일수록 큼), 이슈 제목과 겹치는 단어 수, 길이 순으로 정렬합니다.
+    3. CONTEXT_MAX_TOKENS(tiktoken 기준, 불가 시 글자 수 추정) 안에 들어가는 만큼 앞에서부터 채우고,
+       마지막 기사는 남은 예산이 CONTEXT_MIN_ARTICLE_TOKENS 이상이면 잘라서 넣습니다.
+    """
+    if not articles:
+        return ""
+    max_tokens = max_tokens or settings.CONTEXT_MAX_TOKENS
+
+    sketches = [_sketch(f"{a.title or ''} {a.content or ''}") for a in articles]
+
+    # 긴 기사부터 묶음 대표로 삼아, 이후 기사가 기존 대표와 충분히 비슷하면 그 묶음에 합침
+    order = sorted(range(len(articles)), key=lambda i: len(articles[i].content or ""), reverse=True)
+    representatives: List[int] = []
+    cluster_sizes = {}
+    for i in order:
+        for rep in representatives:
+            if _similarity(sketches[i], sketches[rep]) >= settings.CONTEXT_DEDUP_SIMILARITY_THRESHOLD:
+                cluster_sizes[rep] += 1
+                break
+        else:
+            representatives.append(i)
+            cluster_sizes[i] = 1
+
+    title_words = set(_tokens(issue_title or ""))
+
+    def rank_key(i: int):
+        article = articles[i]
+        overlap = len(title_words & set(_tokens(article.title or "")))
+        return (-cluster_sizes[i], -overlap, -len(article.content or ""))
+
+    ranked = sorted(representatives, key=rank_key)
+
+    blocks: List[str] = []
+    used_tokens = 0
+    separator_tokens = count_tokens(ARTICLE_SEPARATOR)
+    for i in ranked:
+        block = _format_article(articles[i])
+        cost = count_tokens(block) + (separator_tokens if blocks else 0)
+        remaining = max_tokens - used_tokens
+        if cost <= remaining:
+            blocks.append(block)
+            used_tokens += cost
+            continue
+        # 예산을 넘는 기사는 첫 기사이거나 남은 예산이 충분할 때만 잘라서 넣고 종료
+        if not blocks or remaining >= settings.CONTEXT_MIN_ARTICLE_TOKENS:
+            blocks.append(_truncate_to_tokens(block, remaining - (separator_tokens if blocks else 0)))
+            used_tokens = max_tokens
+        break
+
+    logger.info(
+        f"[ContextBuilder] {len(articles)} articles → {len(representatives)} after dedup, "
+        f"{len(blocks)} included (~{used_tokens}/{max_tokens} tokens)"
+    )
+    return ARTICLE_SEPARATOR.join(blocks)
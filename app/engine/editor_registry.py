@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.core.redis import RedisClient
+from app.database.models import Editor
+
+logger = logging.getLogger(__name__)
+
+
+class EditorRegistry:
+    """
+    에디터/카테고리 정보를 메모리에 올려두고 조회하는 레지스트리
+
+    카테고리명 → 에디터 목록과 에디터별 페르소나 프롬프트를 보관하며, 에디터 배정은 DB 조회 없이
+    딕셔너리 조회로 처리됩니다. 데이터는 EDITOR_REGISTRY_TTL_SECONDS 주기로 다시 읽고,
+    Redis 채널(EDITOR_REGISTRY_CHANNEL)로 무효화 메시지를 받으면 다음 조회 시 즉시 다시 읽습니다.
+    """
+
+    def __init__(self):
+        self._editors_by_category: Dict[str, List[dict]] = {}
+        self._all_editors: List[dict] = []
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def load(self):
+        """DB에서 에디터와 담당 카테고리를 읽어 인덱스를 다시 구성합니다."""
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(Editor).options(selectinload(Editor.categories)).order_by(Editor.id.asc())
+            )
+            editors = result.scalars().all()
+
+        editors_by_category: Dict[str, List[dict]] = {}
+        all_editors = []
+        for editor in editors:
+            entry = {
+                "id": editor.id,
+                "name": editor.name,
+                "persona_prompt": editor.persona_prompt,
+            }
+            all_editors.append(entry)
+            for category in editor.categories:
+                editors_by_category.setdefault(category.name, []).append(entry)
+
+        self._editors_by_category = editors_by_category
+        self._all_editors = all_editors
+        self._loaded_at = time.monotonic()
+        logger.info(
+            f"[EditorRegistry] Loaded {len(all_editors)} editors across {len(editors_by_category)} categories."
+        )
+
+    def _is_stale(self) -> bool:
+        if self._loaded_at is None:
+            return True
+        return time.monotonic() - self._loaded_at > settings.EDITOR_REGISTRY_TTL_SECONDS
+
+    async def _ensure_fresh(self):
+        if not self._is_stale():
+            return
+        async with self._lock:
+            if not self._is_stale():
+                return
+            try:
+                await self.load()
+            except Exception as e:
+                # 이전 데이터가 있으면 그대로 사용하고, 처음 로드에 실패한 경우에만 예외 전파
+                if not self._all_editors:
+                    raise
+                logger.error(f"[EditorRegistry] Reload failed, keeping previous data: {e}")
+                self._loaded_at = time.monotonic()
+
+    async def get_editor(self, category_name: str) -> Optional[dict]:
+        """카테고리를 담당하는 에디터를 반환합니다. 없으면 전체 에디터 중 무작위로 선택합니다."""
+        await self._ensure_fresh()
+
+        matched = self._editors_by_category.get(category_name)
+        if matched:
+            return matched[0]
+        if self._all_editors:
+            return random.choice(self._all_editors)
+        return None
+
+    def invalidate(self):
+        """다음 조회 시 DB에서 다시 읽도록 캐시를 만료시킵니다."""
+        self._loaded_at = None
+
+    async def _listen_invalidation(self):
+        while True:
+            pubsub = None
+            try:
+                redis_client = await RedisClient.get_instance()
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(settings.EDITOR_REGISTRY_CHANNEL)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message:
+                        logger.info("[EditorRegistry] Invalidation signal received.")
+                        self.invalidate()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[EditorRegistry] Invalidation listener error, retrying: {e}")
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    async def start(self):
+        """에디터 정보를 미리 로드하고 무효화 채널 구독을 시작합니다."""
+        await self.load()
+        if self._listener_task is None:
+            self._listener_task = asyncio.create_task(self._listen_invalidation())
+
+    async def stop(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            await asyncio.gather(self._listener_task, return_exceptions=True)
+            self._listener_task = None
+
+
+async def publish_editor_invalidation():
+    """모든 프로세스의 에디터 레지스트리를 무효화하는 신호를 발행합니다."""
+    redis_client = await RedisClient.get_instance()
+    await redis_client.publish(settings.EDITOR_REGISTRY_CHANNEL, "invalidate")
+
+
+# 전역 인스턴스 생성
+editor_registry = EditorRegistry()
@@ -1,5 +1,7 @@
+from typing import Optional
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
-from .state import AiArticleState, TodayNewsnackState
+from .state import AiArticleState, TodayNewsnackState, ReferenceImageBranchOutput, DraftBranchOutput
 from .nodes import (
     analyze_article,
     select_editor,
@@ -13,44 +15,77 @@ from .nodes import (
     image_researcher,
     validate_image,
 )
+from .progress import track_node
 from app.core.config import settings
 
 
-def create_ai_article_graph():
+def _create_reference_image_branch():
+    """참고 이미지 리서치 갈래: image_researcher → validate_image"""
+    workflow = StateGraph(AiArticleState, output_schema=ReferenceImageBranchOutput)
+
+    workflow.add_node("image_researcher", track_node("image_researcher", image_researcher))
+    workflow.add_node("validate_image", track_node("validate_image", validate_image))
+
+    workflow.set_entry_point("image_researcher")
+    workflow.add_edge("image_researcher", "validate_image")
+    workflow.add_edge("validate_image", END)
+
+    return workflow.compile()
+
+
+def _create_draft_branch():
+    """본문 작성 갈래: select_editor → draft_article"""
+    workflow = StateGraph(AiArticleState, output_schema=DraftBranchOutput)
+
+    workflow.add_node("select_editor", track_node("select_editor", select_editor))
+    workflow.add_node("draft_article", track_node("draft_article", draft_article))
+
+    workflow.set_entry_point("select_editor")
+    workflow.add_edge("select_editor", "draft_article")
+    workflow.add_edge("draft_article", END)
+
+    return workflow.compile()
+
+
+def create_ai_article_graph(checkpointer: Optional[BaseCheckpointSaver] = None):
     workflow = StateGraph(AiArticleState)
 
     # 노드 등록
-    workflow.add_node("analyze_article", analyze_article)
-    workflow.add_node("image_researcher", image_researcher)
-    workflow.add_node("validate_image", validate_image)
-    workflow.add_node("select_editor", select_editor)
-    workflow.add_node("draft_article", draft_article)
-    workflow.add_node("generate_images", generate_images)
-    workflow.add_node("save_ai_article", save_ai_article)
+    # 두 갈래는 각각 하나의 서브그래프 노드로 등록해, 같은 단계에서 끝까지 독립적으로 병렬 실행되도록 함
+    # (노드를 직접 나란히 두면 단계마다 동기화되어 본문 작성이 리서치 에이전트를 기다리게 됨)
+    workflow.add_node("analyze_article", track_node("analyze_article", analyze_article))
+    workflow.add_node("reference_image_branch", _create_reference_image_branch())
+    workflow.add_node("draft_branch", _create_draft_branch())
+    workflow.add_node("generate_images", track_node("generate_images", generate_images))
+    workflow.add_node("save_ai_article", track_node("save_ai_article", save_ai_article))
 
     # 시작점 설정
     workflow.set_entry_point("analyze_article")
 
     # 엣지 연결
-    workflow.add_edge("analyze_article", "image_researcher")
-    workflow.add_edge("image_researcher", "validate_image")
-    workflow.add_edge("validate_image", "select_editor")
-    workflow.add_edge("select_editor", "draft_article")
-    workflow.add_edge("draft_article", "generate_images")
+    # 분석 이후 (이미지 리서치 → 검증) / (에디터 배정 → 본문 작성)을 병렬 실행
+    # 본문 작성은 참고 이미지를 사용하지 않으므로, 리서치 에이전트 지연이 임계 경로에서 빠짐
+    workflow.add_edge("analyze_article", "reference_image_branch")
+    workflow.add_edge("analyze_article", "draft_branch")
+
+    # 두 갈래가 모두 끝나면 이미지 생성으로 합류
+    workflow.add_edge(["reference_image_branch", "draft_branch"], "generate_images")
     workflow.add_edge("generate_images", "save_ai_article")
     workflow.add_edge("save_ai_article", END)
 
-    return workflow.compile()
+    # 체크포인터가 있으면 노드가 끝날 때마다 상태가 저장되어, 재시도 시 실패한 노드부터 재개됨
+    # (서브그래프는 상위 그래프의 체크포인터를 물려받아 갈래 내부에서도 실패한 노드부터 재개됨)
+    return workflow.compile(checkpointer=checkpointer)
 
 
 def create_today_newsnack_graph():
     workflow = StateGraph(TodayNewsnackState)
 
     # 노드 등록
-    workflow.add_node("fetch_articles", fetch_articles)
-    workflow.add_node("assemble_briefing", assemble_briefing)
-    workflow.add_node("generate_audio", generate_audio)
-    workflow.add_node("save_today_newsnack", save_today_newsnack)
+    workflow.add_node("fetch_articles", track_node("fetch_articles", fetch_articles))
+    workflow.add_node("assemble_briefing", track_node("assemble_briefing", assemble_briefing))
+    workflow.add_node("generate_audio", track_node("generate_audio", generate_audio))
+    workflow.add_node("save_today_newsnack", track_node("save_today_newsnack", save_today_newsnack))
 
     # 엣지 연결
     workflow.set_entry_point("fetch_articles")
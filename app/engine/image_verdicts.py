@@ -0,0 +1,152 @@
+import functools
+import hashlib
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Optional, Set
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+from .tool_cache import normalize_query, tool_query
+
+logger = logging.getLogger(__name__)
+
+# 검색 도구를 호출한 리서치가 어느 기사(제목)를 위한 것인지 (image_researcher가 에이전트 실행 전에 설정)
+research_context_var: ContextVar[Optional[str]] = ContextVar("research_context", default=None)
+
+
+def _fingerprint(text: str) -> str:
+    return hashlib.sha1(normalize_query(text).encode("utf-8")).hexdigest()
+
+
+def reference_entity(tool_name: str, query: str) -> str:
+    """참고 이미지를 찾은 검색 도구와 검색어로 만든 엔티티 식별자 (예: get_company_logo:samsung)"""
+    return f"{tool_name}:{normalize_query(query)}"
+
+
+class ImageVerdictCache:
+    """
+    참고 이미지 검증 결과(verdict) 캐시
+
+    멀티모달 검증 결과를 Redis에 저장해 같은 이미지에 대한 LLM 호출을 생략합니다.
+    - 승인: (이미지 콘텐츠 해시, 엔티티) 기준으로 IMAGE_VERDICT_TTL_SECONDS 동안 저장해 다른 기사에서도 재사용
+      (엔티티를 모르면 기사 제목 기준)
+    - 반려: 기사 문맥에 따른 판단일 수 있으므로 (이미지 콘텐츠 해시, 엔티티, 기사 제목) 기준으로
+      IMAGE_VERDICT_REJECTED_TTL_SECONDS 동안만 저장
+    반려된 이미지 URL도 같은 (엔티티, 기사 제목) 기준으로 URL마다 IMAGE_VERDICT_REJECTED_TTL_SECONDS 동안
+    기억해 두었다가 같은 기사의 검색 도구 결과에서 제외하므로, 재시도 중인 리서치 에이전트가 같은 이미지를
+    다시 제안하지 않습니다. (다른 기사의 리서치에는 영향을 주지 않음)
+    Redis 장애 시에는 캐시 없이 동작합니다.
+    """
+
+    def _approved_key(self, content_hash: str, entity: Optional[str], context: str) -> str:
+        return f"image_verdict:{content_hash}:{_fingerprint(entity or context)}"
+
+    def _context_fingerprint(self, entity: Optional[str], context: str) -> str:
+        return _fingerprint(f"{entity or ''}|{context}")
+
+    def _rejected_verdict_key(self, content_hash: str, entity: Optional[str], context: str) -> str:
+        return f"image_verdict:rejected_for:{content_hash}:{self._context_fingerprint(entity, context)}"
+
+    def _rejected_urls_key(self, entity: str, context: str) -> str:
+        return f"image_verdict:rejected_urls:{self._context_fingerprint(entity, context)}"
+
+    async def get(self, content_hash: str, entity: Optional[str], context: str) -> Optional[dict]:
+        """이전 검증 결과를 반환합니다. 엔티티 기준 승인 결과를 먼저 보고, 없으면 같은 기사 문맥의 반려 결과를 봅니다."""
+        try:
+            redis_client = await RedisClient.get_instance()
+            approved, rejected = await redis_client.mget([
+                self._approved_key(content_hash, entity, context),
+                self._rejected_verdict_key(content_hash, entity, context),
+            ])
+        except Exception as e:
+            logger.warning(f"[ImageVerdictCache] Redis get failed: {e}")
+            return None
+        raw = approved or rejected
+        return json.loads(raw) if raw else None
+
+    async def set(
+        self,
+        content_hash: str,
+        entity: Optional[str],
+        context: str,
+        is_valid: bool,
+        reason: str,
+        url: str,
+    ):
+        verdict = json.dumps({"is_valid": is_valid, "reason": reason}, ensure_ascii=False)
+        try:
+            redis_client = await RedisClient.get_instance()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                if is_valid:
+                    pipe.set(
+                        self._approved_key(content_hash, entity, context), verdict,
+                        ex=settings.IMAGE_VERDICT_TTL_SECONDS,
+                    )
+                else:
+                    pipe.set(
+                        self._rejected_verdict_key(content_hash, entity, context), verdict,
+                        ex=settings.IMAGE_VERDICT_REJECTED_TTL_SECONDS,
+                    )
+                    if entity:
+                        # URL마다 반려 시각을 점수로 저장해, 다른 URL이 반려되어도 각 URL은 TTL이 지나면 만료되도록 함
+                        now = time.time()
+                        rejected_key = self._rejected_urls_key(entity, context)
+                        pipe.zadd(rejected_key, {url: now})
+                        pipe.zremrangebyscore(rejected_key, 0, now - settings.IMAGE_VERDICT_REJECTED_TTL_SECONDS)
+                        pipe.expire(rejected_key, settings.IMAGE_VERDICT_REJECTED_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[ImageVerdictCache] Redis set failed: {e}")
+
+    async def rejected_urls(self, entity: str, context: str) -> Set[str]:
+        """같은 기사 문맥에서 최근 IMAGE_VERDICT_REJECTED_TTL_SECONDS 안에 반려된 이미지 URL"""
+        try:
+            redis_client = await RedisClient.get_instance()
+            urls = await redis_client.zrangebyscore(
+                self._rejected_urls_key(entity, context),
+                time.time() - settings.IMAGE_VERDICT_REJECTED_TTL_SECONDS,
+                "+inf",
+            )
+        except Exception as e:
+            logger.warning(f"[ImageVerdictCache] Redis zrangebyscore failed: {e}")
+            return set()
+        return set(urls)
+
+
+# 전역 인스턴스 생성
+image_verdict_cache = ImageVerdictCache()
+
+
+def exclude_rejected_candidates(tool_name: str, url_field: str):
+    """
+    검색 도구가 반환한 후보 목록에서 같은 기사(research_context_var)의 이전 검증에서 반려된 이미지 URL을
+    제외하는 데코레이터 (결과 캐시 바깥에 적용해, 캐시된 결과에도 최신 반려 목록이 반영되도록 함)
+    """
+    def decorator(func: Callable[..., Awaitable[str]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> str:
+            result = await func(*args, **kwargs)
+            context = research_context_var.get()
+            if result.startswith("TOOL_FAILED") or context is None:
+                return result
+
+            query = tool_query(args, kwargs)
+            rejected = await image_verdict_cache.rejected_urls(reference_entity(tool_name, query), context)
+            if not rejected:
+                return result
+
+            candidates = json.loads(result)
+            remaining = [c for c in candidates if c.get(url_field) not in rejected]
+            if len(remaining) == len(candidates):
+                return result
+
+            logger.info(f"[{tool_name}] Excluded {len(candidates) - len(remaining)} previously rejected candidate(s).")
+            if not remaining:
+                return "TOOL_FAILED: All candidates were previously rejected by image validation. Try a different query or tool."
+            return json.dumps(remaining, ensure_ascii=False)
+
+        return wrapper
+
+    return decorator
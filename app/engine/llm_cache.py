@@ -0,0 +1,108 @@
+import hashlib
+import json
+import logging
+import time
+from typing import List, Type
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+_INDEX_KEY = "llm_cache:index"
+
+
+def _chat_model_name() -> str:
+    if settings.AI_PROVIDER == "openai":
+        return f"openai:{settings.OPENAI_CHAT_MODEL}"
+    return f"google:{settings.GOOGLE_CHAT_MODEL}"
+
+
+def _messages_digest(messages: List[BaseMessage]) -> str:
+    payload = json.dumps(
+        [(m.type, m.content) for m in messages], ensure_ascii=False, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedStructuredLLM:
+    """
+    구조화 출력 Runnable(with_structured_output) 앞에 두는 응답 캐시 (LLM_CACHE_ENABLED일 때만 동작)
+
+    (모델, 단계 이름, LLM_CACHE_PROMPT_VERSION, 응답 스키마, 입력 메시지 해시) 기준으로 응답을 Redis에
+    LLM_CACHE_TTL_SECONDS 동안 저장해, 원본 기사가 바뀌지 않은 FAILED 이슈 재시도나 디버그 API 반복 실행에서
+    같은 호출을 다시 하지 않습니다. 저장 시각을 ZSET 인덱스로 관리해 LLM_CACHE_MAX_ENTRIES를 넘으면
+    오래된 항목부터 삭제합니다. Redis 장애 시에는 캐시 없이 원래 Runnable을 호출합니다.
+    """
+
+    def __init__(self, runnable: Runnable, schema: Type[BaseModel], name: str):
+        self.runnable = runnable
+        self.schema = schema
+        self.name = name
+        # 스키마의 필드 설명도 프롬프트의 일부이므로 키에 포함
+        self._schema_digest = hashlib.sha1(
+            json.dumps(schema.model_json_schema(), sort_keys=True).encode("utf-8")
+        ).hexdigest()[:12]
+
+    def _key(self, messages: List[BaseMessage]) -> str:
+        scope = f"{_chat_model_name()}|{settings.LLM_CACHE_PROMPT_VERSION}|{self._schema_digest}"
+        digest = hashlib.sha256(f"{scope}|{_messages_digest(messages)}".encode("utf-8")).hexdigest()
+        return f"llm_cache:{self.name}:{digest}"
+
+    async def _get(self, key: str):
+        try:
+            redis_client = await RedisClient.get_instance()
+            raw = await redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"[LlmCache] Redis get failed for {self.name}: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return self.schema.model_validate_json(raw)
+        except ValueError:
+            # 스키마 변경 등으로 읽을 수 없는 항목은 캐시 미스로 처리
+            return None
+
+    async def _set(self, key: str, response: BaseModel):
+        try:
+            redis_client = await RedisClient.get_instance()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.set(key, response.model_dump_json(), ex=settings.LLM_CACHE_TTL_SECONDS)
+                pipe.zadd(_INDEX_KEY, {key: time.time()})
+                # TTL로 이미 만료된 항목은 인덱스에서도 제거
+                pipe.zremrangebyscore(_INDEX_KEY, 0, time.time() - settings.LLM_CACHE_TTL_SECONDS)
+                pipe.zcard(_INDEX_KEY)
+                *_, size = await pipe.execute()
+
+            overflow = size - settings.LLM_CACHE_MAX_ENTRIES
+            if overflow > 0:
+                evicted = [k for k, _ in await redis_client.zpopmin(_INDEX_KEY, overflow)]
+                if evicted:
+                    await redis_client.delete(*evicted)
+        except Exception as e:
+            logger.warning(f"[LlmCache] Redis set failed for {self.name}: {e}")
+
+    async def ainvoke(self, messages: List[BaseMessage], *args, **kwargs):
+        if not settings.LLM_CACHE_ENABLED:
+            return await self.runnable.ainvoke(messages, *args, **kwargs)
+
+        key = self._key(messages)
+        cached = await self._get(key)
+        if cached is not None:
+            logger.info(f"[LlmCache] Cache hit for {self.name}")
+            return cached
+
+        response = await self.runnable.ainvoke(messages, *args, **kwargs)
+        if isinstance(response, self.schema):
+            await self._set(key, response)
+        return response
+
+
+def with_response_cache(runnable: Runnable, schema: Type[BaseModel], name: str) -> CachedStructuredLLM:
+    """구조화 출력 Runnable에 응답 캐시를 적용합니다."""
+    return CachedStructuredLLM(runnable, schema, name)
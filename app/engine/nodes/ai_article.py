@@ -1,10 +1,14 @@
 import asyncio
 import logging
-from sqlalchemy.sql import func
-from sqlalchemy.orm import Session
+from typing import Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
-from app.utils.image import download_image_from_url
+from app.utils.image import download_reference_image_bytes
 
+from ..briefing_precompute import enqueue_briefing_precompute
+from ..editor_registry import editor_registry
+from ..llm_cache import with_response_cache
 from ..providers import ai_factory
 from ..state import AiArticleState
 from ..schemas import AnalysisResponse, EditorContentResponse
@@ -15,14 +19,15 @@ from ..prompts import (
 )
 from ..tasks.image import generate_openai_image_task, generate_google_image_task
 from app.core.config import settings
-from app.database.models import Editor, Category, AiArticle, ReactionCount, Issue, ProcessingStatusEnum
-from app.utils.image import upload_image_to_s3
+from app.core.database import get_db_session
+from app.database.models import AiArticle, ReactionCount, Issue, ProcessingStatusEnum
+from app.utils.image import upload_image_to_s3, upload_image_variants
 
 logger = logging.getLogger(__name__)
 
 chat_model = ai_factory.get_chat_model()
-analyze_llm = chat_model.with_structured_output(AnalysisResponse)
-editor_llm = chat_model.with_structured_output(EditorContentResponse)
+analyze_llm = with_response_cache(chat_model.with_structured_output(AnalysisResponse), AnalysisResponse, "analyze_article")
+editor_llm = with_response_cache(chat_model.with_structured_output(EditorContentResponse), EditorContentResponse, "draft_article")
 
 
 async def analyze_article(state: AiArticleState):
@@ -45,33 +50,18 @@ async def analyze_article(state: AiArticleState):
 
 
 async def select_editor(state: AiArticleState):
-    """DB에서 전문 분야(Category)가 일치하는 에디터 배정"""
-    db: Session = state["db_session"]
+    """전문 분야(Category)가 일치하는 에디터 배정 (메모리 레지스트리 조회)"""
     category_name = state["category_name"]
 
-    matched_editor = (
-        db.query(Editor)
-        .join(Editor.categories)
-        .filter(Category.name == category_name)
-        .first()
-    )
-
-    if not matched_editor:
-        matched_editor = db.query(Editor).order_by(func.random()).first()
+    matched_editor = await editor_registry.get_editor(category_name)
 
     if not matched_editor:
         logger.error("Critical Error: No editors found in the database.")
         raise ValueError("에디터 데이터가 DB에 존재하지 않습니다.")
 
-    logger.info(f"[SelectEditor] Assigned Editor: {matched_editor.name}, Category: {category_name}")
+    logger.info(f"[SelectEditor] Assigned Editor: {matched_editor['name']}, Category: {category_name}")
 
-    return {
-        "editor": {
-            "id": matched_editor.id,
-            "name": matched_editor.name,
-            "persona_prompt": matched_editor.persona_prompt
-        }
-    }
+    return {"editor": dict(matched_editor)}
 
 
 async def draft_article(state: AiArticleState):
@@ -99,12 +89,24 @@ async def draft_article(state: AiArticleState):
 
 
 async def generate_images(state: AiArticleState):
-    """이미지 병렬 생성"""
+    """이미지 병렬 생성 및 컷별 S3 업로드 (원본 PNG + 웹 전송용 파생 이미지)"""
     content_key = state['content_key']
     content_type = state['content_type']
     prompts = state['image_prompts']
 
-    images = []
+    # 컷이 생성되는 즉시 업로드를 시작해, 업로드 시간이 나머지 컷 생성 시간과 겹치도록 함
+    upload_semaphore = asyncio.Semaphore(settings.IMAGE_UPLOAD_MAX_CONCURRENCY)
+
+    async def upload_panel(idx: int, img) -> Tuple[str, dict]:
+        async with upload_semaphore:
+            s3_url = await upload_image_to_s3(content_key, idx, img)
+            if not s3_url:
+                raise ValueError(f"S3 업로드 실패: 이미지 {idx}")
+            # 파생 이미지는 원본 바이트가 메모리에 있을 때 바로 만들어 올림 (실패해도 원본은 유지)
+            variants = await upload_image_variants(content_key, idx, img, content_type)
+        return s3_url, variants
+
+    anchor_upload = None
 
     try:
         logger.info(f"[GenerateImages] Using {settings.AI_PROVIDER} for {content_key}")
@@ -117,7 +119,8 @@ async def generate_images(state: AiArticleState):
         agent_ref_image = None
         ref_url = state.get("reference_image_url")
         if ref_url:
-            agent_ref_image = await download_image_from_url(ref_url)
+            # validate_image에서 캐시된 원본 바이트를 디코딩/재인코딩 없이 그대로 프로바이더에 전달
+            agent_ref_image = await download_reference_image_bytes(ref_url)
             if agent_ref_image:
                 logger.info("[GenerateImages] Successfully downloaded agent reference image")
             else:
@@ -130,73 +133,79 @@ async def generate_images(state: AiArticleState):
         else:
             logger.info(f"[GenerateImages] No agent reference image. Generating anchor image first.")
             anchor_image = await task_func(0, prompts[0], content_type, ref_image=None)
-        
-        images.append(anchor_image)
+
+        # 기준 이미지는 나머지 컷을 생성하는 동안 업로드
+        anchor_upload = asyncio.create_task(upload_panel(0, anchor_image))
+
+        async def generate_and_upload(i: int) -> Tuple[str, dict]:
+            img = await task_func(i, prompts[i], content_type, ref_image=anchor_image, ref_type="style")
+            return await upload_panel(i, img)
 
         logger.info(f"[GenerateImages] Generating remaining images based on anchor image's style.")
         # 1~3번 이미지는 방금 만든 0번 이미지(만화풍)를 '스타일(style)'로 참조하여 생성
-        tasks = [
-            task_func(i, prompts[i], content_type, ref_image=anchor_image, ref_type="style")
-            for i in range(1, 4)
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*[generate_and_upload(i) for i in range(1, 4)], return_exceptions=True)
 
         for i, result in enumerate(results, start=1):
             if isinstance(result, Exception):
                 raise ValueError(f"이미지 {i} 생성 실패: {result}") from result
-            images.append(result)
 
-        logger.info(f"[GenerateImages] All 4 images generated successfully. Uploading to S3...")
-        image_urls = []
-        for idx, img in enumerate(images):
-            s3_url = await upload_image_to_s3(content_key, idx, img)
-            if not s3_url:
-                raise ValueError(f"S3 업로드 실패: 이미지 {idx}")
-            image_urls.append(s3_url)
+        uploads = [await anchor_upload, *results]
+        image_urls = [url for url, _ in uploads]
+        image_variants = [variants for _, variants in uploads]
 
         logger.info(f"[GenerateImages] Successfully saved all images to S3 for {content_key}")
-        return {"image_urls": image_urls}
+        return {"image_urls": image_urls, "image_variants": image_variants}
 
     except Exception as e:
+        if anchor_upload:
+            anchor_upload.cancel()
+            await asyncio.gather(anchor_upload, return_exceptions=True)
         logger.error(f"[GenerateImages] Generation failed for {content_key}: {e}")
         raise ValueError(f"이미지 생성 실패: {e}") from e
 
 
 async def save_ai_article(state: AiArticleState):
     """최종 결과물 DB 저장"""
-    db: Session = state['db_session']
     issue_id = state['issue_id']
 
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    origin_articles_data = []
-    if issue and issue.articles:
-        origin_articles_data = [
-            {"title": a.title, "url": a.origin_url}
-            for a in issue.articles[:3]
-        ]
-
-    new_article = AiArticle(
-        issue_id=issue_id,
-        content_type=state["content_type"],
-        title=state["final_title"],
-        thumbnail_url=state["image_urls"][0] if state["image_urls"] else None,
-        editor_id=state["editor"]["id"],
-        category_id=issue.category_id if issue else None,
-        summary=state["summary"],
-        body=state["final_body"],
-        image_data={"image_urls": state["image_urls"]},
-        origin_articles=origin_articles_data
-    )
-    db.add(new_article)
-    db.flush()
-
-    new_reaction = ReactionCount(article_id=new_article.id)
-    db.add(new_reaction)
-
-    if issue:
-        issue.processing_status = ProcessingStatusEnum.COMPLETED
-
-    db.commit()
+    async with get_db_session() as db:
+        result = await db.execute(
+            select(Issue).options(selectinload(Issue.articles)).where(Issue.id == issue_id)
+        )
+        issue = result.scalars().first()
+        origin_articles_data = []
+        if issue and issue.articles:
+            origin_articles_data = [
+                {"title": a.title, "url": a.origin_url}
+                for a in issue.articles[:3]
+            ]
+
+        new_article = AiArticle(
+            issue_id=issue_id,
+            content_type=state["content_type"],
+            title=state["final_title"],
+            thumbnail_url=state["image_urls"][0] if state["image_urls"] else None,
+            editor_id=state["editor"]["id"],
+            category_id=issue.category_id if issue else None,
+            summary=state["summary"],
+            body=state["final_body"],
+            image_data={
+                "image_urls": state["image_urls"],
+                "image_variants": state.get("image_variants") or [{} for _ in state["image_urls"]],
+            },
+            origin_articles=origin_articles_data
+        )
+        db.add(new_article)
+        await db.flush()
+
+        new_reaction = ReactionCount(article_id=new_article.id)
+        db.add(new_reaction)
+
+        if issue:
+            issue.processing_status = ProcessingStatusEnum.COMPLETED
+
+        await db.commit()
 
     logger.info(f"[SaveAiArticle] DB Saved: AiArticle ID {new_article.id}, Issue {issue_id} updated to processed.")
+    await enqueue_briefing_precompute(new_article.id)
     return state
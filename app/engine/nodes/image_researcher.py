@@ -1,11 +1,13 @@
 import re
 import logging
-from langchain_core.messages import HumanMessage
+from typing import List, Optional
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
 from langchain.agents import create_agent
 
 from ..providers import ai_factory
 from ..state import AiArticleState
 from ..prompts import IMAGE_RESEARCHER_SYSTEM_PROMPT
+from ..image_verdicts import reference_entity, research_context_var
 from ..tasks.search import get_company_logo, get_person_thumbnail, get_fallback_image
 
 logger = logging.getLogger(__name__)
@@ -15,6 +17,21 @@ tools = [get_company_logo, get_person_thumbnail, get_fallback_image]
 chat_model = ai_factory.get_chat_model()
 research_agent = create_agent(chat_model, tools=tools, system_prompt=IMAGE_RESEARCHER_SYSTEM_PROMPT)
 
+def _find_source_entity(messages: List[BaseMessage], url: str) -> Optional[str]:
+    """선택된 URL을 반환한 도구 호출을 찾아 엔티티 식별자(도구명:검색어)를 만듭니다."""
+    tool_calls = {
+        call["id"]: call
+        for msg in messages if isinstance(msg, AIMessage)
+        for call in msg.tool_calls
+    }
+    for msg in reversed(messages):
+        if isinstance(msg, ToolMessage) and url in str(msg.content):
+            call = tool_calls.get(msg.tool_call_id)
+            if call and call["args"]:
+                return reference_entity(call["name"], str(next(iter(call["args"].values()))))
+    return None
+
+
 async def image_researcher(state: AiArticleState):
     """
     뉴스 기사의 핵심 엔티티를 파악하고, 최적의 참조 이미지를 검색하여 URL을 반환하는 에이전트 노드.
@@ -31,6 +48,8 @@ async def image_researcher(state: AiArticleState):
         "Find the best reference image URL for this news."
     )
     
+    # 검색 도구가 이 기사에서 반려된 후보만 제외하도록 기사 문맥(validate_image와 같은 제목)을 전달
+    context_token = research_context_var.set(title)
     try:
         response = await research_agent.ainvoke({"messages": [HumanMessage(content=context)]})
         messages = response["messages"]
@@ -57,9 +76,13 @@ async def image_researcher(state: AiArticleState):
         if final_url is None:
             logger.warning(f"[ImageResearcher] No URL found in any message after full traversal.")
 
-        logger.info(f"[ImageResearcher] Chosen Reference URL: {final_url}")
-        return {"reference_image_url": final_url}
+        entity = _find_source_entity(messages, final_url) if final_url else None
+
+        logger.info(f"[ImageResearcher] Chosen Reference URL: {final_url} (entity: {entity})")
+        return {"reference_image_url": final_url, "reference_image_entity": entity}
 
     except Exception as e:
         logger.error(f"[ImageResearcher] Agent execution failed: {e}")
-        return {"reference_image_url": None}
+        return {"reference_image_url": None, "reference_image_entity": None}
+    finally:
+        research_context_var.reset(context_token)
@@ -6,7 +6,8 @@ from ..providers import ai_factory
 from ..state import AiArticleState
 from ..prompts import IMAGE_VALIDATOR_SYSTEM_PROMPT
 from ..schemas import ImageValidationResponse
-from app.utils.image import download_image_from_url, image_to_base64_url
+from ..image_verdicts import image_verdict_cache
+from app.utils.image import download_reference_image, image_to_base64_url
 
 logger = logging.getLogger(__name__)
 
@@ -36,29 +37,40 @@ async def validate_image(state: AiArticleState):
         f"Summary: {summary}\n"
     )
 
+    # 같은 엔티티(검색 도구:검색어)의 같은 이미지는 기사가 달라도 승인 결과를 재사용
+    entity = state.get("reference_image_entity")
+
     try:
         # 1. Download image to convert to base64 for reliable multi-modal LLM processing
-        img = await download_image_from_url(final_url)
-        if not img:
+        cached_image = await download_reference_image(final_url)
+        if not cached_image:
             logger.warning(f"[ValidateImage] Failed to download or convert image from {final_url}")
             return {"reference_image_url": None}
-            
-        base64_url = image_to_base64_url(img)
 
-        # 2. Extract structured response from LLM
-        validator_content = [
-            {"type": "text", "text": f"News context:\n{context}"},
-            {"type": "image_url", "image_url": {"url": base64_url}}
-        ]
-        
-        validator_res = await validator_llm.ainvoke([
-            SystemMessage(content=IMAGE_VALIDATOR_SYSTEM_PROMPT),
-            HumanMessage(content=validator_content)
-        ])
+        # 2. Reuse a previous verdict for the same image content and entity/title
+        verdict = await image_verdict_cache.get(cached_image.digest, entity, title)
+        if verdict:
+            logger.info(f"[ValidateImage] Reusing cached verdict (valid={verdict['is_valid']}) for {final_url}")
+            is_valid, reason = verdict["is_valid"], verdict["reason"]
+        else:
+            base64_url = await image_to_base64_url(cached_image.image)
+
+            # 3. Extract structured response from LLM
+            validator_content = [
+                {"type": "text", "text": f"News context:\n{context}"},
+                {"type": "image_url", "image_url": {"url": base64_url}}
+            ]
+            
+            validator_res = await validator_llm.ainvoke([
+                SystemMessage(content=IMAGE_VALIDATOR_SYSTEM_PROMPT),
+                HumanMessage(content=validator_content)
+            ])
+            is_valid, reason = validator_res.is_valid, validator_res.reason
+            await image_verdict_cache.set(cached_image.digest, entity, title, is_valid, reason, final_url)
         
-        # 3. Analyze output
-        if not validator_res.is_valid:
-            logger.warning(f"[ValidateImage] Rejected. Image URL: {final_url} Reason: {validator_res.reason}")
+        # 4. Analyze output
+        if not is_valid:
+            logger.warning(f"[ValidateImage] Rejected. Image URL: {final_url} Reason: {reason}")
             return {"reference_image_url": None}
         else:
             logger.info(f"[ValidateImage] Approved. Image URL: {final_url}")
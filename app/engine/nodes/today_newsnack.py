@@ -1,25 +1,29 @@
+import functools
 import logging
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
 from ..providers import ai_factory
 from ..state import TodayNewsnackState
 from ..schemas import BriefingResponse
 from ..prompts import create_briefing_template
-from ..tasks.audio import generate_openai_audio_task, generate_google_audio_task
+from ..tasks.audio import stream_openai_audio_task, stream_google_audio_task
+from ..briefing_precompute import ensure_briefing_segments
+from ..llm_cache import with_response_cache
 from app.core.config import settings
+from app.core.database import get_db_session
 from app.database.models import AiArticle, TodayNewsnack
-from app.utils.audio import get_audio_duration_from_bytes, calculate_article_timelines, upload_audio_to_s3
+from app.utils.audio import calculate_article_timelines, stream_segments_to_s3
+from app.utils.s3 import s3_manager
 
 logger = logging.getLogger(__name__)
 
 chat_model = ai_factory.get_chat_model()
-briefing_llm = chat_model.with_structured_output(BriefingResponse)
+briefing_llm = with_response_cache(chat_model.with_structured_output(BriefingResponse), BriefingResponse, "assemble_briefing")
 
 
 async def fetch_articles(state: TodayNewsnackState):
     """지정된 이슈 ID에 해당하는 기사 조회 노드"""
-    db: Session = state["db_session"]
     target_ids = state["target_issue_ids"]
     selected_articles = []
 
@@ -27,12 +31,13 @@ async def fetch_articles(state: TodayNewsnackState):
         logger.warning("[FetchArticles] No target issue IDs provided.")
         return {"selected_articles": []}
 
-    articles = (
-        db.query(AiArticle)
-        .filter(AiArticle.issue_id.in_(target_ids))
-        .order_by(AiArticle.id.asc())
-        .all()
-    )
+    async with get_db_session() as db:
+        result = await db.execute(
+            select(AiArticle)
+            .where(AiArticle.issue_id.in_(target_ids))
+            .order_by(AiArticle.id.asc())
+        )
+        articles = result.scalars().all()
 
     article_map = {a.issue_id: a for a in articles}
 
@@ -56,6 +61,21 @@ async def assemble_briefing(state: TodayNewsnackState):
     """구조화된 대본 생성 노드"""
     articles = state["selected_articles"]
 
+    if settings.BRIEFING_PRECOMPUTE_ENABLED:
+        # 기사 저장 시점에 미리 만들어 둔 세그먼트(대본 + 음성)를 사용하고, 없는 것만 지금 생성
+        opening, entries, closing = await ensure_briefing_segments(articles)
+        segments = [
+            {
+                "article_id": article["id"],
+                "title": article["title"],
+                "thumbnail_url": article["thumbnail_url"],
+                "script": entry["script"],
+                "audio_key": entry["audio_key"],
+            }
+            for article, entry in zip(articles, entries)
+        ]
+        return {"briefing_segments": segments, "briefing_opening": opening, "briefing_closing": closing}
+
     template = create_briefing_template(len(articles))
     formatted_messages = template.format_messages(articles=articles)
 
@@ -79,27 +99,54 @@ async def assemble_briefing(state: TodayNewsnackState):
 
 
 async def generate_audio(state: TodayNewsnackState):
-    """단일 오디오 생성 및 타임라인 계산 노드"""
+    """세그먼트별 병렬 오디오 생성, 스트리밍 인코딩/업로드 및 타임라인 계산 노드"""
     segments = state["briefing_segments"]
-    full_script = " ".join([s["script"] for s in segments])
 
-    try:
-        if settings.AI_PROVIDER == "openai":
-            logger.info("[GenerateAudio] Using OpenAI TTS")
-            audio_bytes = await generate_openai_audio_task(full_script)
-        else:
-            logger.info("[GenerateAudio] Using Google Gemini TTS")
-            audio_bytes = await generate_google_audio_task(full_script)
+    if settings.AI_PROVIDER == "openai":
+        logger.info("[GenerateAudio] Using OpenAI TTS")
+        stream_func = stream_openai_audio_task
+    else:
+        logger.info("[GenerateAudio] Using Google Gemini TTS")
+        stream_func = stream_google_audio_task
+
+    def segment_stream(segment: dict):
+        # 미리 생성된 세그먼트는 S3에 저장된 PCM을 그대로 읽어 사용
+        if segment.get("audio_key"):
+            return functools.partial(s3_manager.stream_object, segment["audio_key"])
+        return functools.partial(stream_func, segment["script"])
+
+    opening = state.get("briefing_opening")
+    closing = state.get("briefing_closing")
+    streams = [segment_stream(s) for s in segments]
+    if opening:
+        streams.insert(0, segment_stream(opening))
+    if closing:
+        streams.append(segment_stream(closing))
 
-        duration = get_audio_duration_from_bytes(audio_bytes)
-        if not duration or duration <= 0:
+    try:
+        # 전체 지연 시간이 가장 긴 세그먼트 수준이 되도록 기사별로 동시에 합성하고 (프로바이더 한도는 호출 허가 제어가 별도로 적용),
+        # 합성된 PCM은 순서대로 인코더를 거쳐 바로 S3에 업로드
+        audio_url, spans = await stream_segments_to_s3(
+            streams,
+            max_concurrency=settings.BRIEFING_TTS_MAX_CONCURRENCY,
+            gap_seconds=settings.BRIEFING_SEGMENT_GAP_SECONDS,
+        )
+        duration = spans[-1][1] if spans else 0.0
+        if duration <= 0:
             raise ValueError(f"Invalid audio duration: {duration}")
 
-        briefing_articles_data = calculate_article_timelines(segments, duration)
+        article_spans = spans[1 if opening else 0:len(spans) - (1 if closing else 0)]
+        # 오프닝/클로징 멘트 구간은 첫/마지막 기사 구간에 포함 (한 번에 작성한 대본에서 첫/마지막 세그먼트에 인사가 포함되던 것과 동일)
+        if article_spans and opening:
+            article_spans[0] = (0.0, article_spans[0][1])
+        if article_spans and closing:
+            article_spans[-1] = (article_spans[-1][0], duration)
 
-        logger.info(f"[GenerateAudio] Successfully generated audio. Duration: {duration}s")
+        briefing_articles_data = calculate_article_timelines(segments, article_spans)
+
+        logger.info(f"[GenerateAudio] Successfully generated audio for {len(segments)} segments. Duration: {duration:.2f}s")
         return {
-            "total_audio_bytes": audio_bytes,
+            "audio_url": audio_url,
             "briefing_articles_data": briefing_articles_data
         }
 
@@ -109,23 +156,18 @@ async def generate_audio(state: TodayNewsnackState):
 
 
 async def save_today_newsnack(state: TodayNewsnackState):
-    """생성된 오디오 및 타임라인 저장 노드"""
-    db: Session = state["db_session"]
-    audio_bytes = state["total_audio_bytes"]
+    """오디오 URL 및 타임라인 저장 노드"""
+    audio_url = state["audio_url"]
     articles_data = state["briefing_articles_data"]
 
-    file_path = await upload_audio_to_s3(audio_bytes)
-    if not file_path:
-        logger.error("[SaveTodayNewsnack] Audio upload failed.")
-        raise ValueError("오디오 업로드에 실패했습니다.")
-
     new_snack = TodayNewsnack(
-        audio_url=file_path,
+        audio_url=audio_url,
         briefing_articles=articles_data
     )
 
-    db.add(new_snack)
-    db.commit()
+    async with get_db_session() as db:
+        db.add(new_snack)
+        await db.commit()
 
-    logger.info(f"[SaveTodayNewsnack] Saved to DB. ID: {new_snack.id}, Path: {file_path}")
+    logger.info(f"[SaveTodayNewsnack] Saved to DB. ID: {new_snack.id}, Path: {audio_url}")
     return state
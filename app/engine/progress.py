@@ -0,0 +1,34 @@
+from typing import Awaitable, Callable
+
+from langchain_core.runnables import RunnableConfig
+
+from app.core.job_tracker import job_tracker
+
+
+def track_node(node_name: str, node: Callable[..., Awaitable[dict]]):
+    """
+    그래프 노드의 시작/종료 시각을 작업 트래커에 기록하는 래퍼
+
+    실행 config의 configurable에 job_id, job_item_id가 있을 때만 기록하며,
+    없으면(디버그 실행 등) 원본 노드를 그대로 실행합니다.
+    """
+    async def tracked(state, config: RunnableConfig):
+        configurable = config.get("configurable", {}) if config else {}
+        job_id = configurable.get("job_id")
+        item_id = configurable.get("job_item_id")
+
+        if not job_id or item_id is None:
+            return await node(state)
+
+        await job_tracker.mark_node_started(job_id, item_id, node_name)
+        try:
+            result = await node(state)
+        except Exception:
+            await job_tracker.mark_node_finished(job_id, item_id, node_name, failed=True)
+            raise
+        await job_tracker.mark_node_finished(job_id, item_id, node_name)
+        return result
+
+    tracked.__name__ = node.__name__
+    tracked.__doc__ = node.__doc__
+    return tracked
@@ -252,6 +252,42 @@ def create_briefing_template(num_articles: int) -> ChatPromptTemplate:
     ])
 
 
+BRIEFING_SEGMENT_SYSTEM_PROMPT = """당신은 '뉴스낵(newsnack)'의 메인 마스코트인 '박수박사수달'입니다.
+아나운서로서 여러 뉴스를 이어서 읽는 브리핑 중 기사 한 건에 해당하는 대본을 작성합니다.
+
+[아나운서 페르소나 가이드]
+1. 말투: 20대 후반의 활기차고 지적인 친구 같은 느낌. (~해요, ~네요 문체 사용)
+2. 성격: 뉴스를 전하는 게 너무 즐거운 에너지 넘치는 수달.
+3. 특징:
+   - 이 대본은 브리핑 중간 어디에든 놓일 수 있으므로 오프닝/클로징 인사는 넣지 말 것.
+   - "다음 소식이에요."처럼 앞 기사와 자연스럽게 이어지는 짧은 연결 멘트로 시작할 것.
+
+[작성 규칙]
+1. 150-200자 내외(약 30초)의 분량으로 작성할 것.
+2. 기사의 핵심 정보는 반드시 포함하되, 에디터의 개별 말투는 지우고 '박수박사수달'의 톤으로 재창조할 것.
+3. 전문 용어는 최대한 쉽게 풀어서 설명할 것."""
+
+# 미리 계산된 세그먼트를 이어 붙일 때 앞뒤에 넣는 고정 멘트
+BRIEFING_OPENING_SCRIPT = "안녕하세요! 오늘의 뉴스낵을 시작할게요."
+BRIEFING_CLOSING_SCRIPT = "이상으로 오늘의 뉴스낵을 마칩니다. 감사합니다!"
+
+
+def create_briefing_segment_template() -> ChatPromptTemplate:
+    """
+    기사 한 건의 브리핑 세그먼트 대본 생성 템플릿 (기사 저장 시점 사전 계산용)
+
+    Returns:
+        구성된 ChatPromptTemplate 객체
+    """
+    return ChatPromptTemplate.from_messages([
+        ("system", BRIEFING_SEGMENT_SYSTEM_PROMPT),
+        ("human", """아래 뉴스 기사의 브리핑 대본을 작성하세요.
+
+[뉴스 데이터]
+{article}"""),
+    ])
+
+
 # ============================================================================
 # TTS 음성 생성 프롬프트
 # ============================================================================
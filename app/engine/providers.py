@@ -3,6 +3,7 @@ from google import genai
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from app.core.config import settings
+from .admission import ChatModelAdmissionCallback
 
 
 class AiProviderFactory:
@@ -27,7 +28,8 @@ class AiProviderFactory:
             self._google_chat_model = ChatGoogleGenerativeAI(
                 model=settings.GOOGLE_CHAT_MODEL,
                 google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0.7
+                temperature=0.7,
+                callbacks=[ChatModelAdmissionCallback("google", settings.GOOGLE_CHAT_MODEL)]
             )
         return self._google_chat_model
 
@@ -36,7 +38,8 @@ class AiProviderFactory:
             self._openai_chat_model = ChatOpenAI(
                 model=settings.OPENAI_CHAT_MODEL,
                 openai_api_key=settings.OPENAI_API_KEY,
-                temperature=0.7
+                temperature=0.7,
+                callbacks=[ChatModelAdmissionCallback("openai", settings.OPENAI_CHAT_MODEL)]
             )
         return self._openai_chat_model
 
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class RateLimiter:
+    """
+    작업 시작 간격을 최소 interval초로 유지하는 비동기 페이서
+
+    동시 실행 슬롯과 분리되어 있어, 직전 시작으로부터 interval이 이미 지났다면 대기 없이 바로 통과합니다.
+    (슬롯마다 고정 시간 sleep 하던 방식과 달리, 페이싱이 필요한 경우에만 대기함)
+
+    Args:
+        interval_secs: 연속된 두 작업 시작 사이의 최소 간격(초)
+    """
+
+    def __init__(self, interval_secs: float):
+        self.interval_secs = interval_secs
+        self._lock = asyncio.Lock()
+        self._next_start_at = 0.0
+
+    async def acquire(self):
+        if self.interval_secs <= 0:
+            return
+
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait_secs = self._next_start_at - loop.time()
+            if wait_secs > 0:
+                await asyncio.sleep(wait_secs)
+            self._next_start_at = loop.time() + self.interval_secs
+
+
+class WorkerPool:
+    """
+    내부 큐의 작업을 최대 concurrency개까지 동시에 실행하는 스케줄러
+
+    디스패처 하나가 큐에서 작업을 꺼내 시작 간격을 맞춘(rate_limiter) 뒤 동시 실행 슬롯을 잡아 실행합니다.
+    페이싱은 슬롯을 잡기 전에 수행하므로, 간격을 기다리는 동안 슬롯을 차지하지 않아 실행 중인 작업이 끝나면
+    바로 다음 작업을 시작할 수 있습니다. 내부 큐는 크기가 제한되어 있어 submit은 큐가 가득 차면 대기하므로,
+    수천 개의 작업을 넣더라도 동시에 메모리에 올라가는 작업은 concurrency + max_pending + 1(디스패처가 시작을
+    기다리는 작업)개로 제한됩니다.
+
+    Args:
+        handler: 작업 항목 하나를 처리하는 코루틴 함수
+        concurrency: 동시에 실행할 작업 수
+        rate_limiter: 작업 시작 간격을 조절할 페이서 (선택)
+        max_pending: 내부 큐에 대기할 수 있는 최대 작업 수 (기본값: concurrency)
+        name: 로그 식별용 이름
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Any], Awaitable[None]],
+        concurrency: int,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_pending: Optional[int] = None,
+        name: str = "WorkerPool",
+    ):
+        self.handler = handler
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.name = name
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending or concurrency)
+        self._slots = asyncio.Semaphore(concurrency)
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def start(self):
+        if self._dispatcher:
+            return
+        self._dispatcher = asyncio.create_task(self._dispatch_loop(), name=f"{self.name}-dispatcher")
+
+    async def submit(self, item: Any):
+        """작업을 내부 큐에 넣습니다. 큐가 가득 차 있으면 빈 자리가 생길 때까지 대기합니다."""
+        await self._queue.put(item)
+
+    async def join(self):
+        """지금까지 제출된 모든 작업이 끝날 때까지 대기합니다."""
+        await self._queue.join()
+
+    async def close(self, timeout: Optional[float] = None):
+        """
+        대기 중인 작업을 모두 처리한 뒤 디스패처를 종료합니다.
+        timeout 내에 끝나지 않은 작업은 취소합니다.
+        """
+        if not self._dispatcher:
+            return
+
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pending = [t for t in (self._dispatcher, *self._running) if not t.done()]
+            for task in pending:
+                task.cancel()
+            logger.warning(f"[{self.name}] {len(pending)} task(s) cancelled after shutdown timeout.")
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._dispatcher = None
+
+    async def _dispatch_loop(self):
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            try:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
+                await self._slots.acquire()
+            except BaseException:
+                self._queue.task_done()
+                raise
+            task = asyncio.create_task(self._run(item))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, item: Any):
+        try:
+            await self.handler(item)
+        except Exception as e:
+            logger.error(f"[{self.name}] Failed to handle item {item}: {e}")
+        finally:
+            self._slots.release()
+            self._queue.task_done()
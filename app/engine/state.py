@@ -1,10 +1,7 @@
 from typing import TypedDict, List, Optional
-from sqlalchemy.orm import Session
 
 class AiArticleState(TypedDict):
     # 시스템 주입
-    db_session: Session # SQLAlchemy Session
-    
     content_key: str 
 
     # 입력 데이터
@@ -20,15 +17,28 @@ class AiArticleState(TypedDict):
     
     # 최종 결과
     reference_image_url: Optional[str]
+    reference_image_entity: Optional[str] # 참고 이미지를 찾은 검색 도구:검색어 (검증 결과 캐시용)
     final_title: str
     final_body: str
     image_prompts: List[str]
     image_urls: List[str]
+    image_variants: List[dict] # 컷별 파생 이미지 URL {webp, avif, png8, thumbnails: {너비: url}}
+
+class ReferenceImageBranchOutput(TypedDict):
+    """참고 이미지 리서치 갈래(image_researcher → validate_image)가 본 그래프에 반영하는 키"""
+    reference_image_url: Optional[str]
+
+class DraftBranchOutput(TypedDict):
+    """본문 작성 갈래(select_editor → draft_article)가 본 그래프에 반영하는 키"""
+    editor: Optional[dict]
+    final_body: str
+    image_prompts: List[str]
 
 class TodayNewsnackState(TypedDict):
-    db_session: Session
     target_issue_ids: List[int]    # 요청받은 Issue ID 리스트
     selected_articles: List[dict]  # 선정된 기사별 정보
     briefing_segments: List[dict]  # 기사 ID별 생성된 대본
-    total_audio_bytes: bytes       # 생성된 오디오 바이너리
+    briefing_opening: Optional[dict]  # 사전 생성 모드의 오프닝 멘트 세그먼트 (script, audio_key)
+    briefing_closing: Optional[dict]  # 사전 생성 모드의 클로징 멘트 세그먼트
+    audio_url: str                 # 스트리밍 업로드된 오디오 S3 URL
     briefing_articles_data: List[dict] # 최종 DB 저장용 타임라인 포함 데이터
@@ -1,76 +1,105 @@
 import logging
+from contextlib import AsyncExitStack
+from typing import AsyncIterator
 
 from google.genai import types
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from tenacity import AsyncRetrying, retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from ..providers import ai_factory
 from ..prompts import TTS_INSTRUCTIONS, create_tts_prompt
 from app.core.config import settings
-from app.utils.audio import convert_pcm_to_mp3
+from app.engine.admission import admission_controller
 
 logger = logging.getLogger(__name__)
 
+_STREAM_CHUNK_BYTES = 32 * 1024
+
 
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_random_exponential(multiplier=1, min=2, max=10)
 )
-async def generate_google_audio_task(full_script: str):
-    """Google Gemini TTS를 사용한 오디오 생성 태스크 (재시도 포함)"""
+async def generate_google_audio_task(script: str) -> bytes:
+    """Google Gemini TTS를 사용한 세그먼트 오디오 생성 태스크 (재시도 포함). 24kHz 16-bit mono PCM을 반환"""
     client = ai_factory.get_audio_client()
-    prompt = create_tts_prompt(full_script)
+    prompt = create_tts_prompt(script)
 
     try:
-        response = await client.aio.models.generate_content(
-            model=settings.GOOGLE_TTS_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name=settings.GOOGLE_TTS_VOICE
+        async with admission_controller.admit("tts", "google", settings.GOOGLE_TTS_MODEL):
+            response = await client.aio.models.generate_content(
+                model=settings.GOOGLE_TTS_MODEL,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_modalities=["AUDIO"],
+                    speech_config=types.SpeechConfig(
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                                voice_name=settings.GOOGLE_TTS_VOICE
+                            )
                         )
                     )
                 )
             )
-        )
 
         raw_pcm = response.candidates[0].content.parts[0].inline_data.data
-        audio_bytes = convert_pcm_to_mp3(raw_pcm)
 
-        if not audio_bytes:
-            raise ValueError("Failed to convert PCM to MP3")
+        if not raw_pcm:
+            raise ValueError("Empty audio returned from Gemini TTS")
 
-        return audio_bytes
+        return raw_pcm
 
     except Exception as e:
         logger.error(f"[GenerateGoogleAudioTask] Error generating Google audio: {e}")
         raise
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_random_exponential(multiplier=1, min=2, max=10)
-)
-async def generate_openai_audio_task(full_script: str):
-    """OpenAI 전용 오디오 생성 태스크 (재시도 포함)"""
-    client = ai_factory.get_audio_client()
+async def stream_google_audio_task(script: str) -> AsyncIterator[bytes]:
+    """Gemini TTS는 세그먼트 단위로 한 번에 응답하므로, 합성된 PCM 전체를 하나의 청크로 내보냄"""
+    yield await generate_google_audio_task(script)
 
-    try:
-        async with client.audio.speech.with_streaming_response.create(
-            model=settings.OPENAI_TTS_MODEL,
-            voice=settings.OPENAI_TTS_VOICE,
-            input=full_script,
-            instructions=TTS_INSTRUCTIONS
-        ) as response:
-            audio_bytes = await response.read()
 
-        if not audio_bytes:
-            raise ValueError("Failed to read audio from OpenAI response")
+async def stream_openai_audio_task(script: str) -> AsyncIterator[bytes]:
+    """
+    OpenAI 전용 세그먼트 오디오 스트리밍 태스크. 24kHz 16-bit mono PCM 청크를 받는 즉시 내보냄
+    (응답을 열고 첫 청크를 받기까지만 재시도하며, 청크를 내보낸 뒤의 실패는 중복 재생을 막기 위해 재시도하지 않음)
+    """
+    client = ai_factory.get_audio_client()
 
-        return audio_bytes
+    try:
+        async with AsyncExitStack() as stack:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=wait_random_exponential(multiplier=1, min=2, max=10),
+                # 취소(CancelledError) 등 Exception이 아닌 중단은 재시도하지 않고 그대로 전달
+                retry=retry_if_exception_type(Exception),
+                reraise=True,
+            ):
+                with attempt:
+                    async with AsyncExitStack() as attempt_stack:
+                        await attempt_stack.enter_async_context(
+                            admission_controller.admit("tts", "openai", settings.OPENAI_TTS_MODEL)
+                        )
+                        response = await attempt_stack.enter_async_context(
+                            client.audio.speech.with_streaming_response.create(
+                                model=settings.OPENAI_TTS_MODEL,
+                                voice=settings.OPENAI_TTS_VOICE,
+                                input=script,
+                                instructions=TTS_INSTRUCTIONS,
+                                response_format="pcm"
+                            )
+                        )
+                        chunks = response.iter_bytes(_STREAM_CHUNK_BYTES)
+                        first_chunk = await anext(chunks, None)
+                        if not first_chunk:
+                            raise ValueError("Failed to read audio from OpenAI response")
+                        # 첫 청크를 받은 응답은 스트림이 끝날 때까지 유지
+                        stack.push_async_exit(attempt_stack.pop_all())
+
+            # 청크는 재시도 블록 밖에서 내보냄
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
 
     except Exception as e:
-        logger.error(f"[GenerateOpenaiAudioTask] Error generating OpenAI audio: {e}")
+        logger.error(f"[StreamOpenaiAudioTask] Error generating OpenAI audio: {e}")
         raise
@@ -1,14 +1,13 @@
 import logging
-from io import BytesIO
-from PIL import Image
 from google.genai import types
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from ..providers import ai_factory
 from ..prompts import ImageStyle, create_image_prompt
 from app.core.config import settings
-from app.utils.image import pil_to_base64, base64_to_pil
+from app.utils.image import EncodedImage, ImageLike, base64_to_encoded_image, encode_image_like, image_like_to_data_url
 from app.engine.circuit_breaker import with_circuit_breaker
+from app.engine.admission import admission_controller
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +16,7 @@ logger = logging.getLogger(__name__)
     stop=stop_after_attempt(3),
     wait=wait_random_exponential(multiplier=1, min=2, max=10)
 )
-async def generate_openai_image_task(idx: int, prompt: str, content_type: str, ref_image: Image.Image = None, ref_type: str = "style") -> Image.Image:
+async def generate_openai_image_task(idx: int, prompt: str, content_type: str, ref_image: ImageLike = None, ref_type: str = "style") -> EncodedImage:
     """OpenAI를 사용한 개별 이미지 생성 (참조/재시도 지원)"""
     client = ai_factory.get_image_client()
     style = ImageStyle.get_style(content_type)
@@ -35,25 +34,26 @@ async def generate_openai_image_task(idx: int, prompt: str, content_type: str, r
         content_items = [{"type": "input_text", "text": final_prompt}]
         
         if ref_image:
-            b64_img = pil_to_base64(ref_image, "PNG")
+            # 앞서 생성한 패널은 디코딩/재인코딩 없이 원본 바이트를 그대로 전달
             content_items.append({
                 "type": "input_image",
-                "image_url": f"data:image/png;base64,{b64_img}"
+                "image_url": await image_like_to_data_url(ref_image)
             })
 
-        response = await client.responses.create(
-            model=settings.OPENAI_CHAT_MODEL,
-            input=[{
-                "role": "user",
-                "content": content_items
-            }],
-            tools=[{
-                "type": "image_generation",
-                "action": "auto",
-                "quality": settings.OPENAI_IMAGE_QUALITY,
-                "size": settings.OPENAI_IMAGE_SIZE,
-            }],
-        )
+        async with admission_controller.admit("image", "openai", settings.OPENAI_CHAT_MODEL):
+            response = await client.responses.create(
+                model=settings.OPENAI_CHAT_MODEL,
+                input=[{
+                    "role": "user",
+                    "content": content_items
+                }],
+                tools=[{
+                    "type": "image_generation",
+                    "action": "auto",
+                    "quality": settings.OPENAI_IMAGE_QUALITY,
+                    "size": settings.OPENAI_IMAGE_SIZE,
+                }],
+            )
         
         image_generation_calls = [
             output for output in response.output
@@ -65,7 +65,7 @@ async def generate_openai_image_task(idx: int, prompt: str, content_type: str, r
             
         b64_data = image_generation_calls[0].result
 
-        return base64_to_pil(b64_data)
+        return await base64_to_encoded_image(b64_data)
 
     except Exception as e:
         logger.error(f"[GenerateOpenaiImageTask] Error generating OpenAI image {idx}: {e}")
@@ -85,8 +85,8 @@ async def generate_openai_image_task(idx: int, prompt: str, content_type: str, r
         "override_image_size": settings.GOOGLE_IMAGE_MODEL_FALLBACK_SIZE
     }
 )
-async def generate_google_image_task(idx: int, prompt: str, content_type: str, ref_image: Image.Image = None, ref_type: str = "style",
-                                     override_model_name: str = None, override_image_size: str = None) -> Image.Image:
+async def generate_google_image_task(idx: int, prompt: str, content_type: str, ref_image: ImageLike = None, ref_type: str = "style",
+                                     override_model_name: str = None, override_image_size: str = None) -> EncodedImage:
     """Gemini를 사용한 개별 이미지 생성 (참조/재시도/서킷 브레이커 지원)"""
     client = ai_factory.get_image_client()
     style = ImageStyle.get_style(content_type)
@@ -102,7 +102,9 @@ async def generate_google_image_task(idx: int, prompt: str, content_type: str, r
     contents = [final_prompt]
 
     if ref_image:
-        contents.append(ref_image)
+        # SDK가 이벤트 루프에서 PIL 이미지를 인코딩하지 않도록 바이트로 전달 (생성된 패널은 원본 바이트 그대로)
+        ref_bytes, ref_mime_type = await encode_image_like(ref_image)
+        contents.append(types.Part.from_bytes(data=ref_bytes, mime_type=ref_mime_type))
 
     model_name = override_model_name or settings.GOOGLE_IMAGE_MODEL_PRIMARY
     image_size = override_image_size or settings.GOOGLE_IMAGE_MODEL_PRIMARY_SIZE
@@ -114,14 +116,15 @@ async def generate_google_image_task(idx: int, prompt: str, content_type: str, r
     image_config = types.ImageConfig(**config_params)
 
     try:
-        response = await client.aio.models.generate_content(
-            model=model_name,
-            contents=contents,
-            config=types.GenerateContentConfig(
-                response_modalities=['IMAGE'],
-                image_config=image_config
+        async with admission_controller.admit("image", "google", model_name):
+            response = await client.aio.models.generate_content(
+                model=model_name,
+                contents=contents,
+                config=types.GenerateContentConfig(
+                    response_modalities=['IMAGE'],
+                    image_config=image_config
+                )
             )
-        )
     except Exception as e:
         logger.error(f"[GenerateGoogleImageTask] Error generating image {idx}: {e}")
         raise
@@ -152,7 +155,6 @@ async def generate_google_image_task(idx: int, prompt: str, content_type: str, r
 
     img_part = next((part.inline_data for part in response.parts if part.inline_data), None)
     if img_part:
-        img = Image.open(BytesIO(img_part.data))
-        return img
+        return EncodedImage(img_part.data, img_part.mime_type)
     else:
         raise ValueError(f"No inline_data found in response parts for image {idx}")
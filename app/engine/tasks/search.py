@@ -1,15 +1,19 @@
 import json
-import httpx
 import logging
 import urllib.parse
 from langchain_core.tools import tool
 
 from app.core.config import settings
+from app.core.http import http_clients
+from ..image_verdicts import exclude_rejected_candidates
+from ..tool_cache import cached_tool_result
 
 logger = logging.getLogger(__name__)
 
 
 @tool("get_company_logo")
+@exclude_rejected_candidates("get_company_logo", "logo_url")
+@cached_tool_result("get_company_logo", settings.TOOL_CACHE_COMPANY_LOGO_TTL_SECONDS)
 async def get_company_logo(company_name_in_english: str) -> str:
     """
     기업/브랜드의 로고 이미지 후보 목록을 검색합니다.
@@ -24,38 +28,44 @@ async def get_company_logo(company_name_in_english: str) -> str:
     search_url = f"https://api.logo.dev/search?q={urllib.parse.quote(company_name_in_english)}"
     headers = {"Authorization": f"Bearer {settings.LOGO_DEV_SECRET_KEY}"}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(search_url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    # 각 후보에 로고 URL을 미리 구성하여 반환 (퍼블리셔블 키 사용)
-                    candidates = [
-                        {
-                            "name": item.get("name"),
-                            "domain": item.get("domain"),
-                            "logo_url": (
-                                f"https://img.logo.dev/{item.get('domain')}"
-                                f"?token={settings.LOGO_DEV_PUBLISHABLE_KEY}&size=800&format=png&fallback=404"
-                            )
-                        }
-                        for item in data[:5]
-                        if item.get("domain")
-                    ]
-                    if candidates:
-                        logger.info(f"[GetCompanyLogo] Found {len(candidates)} candidates for: {company_name_in_english}")
-                        return json.dumps(candidates, ensure_ascii=False)
-
-            logger.warning(f"[GetCompanyLogo] No candidates found for: {company_name_in_english}")
-            return "TOOL_FAILED: No brand candidates found. MUST try get_fallback_image instead."
-
-        except Exception as e:
-            logger.error(f"[GetCompanyLogo] API fetch failed: {e}")
-            return f"TOOL_FAILED: Error occurred - {e}. MUST try get_fallback_image instead."
+    client = http_clients.get("logo_dev")
+    try:
+        response = await client.get(search_url, headers=headers)
+        if response.status_code != 200:
+            # 429/5xx/인증 오류가 "결과 없음"으로 캐싱되지 않도록 상태 코드를 그대로 반환
+            logger.warning(f"[GetCompanyLogo] Search API failed for: {company_name_in_english} (status: {response.status_code})")
+            return f"TOOL_FAILED: logo.dev API returned status {response.status_code}. MUST try get_fallback_image instead."
+
+        data = response.json()
+        if isinstance(data, list) and len(data) > 0:
+            # 각 후보에 로고 URL을 미리 구성하여 반환 (퍼블리셔블 키 사용)
+            candidates = [
+                {
+                    "name": item.get("name"),
+                    "domain": item.get("domain"),
+                    "logo_url": (
+                        f"https://img.logo.dev/{item.get('domain')}"
+                        f"?token={settings.LOGO_DEV_PUBLISHABLE_KEY}&size=800&format=png&fallback=404"
+                    )
+                }
+                for item in data[:5]
+                if item.get("domain")
+            ]
+            if candidates:
+                logger.info(f"[GetCompanyLogo] Found {len(candidates)} candidates for: {company_name_in_english}")
+                return json.dumps(candidates, ensure_ascii=False)
+
+        logger.warning(f"[GetCompanyLogo] No candidates found for: {company_name_in_english}")
+        return "TOOL_FAILED: No brand candidates found. MUST try get_fallback_image instead."
+
+    except Exception as e:
+        logger.error(f"[GetCompanyLogo] API fetch failed: {e}")
+        return f"TOOL_FAILED: Error occurred - {e}. MUST try get_fallback_image instead."
 
 
 @tool("get_person_thumbnail")
+@exclude_rejected_candidates("get_person_thumbnail", "thumbnail_url")
+@cached_tool_result("get_person_thumbnail", settings.TOOL_CACHE_PERSON_THUMBNAIL_TTL_SECONDS)
 async def get_person_thumbnail(person_name: str) -> str:
     """
     유명 인물이나 고유 명사의 위키백과 공식 프로필 사진(썸네일) URL을 가져옵니다.
@@ -71,61 +81,55 @@ async def get_person_thumbnail(person_name: str) -> str:
     """
     headers = {"User-Agent": settings.USER_AGENT}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # 1단계: Wikipedia 검색 API로 상위 5개 페이지 제목 및 설명 탐색
-            search_resp = await client.get(
-                "https://ko.wikipedia.org/w/api.php",
-                params={
-                    "action": "query", "list": "search", 
-                    "srsearch": person_name, "srlimit": 5, 
-                    "srprop": "snippet", "format": "json"
-                },
-                headers=headers
-            )
-            if search_resp.status_code != 200:
-                logger.warning(f"[GetPersonThumbnail] Search API failed for: {person_name} (status: {search_resp.status_code})")
-                return "TOOL_FAILED: No Wikipedia page found. MUST try get_fallback_image."
-
-            results = search_resp.json().get("query", {}).get("search", [])
-            if not results:
-                logger.warning(f"[GetPersonThumbnail] No search results for: {person_name}")
-                return "TOOL_FAILED: No Wikipedia page found. MUST try get_fallback_image."
-
-            # 2단계: 각 검색 결과의 summary 조회 → 썸네일 추출
-            candidates = []
-            for res in results:
-                title = res["title"]
-                snippet = res.get("snippet", "")
-                
-                summary_resp = await client.get(
-                    f"https://ko.wikipedia.org/api/rest_v1/page/summary/{urllib.parse.quote(title)}",
-                    headers=headers,
-                    follow_redirects=True
-                )
-                
-                if summary_resp.status_code == 200:
-                    data = summary_resp.json()
-                    if "thumbnail" in data:
-                        candidates.append({
-                            "title": title,
-                            "description": snippet,
-                            "thumbnail_url": data["thumbnail"]["source"]
-                        })
-
-            if not candidates:
-                logger.warning(f"[GetPersonThumbnail] No thumbnails found in any search results for: {person_name}")
-                return "TOOL_FAILED: No Wikipedia thumbnails found for any candidates. MUST try get_fallback_image."
-
-            logger.info(f"[GetPersonThumbnail] Found {len(candidates)} candidates for query: '{person_name}'")
-            return json.dumps(candidates, ensure_ascii=False)
-            
-        except Exception as e:
-            logger.error(f"[GetPersonThumbnail] API fetch failed: {e}")
-            return f"TOOL_FAILED: Error occurred - {e}. MUST try get_fallback_image."
+    client = http_clients.get("wikipedia")
+    try:
+        # 검색(generator=search)과 썸네일/설명/요약 조회(prop)를 한 번의 요청으로 처리
+        resp = await client.get(
+            "https://ko.wikipedia.org/w/api.php",
+            params={
+                "action": "query", "format": "json", "formatversion": 2,
+                "generator": "search", "gsrsearch": person_name, "gsrlimit": 5,
+                "prop": "pageimages|description|extracts",
+                "piprop": "thumbnail", "pithumbsize": 640, "pilimit": 5,
+                "exintro": 1, "explaintext": 1, "exsentences": 2, "exlimit": 5,
+            },
+            headers=headers
+        )
+        if resp.status_code != 200:
+            logger.warning(f"[GetPersonThumbnail] Search API failed for: {person_name} (status: {resp.status_code})")
+            return f"TOOL_FAILED: Wikipedia API returned status {resp.status_code}. MUST try get_fallback_image."
+
+        pages = resp.json().get("query", {}).get("pages", [])
+        if not pages:
+            logger.warning(f"[GetPersonThumbnail] No search results for: {person_name}")
+            return "TOOL_FAILED: No Wikipedia page found. MUST try get_fallback_image."
+
+        # generator 결과는 검색 순위(index) 순서가 보장되지 않으므로 정렬
+        candidates = [
+            {
+                "title": page["title"],
+                "description": page.get("description") or page.get("extract", ""),
+                "thumbnail_url": page["thumbnail"]["source"]
+            }
+            for page in sorted(pages, key=lambda p: p.get("index", 0))
+            if "thumbnail" in page
+        ]
+
+        if not candidates:
+            logger.warning(f"[GetPersonThumbnail] No thumbnails found in any search results for: {person_name}")
+            return "TOOL_FAILED: No Wikipedia thumbnails found for any candidates. MUST try get_fallback_image."
+
+        logger.info(f"[GetPersonThumbnail] Found {len(candidates)} candidates for query: '{person_name}'")
+        return json.dumps(candidates, ensure_ascii=False)
+        
+    except Exception as e:
+        logger.error(f"[GetPersonThumbnail] API fetch failed: {e}")
+        return f"TOOL_FAILED: Error occurred - {e}. MUST try get_fallback_image."
 
 
 @tool("get_fallback_image")
+@exclude_rejected_candidates("get_fallback_image", "image_url")
+@cached_tool_result("get_fallback_image", settings.TOOL_CACHE_FALLBACK_IMAGE_TTL_SECONDS)
 async def get_fallback_image(query: str) -> str:
     """
     다른 툴(get_company_logo, get_person_thumbnail)이 TOOL_FAILED를 반환했을 때 사용하는 최후의 폴백 도구입니다.
@@ -154,32 +158,32 @@ async def get_fallback_image(query: str) -> str:
     headers = {"Authorization": f"KakaoAK {settings.KAKAO_REST_API_KEY}"}
     params = {"query": query, "size": 5}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, params=params)
-            if response.status_code != 200:
-                logger.warning(f"[GetFallbackImage] Failed to fetch. Status: {response.status_code}")
-                return f"TOOL_FAILED: Daum Search API returned status {response.status_code}"
-
-            data = response.json()
-            documents = data.get("documents", [])
-            
-            if not documents:
-                logger.warning(f"[GetFallbackImage] No images found for: {query}")
-                return "TOOL_FAILED: No general images found for the given query."
-
-            candidates = [
-                {
-                    "display_sitename": doc.get("display_sitename", ""),
-                    "image_url": doc.get("image_url", ""),
-                    "doc_url": doc.get("doc_url", "")
-                }
-                for doc in documents
-            ]
-            
-            logger.info(f"[GetFallbackImage] Found {len(candidates)} image candidates for: {query}")
-            return json.dumps(candidates, ensure_ascii=False)
-
-        except Exception as e:
-            logger.error(f"[GetFallbackImage] Fetch failed: {e}")
-            return f"TOOL_FAILED: Error occurred - {e}."
+    client = http_clients.get("kakao")
+    try:
+        response = await client.get(url, headers=headers, params=params)
+        if response.status_code != 200:
+            logger.warning(f"[GetFallbackImage] Failed to fetch. Status: {response.status_code}")
+            return f"TOOL_FAILED: Daum Search API returned status {response.status_code}"
+
+        data = response.json()
+        documents = data.get("documents", [])
+        
+        if not documents:
+            logger.warning(f"[GetFallbackImage] No images found for: {query}")
+            return "TOOL_FAILED: No general images found for the given query."
+
+        candidates = [
+            {
+                "display_sitename": doc.get("display_sitename", ""),
+                "image_url": doc.get("image_url", ""),
+                "doc_url": doc.get("doc_url", "")
+            }
+            for doc in documents
+        ]
+        
+        logger.info(f"[GetFallbackImage] Found {len(candidates)} image candidates for: {query}")
+        return json.dumps(candidates, ensure_ascii=False)
+
+    except Exception as e:
+        logger.error(f"[GetFallbackImage] Fetch failed: {e}")
+        return f"TOOL_FAILED: Error occurred - {e}."
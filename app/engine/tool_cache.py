@@ -0,0 +1,125 @@
+import functools
+import hashlib
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.redis import RedisClient
+
+logger = logging.getLogger(__name__)
+
+_NEGATIVE_RESULT_PREFIX = "TOOL_FAILED"
+# 네트워크 오류/비정상 응답 코드 등 일시적인 실패는 캐싱하지 않음 (다음 호출에서 재시도되도록)
+_TRANSIENT_FAILURE_MARKERS = ("Error occurred", "returned status")
+
+
+def normalize_query(query: str) -> str:
+    """대소문자, 전각/반각, 연속 공백 차이를 없앤 캐시용 검색어"""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def tool_query(args: tuple, kwargs: dict) -> str:
+    """검색어 하나를 받는 도구 호출 인자에서 검색어를 꺼냄 (도구마다 인자 이름이 다르므로 유일한 인자를 사용)"""
+    return args[0] if args else next(iter(kwargs.values()))
+
+
+class ToolResultCache:
+    """
+    이미지 리서치 검색 도구 결과 캐시
+
+    정규화된 검색어 기준으로 Redis에 도구별 TTL로 저장하고, 그 앞에 프로세스 내 LRU를 둡니다.
+    "결과 없음" 형태의 TOOL_FAILED 응답은 짧은 TTL(TOOL_CACHE_NEGATIVE_TTL_SECONDS)로 캐싱하며,
+    일시적인 오류 응답은 캐싱하지 않습니다. Redis 장애 시에는 캐시 없이 동작합니다.
+    """
+
+    def __init__(self):
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    def _key(self, tool_name: str, query: str) -> str:
+        digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+        return f"tool_cache:{tool_name}:{digest}"
+
+    def _get_local(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: str, ttl: int):
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > settings.TOOL_CACHE_LOCAL_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+    async def get(self, tool_name: str, query: str) -> Optional[str]:
+        key = self._key(tool_name, query)
+        value = self._get_local(key)
+        if value is not None:
+            return value
+
+        try:
+            redis_client = await RedisClient.get_instance()
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.ttl(key)
+                value, ttl = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[ToolCache] Redis get failed for {tool_name}: {e}")
+            return None
+
+        if value is not None and ttl > 0:
+            self._set_local(key, value, ttl)
+        return value
+
+    async def set(self, tool_name: str, query: str, result: str, ttl: int):
+        if result.startswith(_NEGATIVE_RESULT_PREFIX):
+            if any(marker in result for marker in _TRANSIENT_FAILURE_MARKERS):
+                return
+            ttl = min(ttl, settings.TOOL_CACHE_NEGATIVE_TTL_SECONDS)
+
+        key = self._key(tool_name, query)
+        self._set_local(key, result, ttl)
+        try:
+            redis_client = await RedisClient.get_instance()
+            await redis_client.set(key, result, ex=ttl)
+        except Exception as e:
+            logger.warning(f"[ToolCache] Redis set failed for {tool_name}: {e}")
+
+
+# 전역 인스턴스 생성
+tool_result_cache = ToolResultCache()
+
+
+def cached_tool_result(tool_name: str, ttl_seconds: int):
+    """
+    검색어 하나를 받아 문자열 결과를 반환하는 도구 함수에 결과 캐시를 적용하는 데코레이터
+    (@tool 아래에 적용하며, functools.wraps로 도구 스키마와 설명이 유지됨)
+    """
+    def decorator(func: Callable[..., Awaitable[str]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> str:
+            if not settings.TOOL_CACHE_ENABLED:
+                return await func(*args, **kwargs)
+
+            query = tool_query(args, kwargs)
+
+            cached = await tool_result_cache.get(tool_name, query)
+            if cached is not None:
+                logger.info(f"[ToolCache] Cache hit for {tool_name}: {query}")
+                return cached
+
+            result = await func(*args, **kwargs)
+            await tool_result_cache.set(tool_name, query, result, ttl_seconds)
+            return result
+
+        return wrapper
+
+    return decorator
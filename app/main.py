@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Security
 
-from app.api import contents, debug, health
+from app.api import contents, debug, editors, health, jobs
 from app.core.config import settings
 from app.core.lifespan import lifespan
 from app.core.logging import setup_logging
@@ -13,4 +13,6 @@ app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 app.middleware("http")(logging_middleware)
 app.include_router(health.router)
 app.include_router(contents.router, dependencies=[Security(verify_api_key)])
+app.include_router(jobs.router, dependencies=[Security(verify_api_key)])
+app.include_router(editors.router, dependencies=[Security(verify_api_key)])
 app.include_router(debug.router, dependencies=[Security(verify_api_key)])
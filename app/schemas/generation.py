@@ -1,9 +1,10 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 class GenerationStatusResponse(BaseModel):
     status: str
     message: str
+    job_id: Optional[str] = None
 
 class AiArticleBatchGenerationRequest(BaseModel):
     issue_ids: List[int]
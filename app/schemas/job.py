@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class JobNodeProgress(BaseModel):
+    name: str
+    status: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+class JobItemStatus(BaseModel):
+    item_id: str
+    status: str
+    current_node: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+    nodes: List[JobNodeProgress]
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    job_type: str
+    status: str
+    created_at: str
+    items: List[JobItemStatus]
@@ -1,8 +1,11 @@
+import asyncio
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
-from app.core.database import SessionLocal
+from app.core.database import get_db_session
 from app.database.models import Issue
+from app.engine.context_builder import build_article_context
 from app.engine.nodes.ai_article import analyze_article
 from app.engine.nodes.image_researcher import image_researcher
 from app.engine.nodes.image_validation import validate_image
@@ -10,9 +13,13 @@ from app.engine.nodes.image_validation import validate_image
 logger = logging.getLogger(__name__)
 
 class DebugService:
-    async def _prepare_and_research_state(self, issue_id: int, db: Session) -> dict:
+    async def _prepare_and_research_state(self, issue_id: int) -> dict:
         """공통 로직: 이슈 조회, 분석, 이미지 리서치를 수행하고 state를 반환합니다."""
-        issue = db.query(Issue).filter(Issue.id == issue_id).first()
+        async with get_db_session() as db:
+            result = await db.execute(
+                select(Issue).options(selectinload(Issue.articles)).where(Issue.id == issue_id)
+            )
+            issue = result.scalars().first()
         if not issue:
             raise ValueError(f"Issue ID {issue_id} not found.")
 
@@ -20,10 +27,8 @@ class DebugService:
         if not raw_articles:
             raise ValueError(f"No articles found for Issue ID {issue_id}")
 
-        merged_content = "\n\n---\n\n".join([
-            f"기사 제목: {a.title}\n본문: {a.content}"
-            for a in raw_articles
-        ])
+        # 중복 기사를 제거하고 토큰 예산 안에서 병합 (tiktoken 토큰화는 GIL을 해제하므로 스레드에서 실행)
+        merged_content = await asyncio.to_thread(build_article_context, raw_articles, issue.title)
 
         state = {
             "raw_article_context": merged_content,
@@ -40,39 +45,31 @@ class DebugService:
         [DEBUG] analyze_article + image_research 두 단계만 실행하여 참조 이미지 URL만 반환.
         DB 상태를 변경하지 않음.
         """
-        db = SessionLocal()
-        try:
-            state = await self._prepare_and_research_state(issue_id, db)
-            return {
-                "issue_id": issue_id,
-                "final_title": state.get("final_title", ""),
-                "summary": state.get("summary", []),
-                "reference_image_url": state.get("reference_image_url"),
-            }
-        finally:
-            db.close()
+        state = await self._prepare_and_research_state(issue_id)
+        return {
+            "issue_id": issue_id,
+            "final_title": state.get("final_title", ""),
+            "summary": state.get("summary", []),
+            "reference_image_url": state.get("reference_image_url"),
+        }
 
     async def run_image_research_and_validate_debug(self, issue_id: int):
         """
         [DEBUG] analyze_article + image_research + image_validator 세 단계만 실행하여 참조 이미지 URL만 반환.
         DB 상태를 변경하지 않음.
         """
-        db = SessionLocal()
-        try:
-            state = await self._prepare_and_research_state(issue_id, db)
+        state = await self._prepare_and_research_state(issue_id)
 
-            # 이미지 검증 실행
-            validation_result = await validate_image(state)
-            state.update(validation_result)
+        # 이미지 검증 실행
+        validation_result = await validate_image(state)
+        state.update(validation_result)
 
-            # ImageValidationResponse가 포함된 상태를 반영하여 리턴합니다.
-            return {
-                "issue_id": issue_id,
-                "final_title": state.get("final_title", ""),
-                "summary": state.get("summary", []),
-                "reference_image_url": state.get("reference_image_url")
-            }
-        finally:
-            db.close()
+        # ImageValidationResponse가 포함된 상태를 반영하여 리턴합니다.
+        return {
+            "issue_id": issue_id,
+            "final_title": state.get("final_title", ""),
+            "summary": state.get("summary", []),
+            "reference_image_url": state.get("reference_image_url")
+        }
 
 debug_service = DebugService()
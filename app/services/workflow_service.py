@@ -1,153 +1,225 @@
 import asyncio
 import uuid
 import logging
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
+from app.engine.context_builder import build_article_context
+from app.engine.checkpointer import ai_article_thread_id, checkpointer_manager
 from app.engine.graph import create_ai_article_graph, create_today_newsnack_graph
+from app.engine.scheduler import RateLimiter
 from app.core.config import settings
-from app.core.database import SessionLocal
-from app.database.models import Issue, Editor, Category, ProcessingStatusEnum
+from app.core.database import get_db_session
+from app.core.job_queue import ai_article_queue
+from app.core.job_tracker import job_tracker
+from app.database.models import Issue, ProcessingStatusEnum
 
 
 logger = logging.getLogger(__name__)
 
+TODAY_NEWSNACK_JOB_ITEM_ID = "today_newsnack"
+
 class WorkflowService:
     def __init__(self):
         self.graph = create_ai_article_graph()
         self.newsnack_graph = create_today_newsnack_graph()
-        self.semaphore = asyncio.Semaphore(settings.AI_ARTICLE_MAX_CONCURRENT_GENERATIONS)
+        # 파이프라인 시작 간격 페이서 (동시 실행 슬롯과 별개로 동작)
+        self.rate_limiter = RateLimiter(settings.AI_ARTICLE_GENERATION_DELAY_SECONDS)
+
+    async def setup(self):
+        """체크포인터를 열고 AI 기사 그래프를 체크포인터와 함께 다시 컴파일함 (AI 기사 그래프를 실행하는 워커 시작 시에만 호출)"""
+        checkpointer = await checkpointer_manager.open()
+        if checkpointer is not None:
+            self.graph = create_ai_article_graph(checkpointer=checkpointer)
+
+    async def shutdown(self):
+        await checkpointer_manager.close()
+        self.graph = create_ai_article_graph()
 
-    def occupy_issues(self, issue_ids: List[int]) -> List[int]:
+    async def _get_pending_nodes(self, config: dict) -> tuple:
+        """
+        이전 실행이 남긴 체크포인트에서 아직 실행되지 않은 노드 목록을 반환함.
+        이미 끝난(삭제되지 못한) 체크포인트는 정리하고 빈 튜플을 반환함.
+        """
+        if self.graph.checkpointer is None:
+            return ()
+        snapshot = await self.graph.aget_state(config)
+        if snapshot.next:
+            return snapshot.next
+        if snapshot.values:
+            await checkpointer_manager.delete_thread(config["configurable"]["thread_id"])
+        return ()
+
+    async def occupy_issues(self, issue_ids: List[int]) -> List[int]:
         """
         주어진 이슈들 중 처리 가능한(PENDING, FAILED) 이슈를 찾아
         상태를 IN_PROGRESS로 변경하고, 변경된 이슈 ID 리스트를 반환함.
         """
-        db: Session = SessionLocal()
+        async with get_db_session() as db:
+            try:
+                # 락을 걸고 조회
+                result = await db.execute(
+                    select(Issue).where(
+                        Issue.id.in_(issue_ids),
+                        Issue.processing_status.in_([
+                            ProcessingStatusEnum.PENDING,
+                            ProcessingStatusEnum.FAILED,
+                        ])
+                    ).with_for_update(skip_locked=True)
+                )
+                issues = result.scalars().all()
+
+                if not issues:
+                    return []
+
+                occupied_ids = []
+                for issue in issues:
+                    issue.processing_status = ProcessingStatusEnum.IN_PROGRESS
+                    occupied_ids.append(issue.id)
+
+                await db.commit()
+                return occupied_ids
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"[AiArticleWorkflow] Error occupying issues: {e}")
+                raise e
+
+    async def mark_issues_failed(self, issue_ids: List[int]):
+        """주어진 이슈들의 상태를 FAILED로 변경함"""
+        async with get_db_session() as db:
+            try:
+                await db.execute(
+                    update(Issue)
+                    .where(Issue.id.in_(issue_ids))
+                    .values(processing_status=ProcessingStatusEnum.FAILED)
+                )
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"[AiArticleWorkflow] Error marking issues as failed: {e}")
+
+    async def enqueue_ai_article_jobs(self, issue_ids: List[int]) -> str:
+        """
+        점유한 이슈들을 이슈 단위 작업으로 Redis 작업 큐에 등록하고 job_id를 반환함.
+        실제 생성은 별도 워커 프로세스(python -m app.worker)가 수행함.
+        """
         try:
-            # 락을 걸고 조회
-            issues = db.query(Issue).filter(
-                Issue.id.in_(issue_ids),
-                Issue.processing_status.in_([
-                    ProcessingStatusEnum.PENDING,
-                    ProcessingStatusEnum.FAILED,
-                ])
-            ).with_for_update(skip_locked=True).all()
-            
-            if not issues:
-                return []
-                
-            occupied_ids = []
-            for issue in issues:
-                issue.processing_status = ProcessingStatusEnum.IN_PROGRESS
-                occupied_ids.append(issue.id)
-            
-            db.commit()
-            return occupied_ids
+            job_id = await job_tracker.create_job("ai_article", issue_ids)
+            payloads = [{"job_id": job_id, "issue_id": issue_id} for issue_id in issue_ids]
+            queue_length = await ai_article_queue.enqueue(payloads)
         except Exception as e:
-            db.rollback()
-            logger.error(f"[AiArticleWorkflow] Error occupying issues: {e}")
-            raise e
-        finally:
-            db.close()
+            # 큐 등록 실패 시 IN_PROGRESS로 남지 않도록 FAILED로 되돌림
+            logger.error(f"[AiArticleWorkflow] Failed to enqueue issues {issue_ids}: {e}")
+            await self.mark_issues_failed(issue_ids)
+            raise
+        logger.info(f"[AiArticleWorkflow] Enqueued {len(payloads)} issue(s) as job {job_id}. Pending jobs: {queue_length}")
+        return job_id
 
-    async def run_batch_ai_articles_pipeline(self, issue_ids: List[int]):
-        """
-        여러 이슈를 배치로 처리하되, 세마포어로 동시 실행 수를 제한함
-        """
-        async def wrapped_pipeline(issue_id: int):
-            # 세마포어 획득
-            async with self.semaphore:
-                await asyncio.sleep(settings.AI_ARTICLE_GENERATION_DELAY_SECONDS)
-
-                logger.info(f"[AiArticleWorkflow] Starting issue {issue_id}")
-                await self.run_ai_article_pipeline(issue_id)
-        
-        # 모든 이슈에 대해 작업 생성 후 동시에 실행
-        tasks = [wrapped_pipeline(iid) for iid in issue_ids]
-        await asyncio.gather(*tasks)
-
-    async def run_ai_article_pipeline(self, issue_id: int):
+    async def create_today_newsnack_job(self) -> str:
+        """오늘의 뉴스낵 생성 작업을 등록하고 job_id를 반환함"""
+        return await job_tracker.create_job("today_newsnack", [TODAY_NEWSNACK_JOB_ITEM_ID])
+
+    async def run_ai_article_pipeline(self, issue_id: int, job_id: Optional[str] = None):
         """
         AI 기사 생성 파이프라인 실행
         """
-        db: Session = SessionLocal()
+        logger.info(f"[AiArticleWorkflow] Starting issue {issue_id}")
+        if job_id:
+            await job_tracker.mark_item_running(job_id, issue_id)
+        thread_id = ai_article_thread_id(issue_id)
+        config = {"configurable": {"thread_id": thread_id, "job_id": job_id, "job_item_id": issue_id}}
         try:
-            # 1. DB에서 이슈 및 관련 기사 조회
-            issue = db.query(Issue).filter(Issue.id == issue_id).first()
-            if not issue:
-                logger.error(f"Issue ID {issue_id} not found.")
-                return
-
-            raw_articles = issue.articles
-            if not raw_articles:
-                raise ValueError(f"No articles found for Issue ID {issue_id}")
-
-            # 2. 본문 통합 (프롬프트 입력용)
-            merged_content = "\n\n---\n\n".join([
-                f"기사 제목: {a.title}\n본문: {a.content}"
-                for a in raw_articles
-            ])
-
-            generated_content_key = str(uuid.uuid4())
-
-            # 3. LangGraph 초기 상태 구성
-            initial_state = {
-                "db_session": db,
-                "issue_id": issue.id,
-                "category_name": issue.category.name if issue.category else "General",
-                "raw_article_context": merged_content,
-                "raw_article_title": issue.title,
-                "content_key": generated_content_key,
-                # 결과값 초기화
-                "editor": None,
-                "summary": [],
-                "content_type": "",
-                "final_title": "",
-                "final_body": "",
-                "image_prompts": [],
-                "image_urls": []
-            }
-
-            logger.info(f"[AiArticleWorkflow] Starting pipeline for Issue {issue_id}")
-
-            # LangGraph 실행
-            await self.graph.ainvoke(initial_state)
-
+            # 이전 시도의 체크포인트가 있으면 완료된 노드는 건너뛰고 실패한 노드부터 재개
+            pending_nodes = await self._get_pending_nodes(config)
+            if pending_nodes:
+                logger.info(f"[AiArticleWorkflow] Resuming Issue {issue_id} from checkpoint (next: {', '.join(pending_nodes)})")
+                graph_input = None
+            else:
+                # 1. DB에서 이슈 및 관련 기사 조회 (조회 후 커넥션은 즉시 반환)
+                async with get_db_session() as db:
+                    result = await db.execute(
+                        select(Issue)
+                        .options(selectinload(Issue.articles), selectinload(Issue.category))
+                        .where(Issue.id == issue_id)
+                    )
+                    issue = result.scalars().first()
+
+                if not issue:
+                    logger.error(f"Issue ID {issue_id} not found.")
+                    if job_id:
+                        await job_tracker.mark_item_failed(job_id, issue_id, "Issue not found")
+                    return
+
+                raw_articles = issue.articles
+                if not raw_articles:
+                    raise ValueError(f"No articles found for Issue ID {issue_id}")
+
+                # 2. 본문 통합 (프롬프트 입력용)
+                # 중복 기사를 제거하고 토큰 예산 안에서 병합 (tiktoken 토큰화는 GIL을 해제하므로 스레드에서 실행)
+                merged_content = await asyncio.to_thread(build_article_context, raw_articles, issue.title)
+
+                generated_content_key = str(uuid.uuid4())
+
+                # 3. LangGraph 초기 상태 구성
+                graph_input = {
+                    "issue_id": issue.id,
+                    "category_name": issue.category.name if issue.category else "General",
+                    "raw_article_context": merged_content,
+                    "raw_article_title": issue.title,
+                    "content_key": generated_content_key,
+                    # 결과값 초기화
+                    "editor": None,
+                    "summary": [],
+                    "content_type": "",
+                    "final_title": "",
+                    "final_body": "",
+                    "image_prompts": [],
+                    "image_urls": []
+                }
+
+                logger.info(f"[AiArticleWorkflow] Starting pipeline for Issue {issue_id}")
+
+            # LangGraph 실행 (재개 시에는 입력 없이 체크포인트 상태로 이어서 실행)
+            await self.graph.ainvoke(graph_input, config=config)
+            await checkpointer_manager.delete_thread(thread_id)
+
+            if job_id:
+                await job_tracker.mark_item_completed(job_id, issue_id)
             logger.info(f"[AiArticleWorkflow] Finished for Issue {issue_id}")
 
         except Exception as e:
             # 실패 시 FAILED로 변경
-            db.rollback()
-            issue = db.query(Issue).filter(Issue.id == issue_id).first()
-            if issue:
-                issue.processing_status = ProcessingStatusEnum.FAILED
-                db.commit()
+            await self.mark_issues_failed([issue_id])
+            if job_id:
+                await job_tracker.mark_item_failed(job_id, issue_id, str(e))
             logger.error(f"[AiArticleWorkflow] Error: {e}", exc_info=True)
             raise
-        finally:
-            db.close()
 
-    async def run_today_newsnack_pipeline(self, issue_ids: List[int]):
+    async def run_today_newsnack_pipeline(self, issue_ids: List[int], job_id: Optional[str] = None):
         """선택된 이슈들로부터 오늘의 뉴스낵 생성 파이프라인 실행"""
-        db = SessionLocal()
+        if job_id:
+            await job_tracker.mark_item_running(job_id, TODAY_NEWSNACK_JOB_ITEM_ID)
         try:
             initial_state = {
-                "db_session": db,
                 "target_issue_ids": issue_ids,
                 "selected_articles": [],
                 "briefing_segments": [],
-                "total_audio_bytes": b"",
+                "briefing_opening": None,
+                "briefing_closing": None,
                 "audio_url": "",
                 "briefing_articles_data": []
             }
             
             logger.info("[TodayNewsnackWorkflow] Starting Today's Newsnack Pipeline")
-            await self.newsnack_graph.ainvoke(initial_state)
+            config = {"configurable": {"job_id": job_id, "job_item_id": TODAY_NEWSNACK_JOB_ITEM_ID}}
+            await self.newsnack_graph.ainvoke(initial_state, config=config)
+            if job_id:
+                await job_tracker.mark_item_completed(job_id, TODAY_NEWSNACK_JOB_ITEM_ID)
             logger.info("[TodayNewsnackWorkflow] Today's Newsnack Pipeline Completed")
             
         except Exception as e:
+            if job_id:
+                await job_tracker.mark_item_failed(job_id, TODAY_NEWSNACK_JOB_ITEM_ID, str(e))
             logger.error(f"[TodayNewsnackWorkflow] Error in Newsnack Pipeline: {e}", exc_info=True)
-        finally:
-            db.close()
 
 workflow_service = WorkflowService()
@@ -1,59 +1,188 @@
-import io
+import asyncio
 import logging
 import os
 import uuid
-from typing import Optional
-from pydub import AudioSegment
+from typing import AsyncIterator, Callable, List, Optional, Tuple
 
 from .s3 import s3_manager
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-def convert_pcm_to_mp3(pcm_data: bytes, frame_rate: int = 24000) -> bytes:
-    audio = AudioSegment(data=pcm_data, sample_width=2, frame_rate=frame_rate, channels=1)
-    return audio.export(format="mp3").read()
+# TTS 프로바이더가 반환하는 PCM 형식 (16-bit little-endian, mono)
+PCM_SAMPLE_RATE = 24000
+PCM_SAMPLE_WIDTH = 2
+PCM_CHANNELS = 1
 
+_MP3_READ_CHUNK_BYTES = 64 * 1024
 
-def get_audio_duration_from_bytes(audio_bytes: bytes, format="mp3") -> float:
-    """바이너리 데이터로부터 오디오의 실제 길이를 초 단위로 측정"""
-    audio = AudioSegment.from_file(io.BytesIO(audio_bytes), format=format)
-    return len(audio) / 1000.0
 
+def pcm_duration_seconds(
+    num_bytes: int,
+    frame_rate: int = PCM_SAMPLE_RATE,
+    sample_width: int = PCM_SAMPLE_WIDTH,
+    channels: int = PCM_CHANNELS,
+) -> float:
+    """PCM 바이트 길이(샘플 수)로 오디오 길이를 초 단위로 계산"""
+    return num_bytes / (frame_rate * sample_width * channels)
 
-def calculate_article_timelines(briefing_segments: list, total_duration: float):
+
+class StreamingMp3Upload:
+    """
+    PCM 청크를 ffmpeg 서브프로세스로 점진 인코딩하면서, 나오는 MP3를 바로 S3 스트리밍 업로드로 흘려보내는 업로더
+
+    전체 PCM이나 MP3를 메모리에 모으지 않으므로 브리핑 길이와 무관하게 메모리 사용량이 일정하고,
+    합성이 끝나는 시점에 업로드도 거의 끝납니다. 사용 후 finish() 또는 실패 시 abort()를 호출해야 합니다.
+    """
+
+    def __init__(self, s3_key: str, frame_rate: int = PCM_SAMPLE_RATE):
+        self.s3_key = s3_key
+        self.frame_rate = frame_rate
+        self.pcm_bytes = 0
+        self._upload = s3_manager.open_stream(s3_key, content_type="audio/mpeg")
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._pump: Optional[asyncio.Task] = None
+        self._stderr: Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._process = await asyncio.create_subprocess_exec(
+            settings.FFMPEG_BINARY, "-hide_banner", "-loglevel", "error",
+            "-f", "s16le", "-ar", str(self.frame_rate), "-ac", str(PCM_CHANNELS), "-i", "pipe:0",
+            "-f", "mp3", "-b:a", settings.AUDIO_MP3_BITRATE, "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        self._pump = asyncio.create_task(self._pump_output())
+        self._stderr = asyncio.create_task(self._process.stderr.read())
+
+    async def _pump_output(self):
+        while chunk := await self._process.stdout.read(_MP3_READ_CHUNK_BYTES):
+            await self._upload.write(chunk)
+
+    async def write(self, pcm: bytes):
+        """PCM 청크를 인코더에 넣습니다. 인코더/업로드가 밀리면 파이프 버퍼만큼만 쌓이고 대기합니다."""
+        if self._pump.done():
+            # 업로드가 먼저 실패한 경우 원인 예외를 그대로 전달
+            self._pump.result()
+            raise RuntimeError("MP3 encoder output closed unexpectedly")
+        self._process.stdin.write(pcm)
+        await self._process.stdin.drain()
+        self.pcm_bytes += len(pcm)
+
+    @property
+    def duration(self) -> float:
+        """지금까지 넣은 PCM 길이(초)"""
+        return pcm_duration_seconds(self.pcm_bytes, self.frame_rate)
+
+    async def finish(self) -> str:
+        """인코딩을 마치고 업로드를 완료한 뒤 S3 URL을 반환합니다."""
+        self._process.stdin.close()
+        await self._process.stdin.wait_closed()
+        await self._pump
+        stderr = await self._stderr
+        returncode = await self._process.wait()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with {returncode}: {stderr.decode(errors='replace').strip()}")
+        return await self._upload.complete()
+
+    async def abort(self):
+        if self._process and self._process.returncode is None:
+            self._process.kill()
+            await self._process.wait()
+        for task in (self._pump, self._stderr):
+            if task:
+                task.cancel()
+        await asyncio.gather(*[t for t in (self._pump, self._stderr) if t], return_exceptions=True)
+        await self._upload.abort()
+
+
+def silence_pcm(seconds: float, frame_rate: int = PCM_SAMPLE_RATE) -> bytes:
+    """지정 길이의 무음 PCM"""
+    return b"\x00" * (int(seconds * frame_rate) * PCM_SAMPLE_WIDTH * PCM_CHANNELS)
+
+
+async def stream_segments_to_s3(
+    segment_streams: List[Callable[[], AsyncIterator[bytes]]],
+    max_concurrency: int,
+    gap_seconds: float,
+) -> Tuple[str, List[Tuple[float, float]]]:
     """
-    각 기사 세그먼트의 글자 수 비중을 계산하여 start_time, end_time 할당
+    세그먼트별 PCM 스트림을 동시에 받아 순서대로 이어 붙이며 MP3로 인코딩해 S3에 업로드합니다.
+
+    현재 인코딩 중인 세그먼트부터 max_concurrency개까지만 합성을 진행하고, 한 세그먼트를 모두 인코딩한 뒤에야
+    다음 세그먼트의 합성을 시작합니다. 앞 세그먼트는 받는 즉시 인코더로 흘려보내고 먼저 끝난 뒤 세그먼트는 차례가
+    올 때까지 보관하므로, 버퍼에 쌓이는 PCM은 브리핑 길이와 무관하게 세그먼트 max_concurrency개 분량으로 제한됩니다.
+    세그먼트 사이에는 gap_seconds만큼 무음을 넣고, 실제 샘플 수 기준의 (시작, 끝) 구간(초)을 함께 반환합니다.
+    """
+    queues: List[asyncio.Queue] = [asyncio.Queue() for _ in segment_streams]
+
+    async def produce(idx: int):
+        try:
+            async for chunk in segment_streams[idx]():
+                queues[idx].put_nowait(chunk)
+            queues[idx].put_nowait(None)
+        except Exception as e:
+            queues[idx].put_nowait(e)
+
+    uploader = StreamingMp3Upload(f"audio/{uuid.uuid4().hex}.mp3")
+    producers: List[asyncio.Task] = []
+
+    def start_next_producer():
+        if len(producers) < len(segment_streams):
+            producers.append(asyncio.create_task(produce(len(producers))))
+
+    for _ in range(max_concurrency):
+        start_next_producer()
+    spans: List[Tuple[float, float]] = []
+    gap = silence_pcm(gap_seconds)
+    frame_bytes = PCM_SAMPLE_WIDTH * PCM_CHANNELS
+
+    try:
+        await uploader.start()
+        for idx, queue in enumerate(queues):
+            if idx > 0:
+                await uploader.write(gap)
+            start = uploader.duration
+            segment_bytes = 0
+            while (chunk := await queue.get()) is not None:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                await uploader.write(chunk)
+                segment_bytes += len(chunk)
+            # 청크 경계와 무관하게 세그먼트 끝은 샘플 경계에 맞춤
+            if segment_bytes % frame_bytes:
+                await uploader.write(b"\x00" * (frame_bytes - segment_bytes % frame_bytes))
+            spans.append((start, uploader.duration))
+            start_next_producer()
+
+        audio_url = await uploader.finish()
+    except BaseException:
+        for task in producers:
+            task.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+        await uploader.abort()
+        raise
+
+    return audio_url, spans
+
+
+def calculate_article_timelines(briefing_segments: list, spans: List[Tuple[float, float]]):
+    """
+    세그먼트별 실제 오디오 구간으로 각 기사의 start_time, end_time 할당
     briefing_segments: [{"article_id": 1, "title": "제목", "thumbnail_url": "url", "script": "대본"}, ...]
+    spans: stream_segments_to_s3가 반환한 세그먼트별 (시작, 끝) 초
     """
-    # 1. 공백을 제외한 순수 글자 수로 비중 계산
-    total_chars = sum(len(segment['script'].replace(" ", "")) for segment in briefing_segments)
-    
-    current_time = 0.0
-    final_briefing_articles = []
-    
-    for segment in briefing_segments:
-        # 2. 글자 수 비중 계산
-        pure_script = segment['script'].replace(" ", "")
-        char_ratio = len(pure_script) / total_chars if total_chars > 0 else 0
-        
-        # 3. 해당 세그먼트의 길이 할당
-        duration = total_duration * char_ratio
-        
-        start_time = round(current_time, 2)
-        end_time = round(current_time + duration, 2)
-        
-        # 4. DB 저장용 스펙으로 변환
-        final_briefing_articles.append({
+    return [
+        {
             "article_id": segment["article_id"],
             "title": segment["title"],
             "thumbnail_url": segment["thumbnail_url"],
-            "start_time": start_time,
-            "end_time": end_time
-        })
-        
-        current_time += duration
-        
-    return final_briefing_articles
+            "start_time": round(start, 2),
+            "end_time": round(end, 2),
+        }
+        for segment, (start, end) in zip(briefing_segments, spans)
+    ]
 
 
 def save_audio_to_local(audio_bytes: bytes) -> str:
@@ -66,10 +195,3 @@ def save_audio_to_local(audio_bytes: bytes) -> str:
     with open(file_path, "wb") as f:
         f.write(audio_bytes)
     return file_path
-
-
-async def upload_audio_to_s3(audio_bytes: bytes) -> Optional[str]:
-    """오디오 S3 업로드"""
-    file_name = f"{uuid.uuid4().hex}.mp3"
-    s3_key = f"audio/{file_name}"
-    return await s3_manager.upload_bytes(s3_key, audio_bytes, content_type="audio/mpeg")
@@ -1,99 +1,277 @@
+import asyncio
 import io
-import os
-import shutil
 import base64
-from PIL import Image
-from typing import Optional
-import httpx
+from PIL import Image, features
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .image_cache import CachedImage, reference_image_cache
 from .s3 import s3_manager
 from app.core.config import settings
+from app.core.http import http_clients
+from app.core.media_executor import media_executor
 
 logger = logging.getLogger(__name__)
 
-def save_image_to_local(content_key: str, idx: int, img: Image.Image) -> str:
-    """이미지 로컬 저장 공통 유틸"""
-    folder_path = os.path.join("output", content_key)
-    os.makedirs(folder_path, exist_ok=True)
-    file_path = os.path.join(folder_path, f"{idx}.png")
-    img.save(file_path)
-    return file_path
+_MAGIC_MIME_TYPES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+)
 
 
-def _image_to_bytes(img: Image.Image, img_format: str = None) -> bytes:
-    """PIL Image를 지정된 포맷의 바이트로 변환합니다. 지정되지 않으면 이미지 원본 포맷이나 JPEG를 사용합니다."""
-    fmt = img_format or img.format or "JPEG"
+def sniff_image_mime_type(data: bytes, default: str = "image/png") -> str:
+    """매직 바이트로 이미지 MIME 타입을 판별합니다. 판별할 수 없으면 default를 반환합니다."""
+    for magic, mime_type in _MAGIC_MIME_TYPES:
+        if data.startswith(magic):
+            return mime_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return default
+
+
+class EncodedImage:
+    """
+    프로바이더가 반환한 인코딩된 이미지 바이트와 지연 디코딩 결과를 함께 들고 다니는 컨테이너
+
+    업로드나 참조 이미지 전달처럼 바이트만 필요한 경로에서는 디코딩/재인코딩 없이 원본 바이트를 그대로 쓰고,
+    픽셀 데이터가 실제로 필요할 때만 decode()로 한 번 디코딩합니다.
+    """
+
+    def __init__(self, data: bytes, mime_type: Optional[str] = None):
+        self.data = data
+        self.mime_type = sniff_image_mime_type(data, default=mime_type or "image/png")
+        self._image: Optional[Image.Image] = None
+
+    @property
+    def format(self) -> str:
+        """PIL 포맷 이름 (PNG, JPEG, WEBP 등)"""
+        return self.mime_type.split("/", 1)[1].upper()
+
+    async def decode(self) -> Image.Image:
+        """바이트를 PIL Image로 디코딩합니다. 결과는 캐시되며 읽기 전용으로 사용해야 합니다."""
+        if self._image is None:
+            self._image = await bytes_to_pil(self.data)
+        return self._image
+
+    async def to_bytes(self, img_format: str) -> bytes:
+        """지정 포맷의 바이트를 반환합니다. 원본과 포맷이 같으면 재인코딩하지 않습니다."""
+        if img_format.upper() == self.format:
+            return self.data
+        return await image_to_bytes(await self.decode(), img_format)
+
+
+ImageLike = Union[Image.Image, EncodedImage]
+
+
+async def encode_image_like(img: ImageLike, default_format: str = "PNG") -> Tuple[bytes, str]:
+    """
+    EncodedImage는 원본 바이트를 그대로, PIL Image는 원본 포맷(없으면 default_format)으로 인코딩해
+    (바이트, MIME 타입)을 반환합니다. 프로바이더에 참조 이미지를 전달할 때 사용합니다.
+    """
+    if isinstance(img, EncodedImage):
+        return img.data, img.mime_type
+    fmt = img.format or default_format
+    return await image_to_bytes(img, fmt), f"image/{fmt.lower()}"
+
+
+def _image_to_bytes(img: Image.Image, img_format: str, **save_kwargs) -> bytes:
     buffer = io.BytesIO()
-    img.save(buffer, format=fmt)
+    img.save(buffer, format=img_format, **save_kwargs)
     return buffer.getvalue()
 
 
-def image_to_base64_url(img: Image.Image) -> str:
+def _image_to_base64(img: Image.Image, img_format: str) -> str:
+    return base64.b64encode(_image_to_bytes(img, img_format)).decode("utf-8")
+
+
+def _bytes_to_base64(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _open_image(data: bytes) -> Tuple[Image.Image, Optional[str]]:
+    # Image.open은 지연 디코딩이므로 실행기 안에서 load()까지 마쳐 이벤트 루프에서 디코딩되지 않도록 함
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    return img, img.format
+
+
+def _decode_rgb_image(data: bytes) -> Tuple[Image.Image, Optional[str]]:
+    img = Image.open(io.BytesIO(data))
+    original_format = img.format
+    return img.convert("RGB"), original_format
+
+
+# 아래 비동기 API는 모든 이미지 변환을 미디어 실행기에서 수행해 이벤트 루프를 막지 않음
+# (프로세스 풀에서는 pickle 과정에서 img.format이 사라지므로 포맷은 호출 측에서 결정/복원함)
+
+async def image_to_bytes(img: Image.Image, img_format: str = None) -> bytes:
+    """PIL Image를 지정된 포맷의 바이트로 변환합니다. 지정되지 않으면 이미지 원본 포맷이나 JPEG를 사용합니다."""
+    return await media_executor.run(_image_to_bytes, img, img_format or img.format or "JPEG")
+
+
+async def image_to_base64_url(img: Image.Image) -> str:
     """PIL Image를 원래 포맷에 맞는 base64 data URL로 변환합니다."""
     fmt = img.format if img.format else "JPEG"
-    img_bytes = _image_to_bytes(img, fmt)
-    b64_str = base64.b64encode(img_bytes).decode("utf-8")
+    b64_str = await media_executor.run(_image_to_base64, img, fmt)
     return f"data:image/{fmt.lower()};base64,{b64_str}"
 
 
-def pil_to_base64(img: Image.Image, img_format: str = "PNG") -> str:
-    """PIL Image를 지정된 포맷의 일반 base64 문자열로 변환합니다. (OpenAI API 등에 사용)"""
-    buffered = io.BytesIO()
-    img.save(buffered, format=img_format)
-    return base64.b64encode(buffered.getvalue()).decode("utf-8")
+async def image_like_to_data_url(img: ImageLike) -> str:
+    """이미지를 base64 data URL로 변환합니다. EncodedImage는 재인코딩 없이 원본 바이트를 사용합니다."""
+    data, mime_type = await encode_image_like(img)
+    b64_str = await media_executor.run(_bytes_to_base64, data)
+    return f"data:{mime_type};base64,{b64_str}"
+
 
+async def bytes_to_pil(data: bytes) -> Image.Image:
+    """인코딩된 이미지 바이트를 PIL Image로 디코딩합니다."""
+    img, fmt = await media_executor.run(_open_image, data)
+    img.format = fmt
+    return img
 
-def base64_to_pil(b64_str: str) -> Image.Image:
-    """base64 문자열을 PIL Image로 변환합니다."""
-    img_data = base64.b64decode(b64_str)
-    return Image.open(io.BytesIO(img_data))
 
+async def base64_to_encoded_image(b64_str: str) -> EncodedImage:
+    """프로바이더가 반환한 base64 문자열을 디코딩 없이 EncodedImage로 감쌉니다. (base64 해제도 실행기에서 수행)"""
+    return EncodedImage(await media_executor.run(base64.b64decode, b64_str))
 
-async def upload_image_to_s3(content_key: str, idx: int, img: Image.Image) -> Optional[str]:
-    """이미지를 S3에 바로 업로드"""
+
+async def upload_image_to_s3(content_key: str, idx: int, img: ImageLike) -> Optional[str]:
+    """이미지를 S3에 바로 업로드 (프로바이더가 PNG로 반환한 이미지는 재인코딩 없이 그대로 업로드)"""
     s3_key = f"images/{content_key}/{idx}.png"
-    png_bytes = _image_to_bytes(img, "PNG")
+    if isinstance(img, EncodedImage):
+        png_bytes = await img.to_bytes("PNG")
+    else:
+        png_bytes = await image_to_bytes(img, "PNG")
     return await s3_manager.upload_bytes(s3_key, png_bytes, content_type="image/png")
 
 
-def cleanup_local_reference_image_directory(content_key: str):
-    """기준 이미지 파일이 위치한 디렉토리 삭제"""
-    directory_path = os.path.join("output", content_key)
-    if os.path.exists(directory_path):
-        shutil.rmtree(directory_path)
+def _render_variants(
+    data: bytes,
+    webp_quality: int,
+    avif_quality: Optional[int],
+    palette_colors: Optional[int],
+    thumbnail_widths: List[int],
+) -> List[Tuple[str, str, str, bytes]]:
+    """원본을 한 번 디코딩해 (종류, 파일 접미사, MIME 타입, 바이트) 형태의 파생 이미지 목록을 만듭니다."""
+    img = Image.open(io.BytesIO(data))
+    img.load()
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+    variants = [("webp", ".webp", "image/webp", _image_to_bytes(img, "WEBP", quality=webp_quality, method=4))]
+    if avif_quality is not None:
+        variants.append(("avif", ".avif", "image/avif", _image_to_bytes(img, "AVIF", quality=avif_quality)))
+    if palette_colors is not None:
+        # 색 수가 적은 카드뉴스 그림은 팔레트 PNG로도 화질 손실이 거의 없음
+        method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        quantized = img.quantize(colors=palette_colors, method=method)
+        variants.append(("png8", "-p8.png", "image/png", _image_to_bytes(quantized, "PNG", optimize=True)))
+
+    for width in sorted(set(thumbnail_widths)):
+        if width >= img.width:
+            continue
+        thumb = img.resize((width, round(img.height * width / img.width)), Image.Resampling.LANCZOS)
+        variants.append((f"thumb:{width}", f"-w{width}.webp", "image/webp",
+                         _image_to_bytes(thumb, "WEBP", quality=webp_quality, method=4)))
+    return variants
+
+
+async def upload_image_variants(content_key: str, idx: int, img: ImageLike, content_type: str) -> Dict:
+    """
+    원본 옆에 웹 전송용 파생 이미지(WebP, 선택적 AVIF, 카드뉴스용 팔레트 PNG, 썸네일)를 업로드합니다.
+    파생 이미지는 부가 산출물이므로 실패한 항목은 건너뛰고, 업로드에 성공한 URL만
+    {"webp": url, "avif": url, "png8": url, "thumbnails": {"320": url, ...}} 형태로 반환합니다.
+    """
+    if not settings.IMAGE_VARIANTS_ENABLED:
+        return {}
+
+    avif_quality = None
+    if settings.IMAGE_AVIF_ENABLED:
+        if features.check("avif"):
+            avif_quality = settings.IMAGE_AVIF_QUALITY
+        else:
+            logger.warning("[ImageVariants] AVIF is enabled but not supported by this Pillow build, skipping.")
+    palette_colors = settings.IMAGE_PALETTE_COLORS if content_type in settings.IMAGE_PALETTE_CONTENT_TYPES else None
+
+    try:
+        data = img.data if isinstance(img, EncodedImage) else await image_to_bytes(img, "PNG")
+        variants = await media_executor.run(
+            _render_variants, data, settings.IMAGE_WEBP_QUALITY, avif_quality, palette_colors,
+            settings.IMAGE_THUMBNAIL_WIDTHS,
+        )
+    except Exception as e:
+        logger.warning(f"[ImageVariants] Failed to render variants for {content_key}/{idx}: {e}")
+        return {}
+
+    urls = await asyncio.gather(*[
+        s3_manager.upload_bytes(f"images/{content_key}/{idx}{suffix}", variant_bytes, content_type=mime_type)
+        for _, suffix, mime_type, variant_bytes in variants
+    ])
+
+    result: Dict = {}
+    for (name, _, _, _), url in zip(variants, urls):
+        if not url:
+            logger.warning(f"[ImageVariants] Failed to upload {name} variant for {content_key}/{idx}")
+            continue
+        if name.startswith("thumb:"):
+            result.setdefault("thumbnails", {})[name.split(":", 1)[1]] = url
+        else:
+            result[name] = url
+    return result
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
-async def _fetch_image(url: str, headers: dict) -> Image.Image:
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.get(url, headers=headers, follow_redirects=True)
-        resp.raise_for_status()
-        img = Image.open(io.BytesIO(resp.content))
-        
-        # PIL이 원본 포맷을 인식하지 못했을 경우 HTTP 헤더에서 추론
-        original_format = img.format
-        if not original_format:
-            content_type = resp.headers.get("content-type", "").lower()
-            if "png" in content_type:
-                original_format = "PNG"
-            elif "webp" in content_type:
-                original_format = "WEBP"
-            else:
-                original_format = "JPEG"
-                
-        img = img.convert("RGB")
-        img.format = original_format
-        return img
-
-
-async def download_image_from_url(url: str) -> Optional[Image.Image]:
-    """주어진 URL에서 이미지를 다운로드하여 PIL Image 반환 (재시도 포함)"""
+async def _fetch_image_bytes(url: str) -> Tuple[bytes, str]:
+    """이미지 원본 바이트와 Content-Type을 내려받습니다."""
+    client = http_clients.get("image_download")
+    resp = await client.get(url, headers={"User-Agent": settings.USER_AGENT}, follow_redirects=True)
+    resp.raise_for_status()
+    return resp.content, resp.headers.get("content-type", "").lower()
+
+
+async def _decode_image(data: bytes, content_type: str) -> Image.Image:
+    img, original_format = await media_executor.run(_decode_rgb_image, data)
+
+    # PIL이 원본 포맷을 인식하지 못했을 경우 HTTP 헤더에서 추론
+    if not original_format:
+        if "png" in content_type:
+            original_format = "PNG"
+        elif "webp" in content_type:
+            original_format = "WEBP"
+        else:
+            original_format = "JPEG"
+
+    img.format = original_format
+    return img
+
+
+async def download_reference_image(url: str) -> Optional[CachedImage]:
+    """
+    참고 이미지를 캐시를 거쳐 다운로드합니다 (재시도 포함).
+    같은 URL은 노드/이슈 간에 원본 바이트와 디코딩된 이미지를 재사용합니다.
+    """
     try:
-        headers = {"User-Agent": settings.USER_AGENT}
-        return await _fetch_image(url, headers)
+        return await reference_image_cache.get_or_load(url, _fetch_image_bytes, _decode_image)
     except Exception as e:
-        logger.error(f"[download_image_from_url] Failed to download {url} after retries: {e}")
+        logger.error(f"[download_reference_image] Failed to download {url} after retries: {e}")
         # 실패 시 상위에서 처리하도록 None 반환
     return None
+
+
+async def download_reference_image_bytes(url: str) -> Optional[EncodedImage]:
+    """
+    참고 이미지를 캐시를 거쳐 디코딩 없이 원본 바이트(EncodedImage)로 가져옵니다 (재시도 포함).
+    프로바이더에 참조 이미지로 그대로 전달할 때 사용합니다.
+    """
+    try:
+        data, mime_type = await reference_image_cache.get_or_load_bytes(url, _fetch_image_bytes)
+    except Exception as e:
+        logger.error(f"[download_reference_image_bytes] Failed to download {url} after retries: {e}")
+        return None
+    if not sniff_image_mime_type(data, default=""):
+        # 매직 바이트로 판별할 수 없는 포맷(AVIF, BMP 등)은 프로바이더가 받지 못할 수 있으므로 PNG로 변환
+        img = await _decode_image(data, mime_type)
+        return EncodedImage(await image_to_bytes(img, "PNG"))
+    return EncodedImage(data)
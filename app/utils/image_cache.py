@@ -0,0 +1,241 @@
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from PIL import Image
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _write_file(path: str, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class CachedImage:
+    """
+    캐시된 참고 이미지 한 건 (원본 바이트 + 디코딩된 이미지)
+
+    image는 여러 노드/이슈가 공유하므로 읽기 전용으로만 사용해야 합니다.
+    메모리 한도를 넘으면 원본 바이트는 임시 디렉터리로 내려가고(path, disk_bytes), 디코딩된 이미지는 버려집니다.
+    """
+
+    __slots__ = ("digest", "mime_type", "data", "path", "disk_bytes", "image")
+
+    def __init__(self, digest: str, mime_type: str, data: bytes):
+        self.digest = digest
+        self.mime_type = mime_type
+        self.data: Optional[bytes] = data
+        self.path: Optional[str] = None
+        self.disk_bytes = 0
+        self.image: Optional[Image.Image] = None
+
+    @property
+    def memory_bytes(self) -> int:
+        size = len(self.data) if self.data is not None else 0
+        if self.image is not None:
+            size += self.image.width * self.image.height * len(self.image.getbands())
+        return size
+
+
+class ReferenceImageCache:
+    """
+    URL과 콘텐츠 해시 기준의 참고 이미지 캐시 (프로세스 전역)
+
+    validate_image에서 내려받은 이미지를 generate_images가 네트워크 I/O와 디코딩 없이 재사용하고,
+    여러 이슈에서 반복되는 URL(기업 로고, 인물 사진 등)도 재사용합니다.
+    - URL → 콘텐츠 해시 매핑은 REFERENCE_IMAGE_CACHE_TTL_SECONDS 동안 유지
+    - 같은 내용의 이미지는 URL이 달라도 하나의 항목(콘텐츠 해시)으로 저장
+    - 메모리 사용량이 한도를 넘으면 오래된 항목부터 임시 디렉터리로 내려보내고,
+      디스크 사용량이 한도를 넘으면 가장 오래된 항목부터 삭제 (파일 I/O는 스레드에서 수행)
+    - 같은 URL을 동시에 요청하면 다운로드는 한 번만 수행
+    """
+
+    def __init__(self):
+        self._urls: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._entries: "OrderedDict[str, CachedImage]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._spill_dir: Optional[str] = None
+        self._limits_lock = asyncio.Lock()
+
+    def _lookup(self, url: str) -> Optional[CachedImage]:
+        mapping = self._urls.get(url)
+        if mapping is None:
+            return None
+        expires_at, digest = mapping
+        entry = self._entries.get(digest)
+        if expires_at <= time.monotonic() or entry is None:
+            del self._urls[url]
+            return None
+        self._urls.move_to_end(url)
+        self._entries.move_to_end(digest)
+        return entry
+
+    def _store(self, url: str, data: bytes, mime_type: str) -> CachedImage:
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self._entries.get(digest)
+        if entry is None:
+            entry = CachedImage(digest, mime_type, data)
+            self._entries[digest] = entry
+        self._entries.move_to_end(digest)
+
+        self._urls[url] = (time.monotonic() + settings.REFERENCE_IMAGE_CACHE_TTL_SECONDS, digest)
+        self._urls.move_to_end(url)
+        while len(self._urls) > settings.REFERENCE_IMAGE_CACHE_MAX_URLS:
+            self._urls.popitem(last=False)
+        return entry
+
+    async def _spill(self, entry: CachedImage):
+        """항목의 원본 바이트를 임시 디렉터리로 내리고 메모리에서 해제합니다."""
+        data = entry.data
+        if data is not None and entry.path is None:
+            if self._spill_dir is None:
+                self._spill_dir = await asyncio.to_thread(tempfile.mkdtemp, prefix="newsnack-ref-images-")
+            path = os.path.join(self._spill_dir, entry.digest)
+            await asyncio.to_thread(_write_file, path, data)
+            entry.path = path
+            entry.disk_bytes = len(data)
+        entry.data = None
+        entry.image = None
+
+    async def _enforce_limits(self, keep: CachedImage):
+        # 파일 I/O를 기다리는 동안 다른 요청이 같은 항목을 중복으로 내리지 않도록 한 번에 하나씩만 수행
+        async with self._limits_lock:
+            memory_bytes = sum(e.memory_bytes for e in self._entries.values())
+            for entry in list(self._entries.values()):
+                if memory_bytes <= settings.REFERENCE_IMAGE_CACHE_MAX_MEMORY_BYTES:
+                    break
+                if entry is keep or entry.memory_bytes == 0:
+                    continue
+                before = entry.memory_bytes
+                try:
+                    await self._spill(entry)
+                except OSError as e:
+                    logger.warning(f"[ReferenceImageCache] Failed to spill {entry.digest} to disk, dropping: {e}")
+                    await self._drop(entry)
+                memory_bytes -= before
+
+            disk_bytes = sum(e.disk_bytes for e in self._entries.values())
+            for entry in list(self._entries.values()):
+                if disk_bytes <= settings.REFERENCE_IMAGE_CACHE_MAX_DISK_BYTES:
+                    break
+                if entry is keep or entry.path is None:
+                    continue
+                disk_bytes -= entry.disk_bytes
+                await self._drop(entry)
+
+    async def _drop(self, entry: CachedImage):
+        self._entries.pop(entry.digest, None)
+        if entry.path:
+            await asyncio.to_thread(_remove_file, entry.path)
+
+    async def _read_bytes(self, entry: CachedImage) -> bytes:
+        if entry.data is not None:
+            return entry.data
+
+        return await asyncio.to_thread(_read_file, entry.path)
+
+    async def _materialize(
+        self, entry: CachedImage, decoder: Callable[[bytes, str], Awaitable[Image.Image]]
+    ) -> CachedImage:
+        if entry.image is None:
+            data = await self._read_bytes(entry)
+            entry.image = await decoder(data, entry.mime_type)
+            await self._enforce_limits(keep=entry)
+        return entry
+
+    async def _load(self, url: str, loader: Callable[[str], Awaitable[Tuple[bytes, str]]]) -> CachedImage:
+        data, mime_type = await loader(url)
+        return self._store(url, data, mime_type)
+
+    def _on_load_done(self, url: str, task: asyncio.Task):
+        self._inflight.pop(url, None)
+        # 기다리는 쪽이 모두 취소된 경우에도 예외가 회수되도록 함
+        if not task.cancelled():
+            task.exception()
+
+    async def _get_entry(self, url: str, loader: Callable[[str], Awaitable[Tuple[bytes, str]]]) -> CachedImage:
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._load(url, loader))
+            self._inflight[url] = task
+            task.add_done_callback(lambda t: self._on_load_done(url, t))
+        # 요청한 쪽이 취소되어도 같은 URL을 기다리는 다른 요청을 위해 다운로드는 계속 진행
+        return await asyncio.shield(task)
+
+    def _lookup_hit(self, url: str) -> Optional[CachedImage]:
+        entry = self._lookup(url)
+        if entry is not None:
+            logger.info(f"[ReferenceImageCache] Cache hit for {url}")
+        return entry
+
+    async def get_or_load(
+        self,
+        url: str,
+        loader: Callable[[str], Awaitable[Tuple[bytes, str]]],
+        decoder: Callable[[bytes, str], Awaitable[Image.Image]],
+    ) -> CachedImage:
+        """
+        캐시된 이미지를 반환하고, 없으면 loader로 (바이트, MIME 타입)을 받아 저장한 뒤 decoder로 디코딩합니다.
+        """
+        entry = self._lookup_hit(url)
+        if entry is not None:
+            try:
+                return await self._materialize(entry, decoder)
+            except OSError as e:
+                # 임시 파일이 정리된 경우 등에는 항목을 버리고 다시 다운로드
+                logger.warning(f"[ReferenceImageCache] Failed to read cached {url}, reloading: {e}")
+                await self._drop(entry)
+
+        return await self._materialize(await self._get_entry(url, loader), decoder)
+
+    async def get_or_load_bytes(
+        self,
+        url: str,
+        loader: Callable[[str], Awaitable[Tuple[bytes, str]]],
+    ) -> Tuple[bytes, str]:
+        """캐시된 이미지의 원본 바이트와 MIME 타입을 디코딩 없이 반환하고, 없으면 loader로 받아 저장합니다."""
+        entry = self._lookup_hit(url)
+        if entry is not None:
+            try:
+                return await self._read_bytes(entry), entry.mime_type
+            except OSError as e:
+                logger.warning(f"[ReferenceImageCache] Failed to read cached {url}, reloading: {e}")
+                await self._drop(entry)
+
+        entry = await self._get_entry(url, loader)
+        data = await self._read_bytes(entry)
+        await self._enforce_limits(keep=entry)
+        return data, entry.mime_type
+
+    def clear(self):
+        """캐시를 비우고 임시 디렉터리를 삭제합니다."""
+        self._urls.clear()
+        self._entries.clear()
+        if self._spill_dir:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+
+# 전역 인스턴스 생성
+reference_image_cache = ReferenceImageCache()
@@ -1,15 +1,28 @@
+import asyncio
 import aioboto3
 import logging
-from typing import Optional
+from contextlib import AsyncExitStack
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 class S3ClientManager:
-    """S3 클라이언트 세션을 관리하는 팩토리 클래스"""
+    """
+    S3 클라이언트를 관리하는 매니저 클래스
+
+    앱 수명 동안 하나의 클라이언트(커넥션 풀)를 유지해, 업로드마다 클라이언트 생성과 TLS 핸드셰이크를
+    반복하지 않도록 합니다. lifespan/워커 시작 시 start(), 종료 시 close()를 호출하며,
+    start() 없이 호출된 경우에도 첫 업로드 시점에 클라이언트를 생성합니다.
+    """
     def __init__(self):
         self._session = None
+        self._client = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._lock = asyncio.Lock()
 
     def _get_session(self):
         if not self._session:
@@ -20,22 +33,96 @@ class S3ClientManager:
             )
         return self._session
 
-    async def upload_bytes(self, s3_key: str, data: bytes, content_type: Optional[str] = None) -> Optional[str]:
+    async def _get_client(self):
+        if self._client:
+            return self._client
+
+        async with self._lock:
+            if not self._client:
+                config = AioConfig(
+                    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                    retries={"max_attempts": 3, "mode": "standard"},
+                )
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    self._get_session().client("s3", config=config)
+                )
+                self._exit_stack = exit_stack
+        return self._client
+
+    async def start(self):
+        """S3 클라이언트를 미리 생성합니다."""
+        await self._get_client()
+        logger.info("S3 client initialized.")
+
+    async def close(self):
+        """S3 클라이언트와 커넥션 풀을 반환합니다."""
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+            logger.info("S3 client closed.")
+        self._exit_stack = None
+        self._client = None
+
+    def _object_url(self, s3_key: str) -> str:
+        return f"https://{settings.AWS_S3_BUCKET}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
+
+    async def _multipart_upload(self, s3_client, s3_key: str, data: bytes, content_type: Optional[str] = None):
+        """큰 페이로드를 여러 파트로 나눠 동시에 업로드합니다. 실패 시 업로드를 중단(abort)합니다."""
         bucket = settings.AWS_S3_BUCKET
-        session = self._get_session()
-        
+        create_kwargs = {"Bucket": bucket, "Key": s3_key}
+        if content_type:
+            create_kwargs["ContentType"] = content_type
+
+        response = await s3_client.create_multipart_upload(**create_kwargs)
+        upload_id = response["UploadId"]
+
+        chunk_size = settings.S3_MULTIPART_CHUNK_SIZE_BYTES
+        semaphore = asyncio.Semaphore(settings.S3_MULTIPART_MAX_CONCURRENCY)
+
+        async def upload_part(part_number: int, offset: int) -> dict:
+            async with semaphore:
+                part = await s3_client.upload_part(
+                    Bucket=bucket,
+                    Key=s3_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data[offset:offset + chunk_size],
+                )
+            return {"PartNumber": part_number, "ETag": part["ETag"]}
+
         try:
-            # 클라이언트를 비동기적으로 생성 및 반환
-            async with session.client("s3") as s3_client:
-                put_kwargs = {"Bucket": bucket, "Key": s3_key, "Body": data}
+            parts = await asyncio.gather(*[
+                upload_part(part_number, offset)
+                for part_number, offset in enumerate(range(0, len(data), chunk_size), start=1)
+            ])
+            await s3_client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                await s3_client.abort_multipart_upload(Bucket=bucket, Key=s3_key, UploadId=upload_id)
+            except Exception as e:
+                logger.warning(f"S3 multipart abort failed: {s3_key} ({e})")
+            raise
+
+    async def upload_bytes(self, s3_key: str, data: bytes, content_type: Optional[str] = None) -> Optional[str]:
+        try:
+            s3_client = await self._get_client()
+
+            # 임계값 이상의 페이로드(브리핑 MP3 등)는 멀티파트로 나눠 동시에 업로드
+            if len(data) >= settings.S3_MULTIPART_THRESHOLD_BYTES:
+                await self._multipart_upload(s3_client, s3_key, data, content_type)
+            else:
+                put_kwargs = {"Bucket": settings.AWS_S3_BUCKET, "Key": s3_key, "Body": data}
                 if content_type:
                     put_kwargs["ContentType"] = content_type
-                
+
                 await s3_client.put_object(**put_kwargs)
-                
-                # URL 생성 로직
-                url = f"https://{bucket}.s3.{settings.AWS_REGION}.amazonaws.com/{s3_key}"
-                return url
+
+            return self._object_url(s3_key)
         except ClientError as e:
             logger.error(f"S3 upload ClientError: {s3_key} ({e})")
             return None
@@ -43,5 +130,125 @@ class S3ClientManager:
             logger.error(f"S3 upload Unexpected Error: {s3_key} ({e})")
             return None
 
+    async def stream_object(self, s3_key: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """객체를 전체를 메모리에 올리지 않고 chunk_size 단위로 읽어 내보냅니다. 실패 시 예외를 그대로 전달합니다."""
+        s3_client = await self._get_client()
+        response = await s3_client.get_object(Bucket=settings.AWS_S3_BUCKET, Key=s3_key)
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    async def delete_expired_objects(self, prefix: str, max_age_seconds: float) -> int:
+        """prefix 아래에서 마지막 수정 후 max_age_seconds가 지난 객체를 삭제하고, 삭제한 개수를 반환합니다."""
+        s3_client = await self._get_client()
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+        deleted = 0
+        paginator = s3_client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=settings.AWS_S3_BUCKET, Prefix=prefix):
+            expired = [{"Key": obj["Key"]} for obj in page.get("Contents", []) if obj["LastModified"] < cutoff]
+            # DeleteObjects는 요청당 최대 1000개 (list_objects_v2 페이지 크기와 같음)
+            if expired:
+                await s3_client.delete_objects(Bucket=settings.AWS_S3_BUCKET, Delete={"Objects": expired, "Quiet": True})
+                deleted += len(expired)
+        return deleted
+
+    def open_stream(self, s3_key: str, content_type: Optional[str] = None) -> "S3StreamingUpload":
+        """크기를 미리 알 수 없는 데이터를 조각 단위로 업로드하는 스트리밍 업로더를 반환합니다."""
+        return S3StreamingUpload(self, s3_key, content_type)
+
+
+class S3StreamingUpload:
+    """
+    스트림으로 생성되는 데이터를 전체를 메모리에 모으지 않고 S3에 업로드하는 업로더
+
+    write()로 받은 데이터가 S3_MULTIPART_CHUNK_SIZE_BYTES만큼 모이면 멀티파트 업로드의 파트로 바로 올리고
+    (동시에 진행 중인 파트 수는 S3_MULTIPART_MAX_CONCURRENCY로 제한), complete()에서 남은 데이터를 마지막
+    파트로 올린 뒤 업로드를 완료합니다. 전체 크기가 파트 하나에 못 미치면 멀티파트 없이 put_object 한 번으로
+    처리합니다. 실패 시 호출 측에서 abort()를 호출해야 합니다.
+    """
+
+    def __init__(self, manager: S3ClientManager, s3_key: str, content_type: Optional[str] = None):
+        self._manager = manager
+        self._s3_key = s3_key
+        self._content_type = content_type
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._part_tasks: List[asyncio.Task] = []
+        self._semaphore = asyncio.Semaphore(settings.S3_MULTIPART_MAX_CONCURRENCY)
+
+    def _content_kwargs(self) -> dict:
+        return {"ContentType": self._content_type} if self._content_type else {}
+
+    async def _send_part(self, s3_client, part_number: int, body: bytes) -> dict:
+        try:
+            part = await s3_client.upload_part(
+                Bucket=settings.AWS_S3_BUCKET,
+                Key=self._s3_key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return {"PartNumber": part_number, "ETag": part["ETag"]}
+        finally:
+            self._semaphore.release()
+
+    async def _upload_part(self, body: bytes):
+        s3_client = await self._manager._get_client()
+        if self._upload_id is None:
+            response = await s3_client.create_multipart_upload(
+                Bucket=settings.AWS_S3_BUCKET, Key=self._s3_key, **self._content_kwargs()
+            )
+            self._upload_id = response["UploadId"]
+
+        # 진행 중인 파트 수가 한도에 도달하면 하나가 끝날 때까지 생산 측(write)을 기다리게 함
+        await self._semaphore.acquire()
+        part_number = len(self._part_tasks) + 1
+        self._part_tasks.append(asyncio.create_task(self._send_part(s3_client, part_number, body)))
+
+    async def write(self, data: bytes):
+        self._buffer += data
+        chunk_size = settings.S3_MULTIPART_CHUNK_SIZE_BYTES
+        while len(self._buffer) >= chunk_size:
+            body = bytes(self._buffer[:chunk_size])
+            del self._buffer[:chunk_size]
+            await self._upload_part(body)
+
+    async def complete(self) -> str:
+        """남은 데이터를 올리고 업로드를 완료한 뒤 객체 URL을 반환합니다."""
+        s3_client = await self._manager._get_client()
+        if self._upload_id is None:
+            await s3_client.put_object(
+                Bucket=settings.AWS_S3_BUCKET, Key=self._s3_key, Body=bytes(self._buffer), **self._content_kwargs()
+            )
+        else:
+            if self._buffer:
+                await self._upload_part(bytes(self._buffer))
+            parts = await asyncio.gather(*self._part_tasks)
+            await s3_client.complete_multipart_upload(
+                Bucket=settings.AWS_S3_BUCKET,
+                Key=self._s3_key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        self._buffer.clear()
+        return self._manager._object_url(self._s3_key)
+
+    async def abort(self):
+        """진행 중인 파트를 취소하고 멀티파트 업로드를 중단합니다."""
+        for task in self._part_tasks:
+            task.cancel()
+        await asyncio.gather(*self._part_tasks, return_exceptions=True)
+        self._buffer.clear()
+        if self._upload_id is None:
+            return
+        try:
+            s3_client = await self._manager._get_client()
+            await s3_client.abort_multipart_upload(
+                Bucket=settings.AWS_S3_BUCKET, Key=self._s3_key, UploadId=self._upload_id
+            )
+        except Exception as e:
+            logger.warning(f"S3 multipart abort failed: {self._s3_key} ({e})")
+
+
 # 전역 인스턴스 생성
 s3_manager = S3ClientManager()
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import logging
+import signal
+from typing import Awaitable, Callable, Optional
+from app.core.config import settings
+from app.core.database import check_db_connection, close_db_connection
+from app.core.http import http_clients
+from app.core.job_queue import RedisJobQueue, ai_article_queue, briefing_precompute_queue, generate_worker_id
+from app.core.logging import request_id_var, setup_logging
+from app.core.media_executor import media_executor
+from app.core.redis import check_redis_connection, close_redis_connection
+from app.engine.briefing_precompute import run_briefing_precompute, run_segment_audio_sweeper
+from app.engine.editor_registry import editor_registry
+from app.engine.scheduler import RateLimiter, WorkerPool
+from app.services.workflow_service import workflow_service
+from app.utils.image_cache import reference_image_cache
+from app.utils.s3 import s3_manager
+
+logger = logging.getLogger("app.worker")
+
+
+class QueueWorker:
+    """
+    Redis 작업 큐에서 작업을 꺼내 워커 풀에서 handler로 처리하는 워커
+
+    꺼낸 작업은 크기가 제한된 워커 풀에 넘기며, 풀이 가득 차면 더 이상 큐에서 꺼내지 않으므로
+    여러 워커 프로세스/호스트를 띄우면 작업이 자연스럽게 분산됩니다. 처리 중 예외가 난 작업도 ack하며
+    (재시도는 handler 쪽 정책을 따름), 종료 시간 내에 끝나지 않은 작업은 ack되지 않은 채 남아 다른 워커가 회수합니다.
+
+    Args:
+        queue: 작업을 꺼낼 Redis 작업 큐
+        handler: 작업 페이로드(dict) 하나를 처리하는 코루틴 함수
+        concurrency: 동시에 처리할 작업 수
+        name: 로그 식별용 이름
+        worker_id: 워커 식별자 (같은 프로세스의 여러 큐 워커가 공유)
+        rate_limiter: 작업 시작 간격을 조절할 페이서 (선택)
+    """
+
+    def __init__(
+        self,
+        queue: RedisJobQueue,
+        handler: Callable[[dict], Awaitable[None]],
+        concurrency: int,
+        name: str,
+        worker_id: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.name = name
+        self.worker_id = worker_id or generate_worker_id()
+        self._stop_event = asyncio.Event()
+        # 대기 슬롯을 1개로 제한해 다른 워커가 가져갈 작업을 선점하지 않도록 함
+        self._pool = WorkerPool(
+            handler=self._handle,
+            concurrency=concurrency,
+            rate_limiter=rate_limiter,
+            max_pending=1,
+            name=f"{name}Pool",
+        )
+
+    def stop(self):
+        if not self._stop_event.is_set():
+            logger.info(f"[{self.name}] Shutdown requested. Waiting for in-flight jobs...")
+            self._stop_event.set()
+
+    async def _heartbeat_loop(self):
+        """생존 신호를 갱신하고, 죽은 워커가 남긴 작업을 주기적으로 회수합니다."""
+        interval = max(1, settings.WORKER_HEARTBEAT_TTL_SECONDS // 3)
+        while not self._stop_event.is_set():
+            try:
+                await self.queue.heartbeat(self.worker_id, settings.WORKER_HEARTBEAT_TTL_SECONDS)
+                await self.queue.recover_orphaned()
+            except Exception as e:
+                logger.error(f"[{self.name}] Heartbeat failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _handle(self, message: str):
+        try:
+            await self.handler(json.loads(message))
+        except asyncio.CancelledError:
+            # ack하지 않은 작업은 processing 리스트에 남아 다른 워커가 회수함
+            raise
+        except Exception as e:
+            logger.error(f"[{self.name}] Job failed: {message} ({e})")
+
+        await self.queue.ack(self.worker_id, message)
+
+    async def run(self):
+        logger.info(
+            f"[{self.name}] Starting worker {self.worker_id} "
+            f"(concurrency={self.concurrency}, queue={self.queue.name})"
+        )
+        await self.queue.heartbeat(self.worker_id, settings.WORKER_HEARTBEAT_TTL_SECONDS)
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        self._pool.start()
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    message = await self.queue.dequeue(self.worker_id, settings.WORKER_POLL_TIMEOUT_SECONDS)
+                except Exception as e:
+                    logger.error(f"[{self.name}] Failed to dequeue job: {e}")
+                    await asyncio.sleep(settings.WORKER_POLL_TIMEOUT_SECONDS)
+                    continue
+
+                if message is None:
+                    continue
+
+                # 풀이 가득 차 있으면 빈 자리가 생길 때까지 대기 (다음 작업을 꺼내지 않음)
+                await self._pool.submit(message)
+
+            await self._pool.close(timeout=settings.WORKER_SHUTDOWN_TIMEOUT_SECONDS)
+        finally:
+            heartbeat_task.cancel()
+            await asyncio.gather(heartbeat_task, return_exceptions=True)
+            # heartbeat를 지워 남은 작업이 즉시 회수 대상이 되도록 함
+            await self.queue.clear_heartbeat(self.worker_id)
+            logger.info(f"[{self.name}] Worker {self.worker_id} stopped.")
+
+
+async def handle_ai_article_job(payload: dict):
+    """이슈 하나의 AI 기사 생성 파이프라인 실행 (실패한 이슈는 FAILED로 기록되며, 재시도는 오케스트레이터가 담당함)"""
+    issue_id = payload["issue_id"]
+    request_id_var.set(f"issue-{issue_id}")
+    await workflow_service.run_ai_article_pipeline(issue_id, job_id=payload.get("job_id"))
+
+
+async def handle_briefing_precompute_job(payload: dict):
+    """기사 한 건의 브리핑 세그먼트 사전 생성 (실패한 기사는 오늘의 뉴스낵 생성 시점에 다시 생성됨)"""
+    article_id = payload["article_id"]
+    request_id_var.set(f"briefing-{article_id}")
+    await run_briefing_precompute(article_id)
+
+
+async def main():
+    await check_db_connection()
+    await check_redis_connection()
+    await s3_manager.start()
+    await http_clients.start()
+    media_executor.start()
+    await editor_registry.start()
+    await workflow_service.setup()
+
+    worker_id = generate_worker_id()
+    workers = [
+        QueueWorker(
+            ai_article_queue,
+            handle_ai_article_job,
+            concurrency=settings.AI_ARTICLE_MAX_CONCURRENT_GENERATIONS,
+            name="AiArticleWorker",
+            worker_id=worker_id,
+            rate_limiter=workflow_service.rate_limiter,
+        )
+    ]
+    if settings.BRIEFING_PRECOMPUTE_ENABLED:
+        workers.append(
+            QueueWorker(
+                briefing_precompute_queue,
+                handle_briefing_precompute_job,
+                concurrency=settings.BRIEFING_PRECOMPUTE_MAX_CONCURRENCY,
+                name="BriefingPrecomputeWorker",
+                worker_id=worker_id,
+            )
+        )
+
+    def stop_all():
+        for w in workers:
+            w.stop()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_all)
+
+    # 브리핑 세그먼트는 사전 생성을 끄더라도 오늘의 뉴스낵 생성 시 만들어지므로 항상 정리
+    sweeper = asyncio.create_task(run_segment_audio_sweeper())
+    try:
+        await asyncio.gather(*[w.run() for w in workers])
+    finally:
+        sweeper.cancel()
+        await asyncio.gather(sweeper, return_exceptions=True)
+        await workflow_service.shutdown()
+        await editor_registry.stop()
+        await s3_manager.close()
+        reference_image_cache.clear()
+        media_executor.shutdown()
+        await http_clients.close()
+        await close_redis_connection()
+        await close_db_connection()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())